@@ -0,0 +1,86 @@
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable
+
+from ui import EventManager, InputManager, Parser, UI, Rect
+from ui.core.elements import Box, Grouped
+from ui.core.elements.atoms.box.boxdata import BoxData
+
+if TYPE_CHECKING:
+    from numpysetup import NumpySurface
+
+ELEMENTS: int = 10000
+
+
+def measure(name: str, f: Callable[[], None], repeat: int=ELEMENTS) -> None:
+    start: float = perf_counter()
+    for _ in range(repeat):
+        f()
+    duration: float = perf_counter() - start
+    print(f'{name:<28} {repeat:>6}x  {duration*1000:>9.2f}ms  ({duration/repeat*1e6:>7.2f}us each)')
+
+
+def checkRenderCache(surfaceType: 'type[NumpySurface]') -> None:
+    """
+    checkRenderCache checks that a subtree with translucent colors renders the same pixels
+    with and without the offscreen subtree cache.
+    """
+    pixels: list[Any] = []
+    for cacheSize in (0, 64):
+        UI.setRenderCacheSize(cacheSize)
+        UI.clearRenderCache()
+        group: Grouped = Grouped.parseFromArgs({'inner': [Box(BoxData.parseFromArgs({'color': 'blue'})),
+                                                          Box(BoxData.parseFromArgs({'color': '#ff000080'}))]})
+        group.align(Rect((10, 10), (50, 40)))
+        group.alignSize(Rect((10, 10), (50, 40)))
+        UI.updateLayout()
+        screen = surfaceType.new((80, 60))
+        for _ in range(2): # the second frame blits the cache (if used)
+            group.render(screen)
+        pixels.append(screen.pixels)
+    UI.setRenderCacheSize(64)
+    if not (pixels[0] == pixels[1]).all():
+        raise AssertionError('cached and uncached rendering of translucent colors differ')
+    print('render cache pixel check          ok')
+
+
+def main():
+    # ------------------------------ event-system ------------------------------
+    measure('EventManager.createEvent', EventManager.createEvent)
+    measure('EventManager.createCallback', lambda: EventManager.createCallback(print))
+
+    # ------------------------------ elements ------------------------------
+    measure('Box construction', lambda: Box(BoxData()))
+
+    # ------------------------------ rendering (headless) ------------------------------
+    try:
+        from numpysetup import NumpyDrawer, NumpyFont, NumpyInputHandler, NumpySurface
+    except ImportError: # numpy is optional
+        print('rendering benchmarks skipped (numpy not installed)')
+        return
+
+    InputManager.init(NumpyInputHandler)
+    UI.init(NumpyDrawer, NumpyFont)
+    checkRenderCache(NumpySurface)
+
+    Parser.loadStyleFromXML('styleexample.xml')
+    Parser.setDefaultStyle('moon')
+    ui: UI = Parser.loadLayoutFromXML('layoutexample.xml')
+    ui.setSize((1280, 720))
+    fpsLabel = ui.bind('fps', 'content', index=1)
+    screen: NumpySurface = NumpySurface.new((1280, 720))
+
+    def frame() -> None:
+        InputManager.update()
+        ui.render(screen)
+
+    def changingFrame() -> None:
+        fpsLabel.set(f'{perf_counter():.2f}')
+        frame()
+
+    measure('UI render (unchanged)', frame, repeat=100)
+    measure('UI render (label changed)', changingFrame, repeat=100)
+
+
+
+if __name__ == '__main__':
+    main()
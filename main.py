@@ -36,6 +36,12 @@ def main():
     ui: UI = Parser.loadLayoutFromXML("layoutexample.xml")  # load layout
     ui.setSize(screen_size)                                 # set layout size
 
+    # compose the per-frame labels from cached glyphs
+    ui.getElementByID('fps').set({'glyphatlas':True},sets=1,skips=[1])
+    ui.getElementByID('balls').set({'glyphatlas':True},sets=1,skips=[1])
+    fpsLabel = ui.bind('fps', 'content', index=1)           # resolve per-frame labels once
+    ballsLabel = ui.bind('balls', 'content', index=1)
+
     # set colors of gravity cycle
     ui.getElementByID("gravityMode").set({'boxcolor':'gray'},sets=1)
     ui.getElementByID("gravityMode").set({'boxcolor':'darkred'},sets=1,skips=[1])
@@ -56,6 +62,12 @@ def main():
     # ------------------------------ runtime-loop ------------------------------
     last_frame_time: float = perf_counter()
 
+    # the screen is cleared once, afterwards only changed regions are redrawn
+    # (the physics world lies between the ui-bars, so both never draw over each other)
+    main_screen.fill("black")
+    pg.display.flip()
+    last_physics_rects: list[pg.Rect] = []
+
     while running:
         # input update
         InputManager.update()
@@ -67,21 +79,23 @@ def main():
 
         # ui update
         fps = round(1/dt, 2)
-        ui.getElementByID('fps').set({'content':f'{fps}'},sets=1,skips=[1])
-        ui.getElementByID('balls').set({'content':f'{len(physicsEngine.getAllObjectPositions())}'},sets=1,skips=[1])
-
-        # rendering
-        main_screen.fill("black")
-
-        # physics rendering
-        pg.draw.circle(main_screen, "red", [int(x) for x in physicsEngine.worldcenter[:2]], int(physicsEngine.worldrad), width=1)
+        fpsLabel.set(f'{fps}')
+        ballsLabel.set(f'{len(physicsEngine.getAllObjectPositions())}')
+
+        # physics rendering (erase the objects of the last frame, then redraw the world)
+        for rect in last_physics_rects:
+            main_screen.fill("black", rect)
+        physics_rects: list[pg.Rect] = [
+            pg.draw.circle(main_screen, "red", [int(x) for x in physicsEngine.worldcenter[:2]], int(physicsEngine.worldrad), width=1)
+        ]
         for pos, rad in physicsEngine.getAllObjectPositions():
-            pg.draw.circle(main_screen, "white", [int(x) for x in pos[:2]], int(rad))
-        
-        # ui rendering
-        ui.render(PygameSurface(main_screen))
+            physics_rects.append(pg.draw.circle(main_screen, "white", [int(x) for x in pos[:2]], int(rad)))
+
+        # ui rendering (only the regions that changed since the last frame)
+        ui_rects = ui.renderDirty(PygameSurface(main_screen), background='black')
 
-        pg.display.flip()
+        pg.display.update(last_physics_rects + physics_rects + [pg.Rect(r.getPosition(), r.getSize()) for r in ui_rects])
+        last_physics_rects = physics_rects[1:]
 
 
     pg.font.quit()
@@ -0,0 +1,302 @@
+"""
+Headless software backend rendering into RGBA numpy arrays.
+
+The backend needs no display (or pygame) and renders deterministically, so it can be used
+for benchmarks and rendering regression tests:
+
+    InputManager.init(NumpyInputHandler)
+    UI.init(NumpyDrawer, NumpyFont)
+    ...
+    screen = NumpySurface.new((1280, 720))
+    ui.render(screen)
+    screen.pixels # (height, width, 4) uint8 array
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from typing import Any, Optional, Sequence, override
+from ui import Surface, Font, SurfaceDrawer, EventManager, InputEvent, InputHandler, Color, tColor, Rect
+from ui.display import LineSegment
+
+class NumpySurface(Surface):
+    pixels: NDArray[np.uint8]   # (height, width, 4) RGBA pixels
+    offset: tuple[int, int]     # screen position of the top-left corner (offscreen surfaces)
+    clip: tuple[int, int, int, int] # local drawing region (left, top, right, bottom)
+
+    def __init__(self, pixels: NDArray[np.uint8], offset: tuple[int, int]=(0, 0)) -> None:
+        if pixels.ndim != 3 or pixels.shape[2] != 4 or pixels.dtype != np.uint8:
+            raise ValueError(f'pixels must be a (height, width, 4) uint8 array, got {pixels.shape} {pixels.dtype}')
+        self.pixels = pixels
+        self.offset = offset
+        self.clip = (0, 0, pixels.shape[1], pixels.shape[0])
+
+    @staticmethod
+    def new(size: tuple[int, int], offset: tuple[int, int]=(0, 0)) -> 'NumpySurface':
+        """
+        new creates a transparent surface of the given size.
+
+        Args:
+            size    (tuple[int, int]): (width, height) of the surface
+            offset  (tuple[int, int]): screen position of the top-left corner
+
+        Returns (NumpySurface): the new surface
+        """
+        return NumpySurface(np.zeros((max(0, int(size[1])), max(0, int(size[0])), 4), dtype=np.uint8), offset)
+
+    def toLocal(self, point: tuple[int, int]) -> tuple[int, int]:
+        return (int(point[0]) - self.offset[0], int(point[1]) - self.offset[1])
+
+    def clipRegion(self, left: int, top: int, right: int, bottom: int) -> Optional[tuple[int, int, int, int]]:
+        """
+        clipRegion clips a local region (right/bottom exclusive) to the drawing region.
+
+        Returns (Optional[tuple[int, int, int, int]]): the clipped region or None if nothing is left
+        """
+        cl, ct, cr, cb = self.clip
+        left, top, right, bottom = max(left, cl), max(top, ct), min(right, cr), min(bottom, cb)
+        if left >= right or top >= bottom:
+            return None
+        return left, top, right, bottom
+
+    def fill(self, color: Color) -> None:
+        l, t, r, b = self.clip
+        self.pixels[t:b, l:r] = tColor.to_rgba(color)
+
+    @override
+    def getSize(self) -> tuple[int, int]:
+        return (self.pixels.shape[1], self.pixels.shape[0])
+
+    @override
+    def blit(self, surface: 'Surface', position: tuple[int, int]) -> None:
+        """
+        Combines the two surfaces (alpha blending the source onto this surface)
+        """
+        if not isinstance(surface, NumpySurface):
+            return
+        x, y = self.toLocal(position)
+        height, width = surface.pixels.shape[:2]
+        region = self.clipRegion(x, y, x + width, y + height)
+        if region is None:
+            return
+        left, top, right, bottom = region
+        src: NDArray[np.uint8] = surface.pixels[top-y:bottom-y, left-x:right-x]
+        dst: NDArray[np.uint8] = self.pixels[top:bottom, left:right]
+
+        # offscreen surfaces are mostly transparent or opaque: only blend the translucent pixels
+        opaque: NDArray[np.bool_] = src[..., 3] == 255
+        if opaque.all():
+            dst[...] = src
+            return
+        np.copyto(dst, src, where=opaque[..., None])
+        translucent: NDArray[np.bool_] = (src[..., 3] != 0) & ~opaque
+        if not translucent.any():
+            return
+        s: NDArray[np.uint16] = src[translucent].astype(np.uint16)
+        d: NDArray[np.uint16] = dst[translucent].astype(np.uint16)
+        alpha: NDArray[np.uint16] = s[:, 3:4]
+        inverse: NDArray[np.uint16] = 255 - alpha
+        d[:, :3] = (s[:, :3] * alpha + d[:, :3] * inverse + 127) // 255
+        d[:, 3:4] = alpha + (d[:, 3:4] * inverse + 127) // 255
+        dst[translucent] = d
+
+    @override
+    def setClip(self, rect: Optional[Rect]) -> bool:
+        height, width = self.pixels.shape[:2]
+        if rect is None:
+            self.clip = (0, 0, width, height)
+        else:
+            left, top = self.toLocal(rect.getPosition())
+            self.clip = (max(0, left), max(0, top), min(width, left + int(rect.width)), min(height, top + int(rect.height)))
+        return True
+
+class NumpyFont(Font):
+    """
+    Simple bitmap font: every character is a deterministic 5x7 dot pattern (derived from its
+    code, spaces are empty) scaled to the font size. The texts are not readable, but the
+    rendered sizes and pixel counts behave like a monospaced font.
+    """
+    __glyphs: dict[tuple[int, str], NDArray[np.bool_]] = {} # (fontsize, char) -> scaled mask
+
+    fontsize: int
+    advance: int
+    height: int
+
+    def __init__(self, fontsize: int) -> None:
+        if not isinstance(fontsize, int):
+            raise TypeError(f'fontsize must be int, got {type(fontsize)}')
+        if fontsize < 0:
+            raise ValueError(f'fontsize must not be negative, got {fontsize}')
+        self.fontsize = fontsize
+        # fontsize 0 is requested when searching fitting sizes (as with pygame), it renders nothing
+        self.advance = max(1, round(0.6 * fontsize)) if fontsize else 0
+        self.height = max(1, round(1.2 * fontsize)) if fontsize else 0
+
+    def glyph(self, char: str) -> NDArray[np.bool_]:
+        """
+        glyph returns the (cached) mask of a character.
+
+        Returns (NDArray[np.bool_]): (height, advance) mask of the set pixels
+        """
+        key: tuple[int, str] = (self.fontsize, char)
+        mask: Optional[NDArray[np.bool_]] = NumpyFont.__glyphs.get(key)
+        if mask is None:
+            bits: int = 0 if char.isspace() else (ord(char) * 2654435761) & 0x7FFFFFFFF
+            pattern: NDArray[np.bool_] = np.array([(bits >> i) & 1 for i in range(35)], dtype=np.bool_).reshape(7, 5)
+            rows: NDArray[np.intp] = np.arange(self.height) * 9 // self.height - 1       # 1 row spacing above and below
+            cols: NDArray[np.intp] = np.arange(self.advance) * 6 // self.advance         # 1 column spacing right
+            valid: NDArray[np.bool_] = ((rows >= 0) & (rows < 7))[:, None] & (cols < 5)[None, :]
+            mask = pattern[np.clip(rows, 0, 6)][:, np.clip(cols, 0, 4)] & valid
+            NumpyFont.__glyphs[key] = mask
+        return mask
+
+    @override
+    def render(self, text: str, color: Color) -> Surface:
+        surface: NumpySurface = NumpySurface.new(self.measure(text))
+        if len(text) and self.fontsize:
+            mask: NDArray[np.bool_] = np.concatenate([self.glyph(char) for char in text], axis=1)
+            surface.pixels[mask] = tColor.to_rgba(color)
+        return surface
+
+    @override
+    def measure(self, text: str) -> tuple[int, int]:
+        return (len(text) * self.advance, self.height)
+
+    @override
+    @staticmethod
+    def SysFont(name: str, fontsize: int) -> 'Font':
+        return NumpyFont(fontsize)
+
+class NumpyDrawer(SurfaceDrawer):
+    @override
+    @staticmethod
+    def drawline(surface: Surface, startpoint: tuple[int, int], endpoint: tuple[int, int], color: Color, thickness: int=1) -> None:
+        if not isinstance(surface, NumpySurface) or thickness < 1:
+            return
+        rgba: tuple[int, int, int, int] = tColor.to_rgba(color)
+        (x0, y0), (x1, y1) = surface.toLocal(startpoint), surface.toLocal(endpoint)
+        low: int = -((thickness - 1) // 2)
+        high: int = low + thickness # thick lines grow perpendicular to the major axis
+
+        if y0 == y1 or x0 == x1:
+            if y0 == y1:
+                region = surface.clipRegion(min(x0, x1), y0 + low, max(x0, x1) + 1, y0 + high)
+            else:
+                region = surface.clipRegion(x0 + low, min(y0, y1), x0 + high, max(y0, y1) + 1)
+            if region is not None:
+                left, top, right, bottom = region
+                surface.pixels[top:bottom, left:right] = rgba
+            return
+
+        steps: int = max(abs(x1 - x0), abs(y1 - y0)) + 1
+        xs: NDArray[np.intp] = np.rint(np.linspace(x0, x1, steps)).astype(np.intp)
+        ys: NDArray[np.intp] = np.rint(np.linspace(y0, y1, steps)).astype(np.intp)
+        spread: NDArray[np.intp] = np.arange(low, high)
+        if abs(x1 - x0) >= abs(y1 - y0):
+            ys = (ys[:, None] + spread[None, :]).ravel()
+            xs = np.repeat(xs, thickness)
+        else:
+            xs = (xs[:, None] + spread[None, :]).ravel()
+            ys = np.repeat(ys, thickness)
+        left, top, right, bottom = surface.clip
+        inside: NDArray[np.bool_] = (xs >= left) & (xs < right) & (ys >= top) & (ys < bottom)
+        surface.pixels[ys[inside], xs[inside]] = rgba
+
+    @override
+    @staticmethod
+    def drawrect(surface: Surface, rect: Rect, color: Color, fill: bool = True) -> None:
+        if not isinstance(surface, NumpySurface):
+            return
+        left, top = surface.toLocal((rect.left, rect.top))
+        right, bottom = surface.toLocal((rect.right, rect.bottom))
+        if fill:
+            region = surface.clipRegion(left, top, right, bottom)
+            if region is not None:
+                l, t, r, b = region
+                surface.pixels[t:b, l:r] = tColor.to_rgba(color)
+        else:
+            NumpyDrawer.drawline(surface, (rect.left, rect.top), (rect.right, rect.top), color)
+            NumpyDrawer.drawline(surface, (rect.left, rect.top), (rect.left, rect.bottom), color)
+            NumpyDrawer.drawline(surface, (rect.right, rect.top), (rect.right, rect.bottom), color)
+            NumpyDrawer.drawline(surface, (rect.left, rect.bottom), (rect.right, rect.bottom), color)
+
+    @staticmethod
+    def resolveColors(colors: Sequence[Color]) -> list[tuple[int, int, int, int]]:
+        """
+        Converts the colors of a batch (every distinct color only once)
+        """
+        resolved: dict[Any, tuple[int, int, int, int]] = {}
+        out: list[tuple[int, int, int, int]] = []
+        for color in colors:
+            key: Any = color.value if isinstance(color, tColor) else color
+            if key not in resolved:
+                resolved[key] = tColor.to_rgba(key)
+            out.append(resolved[key])
+        return out
+
+    @override
+    @classmethod
+    def drawrects(cls, surface: Surface, rects: Sequence[Rect], colors: Sequence[Color]) -> None:
+        if not isinstance(surface, NumpySurface):
+            return
+        pixels: NDArray[np.uint8] = surface.pixels
+        dx, dy = surface.offset
+        cl, ct, cr, cb = surface.clip
+        for rect, rgba in zip(rects, NumpyDrawer.resolveColors(colors)):
+            left, top = max(int(rect.left) - dx, cl), max(int(rect.top) - dy, ct)
+            right, bottom = min(int(rect.right) - dx, cr), min(int(rect.bottom) - dy, cb)
+            if left < right and top < bottom:
+                pixels[top:bottom, left:right] = rgba
+
+    @override
+    @classmethod
+    def drawlines(cls, surface: Surface, lines: Sequence[LineSegment], colors: Sequence[Color]) -> None:
+        for (startpoint, endpoint, thickness), rgba in zip(lines, NumpyDrawer.resolveColors(colors)):
+            NumpyDrawer.drawline(surface, startpoint, endpoint, rgba, thickness)
+
+    @override
+    @staticmethod
+    def createSurface(region: Rect) -> Optional[Surface]:
+        return NumpySurface.new(region.getSize(), region.getPosition())
+
+    @override
+    @staticmethod
+    def createPixelSurface(region: Rect, pixels: Any) -> Optional[Surface]:
+        return NumpySurface(pixels, region.getPosition())
+
+class NumpyInputHandler(InputHandler):
+    """
+    Scripted input: the queued events are triggered (in order) on the next update.
+    """
+    queue: list[InputEvent] = []
+    mousePosition: tuple[int, int] = (0, 0)
+
+    @staticmethod
+    def push(*events: InputEvent) -> None:
+        NumpyInputHandler.queue.extend(events)
+
+    @staticmethod
+    def setMousePosition(position: tuple[int, int]) -> None:
+        NumpyInputHandler.mousePosition = position
+
+    @staticmethod
+    def click(position: tuple[int, int]) -> None:
+        """
+        click moves the mouse and queues a full left click.
+        """
+        NumpyInputHandler.setMousePosition(position)
+        NumpyInputHandler.push(InputEvent.MOUSEBUTTONDOWN, InputEvent.LEFTDOWN, InputEvent.MOUSEBUTTONUP, InputEvent.LEFTUP)
+
+    @staticmethod
+    @override
+    def update() -> None:
+        events, NumpyInputHandler.queue = NumpyInputHandler.queue, []
+        for event in events:
+            EventManager.triggerEvent(NumpyInputHandler.inputEvents[event])
+
+        EventManager.triggerEvent(NumpyInputHandler.inputEvents[InputEvent.UPDATE])
+
+    @staticmethod
+    @override
+    def getMousePosition() -> tuple[int, int]:
+        return NumpyInputHandler.mousePosition
@@ -1,13 +1,19 @@
 import pygame as pg
 
-from typing import override
+from typing import Any, Optional, Sequence, override
 from ui import Surface, Font, SurfaceDrawer, EventManager, InputEvent, InputHandler, Color, tColor, Rect
+from ui.display import LineSegment
 
 
 class PygameSurface(Surface):
     surface: pg.Surface
-    def __init__(self, surface: pg.Surface) -> None:
+    offset: tuple[int, int] # screen position of the top-left corner (offscreen surfaces)
+    def __init__(self, surface: pg.Surface, offset: tuple[int, int]=(0, 0)) -> None:
         self.surface = surface
+        self.offset = offset
+
+    def toLocal(self, point: tuple[int, int]) -> tuple[int, int]:
+        return (point[0] - self.offset[0], point[1] - self.offset[1])
 
     @override
     def getSize(self) -> tuple[int, int]:
@@ -19,7 +25,12 @@ class PygameSurface(Surface):
         Combines the two surfaces
         """
         if isinstance(surface, PygameSurface):
-            self.surface.blit(surface.surface, position)
+            self.surface.blit(surface.surface, self.toLocal(position))
+
+    @override
+    def setClip(self, rect: Optional[Rect]) -> bool:
+        self.surface.set_clip(None if rect is None else pg.Rect(self.toLocal(rect.getPosition()), rect.getSize()))
+        return True
 
 class PygameFont(Font):
     font: pg.font.Font
@@ -33,6 +44,10 @@ class PygameFont(Font):
             color = color.value
         return PygameSurface(self.font.render(text, True, pg.Color(color)))
 
+    @override
+    def measure(self, text: str) -> tuple[int, int]:
+        return self.font.size(text)
+
     @override
     @staticmethod
     def SysFont(name: str, fontsize: int) -> 'Font':
@@ -45,7 +60,7 @@ class PygameDrawer(SurfaceDrawer):
         if isinstance(color, tColor):
             color = color.value
         if isinstance(surface, PygameSurface):
-            pg.draw.line(surface.surface, color, startpoint, endpoint, width=thickness)
+            pg.draw.line(surface.surface, color, surface.toLocal(startpoint), surface.toLocal(endpoint), width=thickness)
 
 
     @override
@@ -54,13 +69,58 @@ class PygameDrawer(SurfaceDrawer):
         if isinstance(color, tColor):
             color = color.value
         if isinstance(surface, PygameSurface):
+            left, top = surface.toLocal((rect.left, rect.top))
+            right, bottom = surface.toLocal((rect.right, rect.bottom))
             if fill:
-                pg.draw.rect(surface.surface, color, pg.Rect((rect.left, rect.top), (rect.width, rect.height)))
+                pg.draw.rect(surface.surface, color, pg.Rect((left, top), (rect.width, rect.height)))
             else:
-                pg.draw.line(surface.surface, color, (rect.left, rect.top), (rect.right, rect.top))
-                pg.draw.line(surface.surface, color, (rect.left, rect.top), (rect.left, rect.bottom))
-                pg.draw.line(surface.surface, color, (rect.right, rect.top), (rect.right, rect.bottom))
-                pg.draw.line(surface.surface, color, (rect.left, rect.bottom), (rect.right, rect.bottom))
+                pg.draw.line(surface.surface, color, (left, top), (right, top))
+                pg.draw.line(surface.surface, color, (left, top), (left, bottom))
+                pg.draw.line(surface.surface, color, (right, top), (right, bottom))
+                pg.draw.line(surface.surface, color, (left, bottom), (right, bottom))
+
+    @staticmethod
+    def resolveColors(colors: Sequence[Color]) -> list[Any]:
+        """
+        Converts the colors of a batch (every distinct color only once)
+        """
+        resolved: dict[Any, Any] = {}
+        out: list[Any] = []
+        for color in colors:
+            key: Any = color.value if isinstance(color, tColor) else color
+            if key not in resolved:
+                resolved[key] = pg.Color(key)
+            out.append(resolved[key])
+        return out
+
+    @override
+    @classmethod
+    def drawrects(cls, surface: Surface, rects: Sequence[Rect], colors: Sequence[Color]) -> None:
+        if isinstance(surface, PygameSurface):
+            fill = surface.surface.fill
+            dx, dy = surface.offset
+            for rect, color in zip(rects, PygameDrawer.resolveColors(colors)):
+                fill(color, (rect.left - dx, rect.top - dy, rect.width, rect.height))
+
+    @override
+    @classmethod
+    def drawlines(cls, surface: Surface, lines: Sequence[LineSegment], colors: Sequence[Color]) -> None:
+        if isinstance(surface, PygameSurface):
+            line = pg.draw.line
+            target: pg.Surface = surface.surface
+            dx, dy = surface.offset
+            for ((x0, y0), (x1, y1), thickness), color in zip(lines, PygameDrawer.resolveColors(colors)):
+                line(target, color, (x0 - dx, y0 - dy), (x1 - dx, y1 - dy), width=thickness)
+
+    @override
+    @staticmethod
+    def createSurface(region: Rect) -> Optional[Surface]:
+        return PygameSurface(pg.Surface(region.getSize(), pg.SRCALPHA), region.getPosition())
+
+    @override
+    @staticmethod
+    def createPixelSurface(region: Rect, pixels: Any) -> Optional[Surface]:
+        return PygameSurface(pg.image.frombuffer(pixels.tobytes(), region.getSize(), 'RGBA'), region.getPosition())
 
 class PygameInputHandler(InputHandler):
     currentDown: set[InputEvent] = set()
@@ -79,6 +139,10 @@ class PygameInputHandler(InputHandler):
                         EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.ARR_LEFT])
                     if pg.key.get_pressed()[pg.K_RIGHT]:
                         EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.ARR_RIGHT])
+                    if pg.key.get_pressed()[pg.K_UP]:
+                        EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.ARR_UP])
+                    if pg.key.get_pressed()[pg.K_DOWN]:
+                        EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.ARR_DOWN])
                     for c in range(ord('a'), ord('z')+1):
                         if pg.key.get_pressed()[pg.key.key_code(chr(c))]:
                             EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.fromStr(chr(c))])
@@ -98,6 +162,11 @@ class PygameInputHandler(InputHandler):
                     if InputEvent.LEFTHELD in PygameInputHandler.currentDown and not pg.mouse.get_pressed()[0]:
                         EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.LEFTUP])
                         PygameInputHandler.currentDown.remove(InputEvent.LEFTHELD)
+                case pg.MOUSEWHEEL:
+                    if event.y > 0:
+                        EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.WHEELUP])
+                    elif event.y < 0:
+                        EventManager.triggerEvent(PygameInputHandler.inputEvents[InputEvent.WHEELDOWN])
 
         #for event in PygameInputHandler.currentDown:
         #    EventManager.triggerEvent(PygameInputHandler.inputEvents[event])
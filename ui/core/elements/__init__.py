@@ -1,8 +1,8 @@
 from .element import Element
 
-from .atoms import Line, Box, Text
+from .atoms import Line, Box, Text, Binding
 
 from .composites import Framed, Grouped, Dropdown
 from .composites import Button, Toggle, Slider
 from .composites import Dropdownselect, Multiselect
-from .composites import Section, UI
+from .composites import Section, Listview, UI
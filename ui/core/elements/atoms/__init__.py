@@ -1,4 +1,5 @@
 from .atom  import Atom
+from .binding import Binding
 
 from .line  import Line
 from .box   import Box
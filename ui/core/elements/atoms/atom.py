@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Any, Generic, override, TypeVar
+from sys import maxsize
+from typing import Any, Generic, Iterable, Optional, override, TypeVar
 
+from ....utility       import Color, Rect, tColor
+from ....interaction   import EventManager
+from ....display       import LineSegment, Surface
 from ..element         import Element
 from .atomcore         import AtomCore
 from .atomdata         import AtomData
@@ -8,6 +12,8 @@ from .atomdata         import AtomData
 Core         = TypeVar('Core'        , bound=AtomCore)
 RenderData   = TypeVar('RenderData'  , bound=AtomData)
 
+DrawBatch = tuple[bool, list[Rect] | list[LineSegment], list[Color]] # (rects?, geometry, colors)
+
 class Atom(Generic[Core, RenderData], Element[Core, RenderData], ABC):
     """Abstract base class for atomic UI elements.
 
@@ -48,6 +54,13 @@ class Atom(Generic[Core, RenderData], Element[Core, RenderData], ABC):
             raise TypeError(f'renderData must be AtomData, got {type(renderData)}')
 
         super().__init__(core, renderData, active)
+        self._renderVersion = 0
+        self.__renderBounds = None
+        self.__translucent = None
+        self.__drawBatches = None
+
+        # only rebuild the render data if a layout update moved or resized this atom
+        EventManager.quickSubscribe(self._core.getBody().getChangeEvent(), self.updateRenderData)
 
     @abstractmethod
     def copy(self) -> 'Atom':
@@ -55,13 +68,53 @@ class Atom(Generic[Core, RenderData], Element[Core, RenderData], ABC):
 
     # -------------------- access-point --------------------
 
+    __appliedUpdates: int = 0   # sets which changed the atom and updated the render data
+    __elidedUpdates: int = 0    # sets which matched (not skipped) without changing the atom
+
+    __matching: Optional[list['Atom']] = None # atoms matching the args while collecting (see collectMatching)
+
+    @staticmethod
+    def collectMatching(element: Element, args: dict[str, Any]) -> list['Atom']:
+        """
+        collectMatching collects all atoms of an element tree the args would be applied to,
+        in the order set() visits them (the n-th atom is the one set() applies to with skips=[n]).
+        Nothing is applied.
+
+        Args:
+            element (Element)       : the root of the element tree
+            args    (dict[str, Any]): the args to match
+
+        Returns (list[Atom]): the matching atoms
+        """
+        Atom.__matching = []
+        try:
+            element.set(args, -1, -1, [maxsize]) # skipping everything, so no element applies the args
+            return Atom.__matching
+        finally:
+            Atom.__matching = None
+
+    @staticmethod
+    def getUpdateStats() -> dict[str, int]:
+        """
+        getUpdateStats returns how many matching sets updated the render data of an atom (applied)
+        and how many were skipped because no value changed (elided).
+
+        Returns (dict[str, int]): the applied and elided render data updates
+        """
+        return {'applied': Atom.__appliedUpdates, 'elided': Atom.__elidedUpdates}
+
     @override
     def _set(self, args: dict[str, Any], sets: int = -1, maxDepth: int = -1, skips: bool=False) -> bool:
-        s: bool = super()._set(args, sets, maxDepth, skips)
-        s |= self._core.set(args, skips)
-        s |= self._renderData.set(args, skips)
-        if s:
-            self.updateRenderData()
+        aligned: bool = super()._set(args, sets, maxDepth, skips)
+        coreSet: bool = self._core.set(args, skips)
+        dataSet: bool = self._renderData.set(args, skips)
+        s: bool = aligned or coreSet or dataSet
+        if s and not skips: # skipped matches neither apply nor elide anything
+            if aligned or self._core.wasChanged() or self._renderData.wasChanged():
+                Atom.__appliedUpdates += 1
+                self.updateRenderData()
+            else:
+                Atom.__elidedUpdates += 1
         return s
 
     @override
@@ -98,6 +151,10 @@ class Atom(Generic[Core, RenderData], Element[Core, RenderData], ABC):
             raise TypeError(f'maxDepth must be an integer, got {type(maxDepth)}')
         if not isinstance(skips, list) or not all(isinstance(x, int) for x in skips):
             raise TypeError('skips must be a list of integers')
+        if Atom.__matching is not None:
+            if self._set(args, sets, maxDepth, True):
+                Atom.__matching.append(self)
+            return 0
         s: bool = self._set(args, sets, maxDepth, bool(skips[0]))
         if s and skips[0]:
             skips[0] -= 1
@@ -111,6 +168,95 @@ class Atom(Generic[Core, RenderData], Element[Core, RenderData], ABC):
         super().forceUpdate()
         self.updateRenderData()
 
+    # -------------------- dirty-tracking --------------------
+
+    _renderVersion: int  # incremented whenever the render data changes
+    __renderBounds: Optional[tuple[tuple[Any, ...], Rect]]
+    __translucent: Optional[bool] # if a drawn color is not opaque (None if outdated)
+
+    def _invalidate(self) -> None:
+        """
+        _invalidate marks the drawn content of the atom as changed.
+        Has to be called whenever the render data is updated.
+        """
+        self._renderVersion += 1
+        self.__translucent = None
+        self.__drawBatches = None
+        self._invalidateRender()
+
+    def _calcRenderBounds(self) -> Rect:
+        """
+        _calcRenderBounds calculates the region the atom draws onto.
+        Overridden by atoms drawing outside of their rect.
+
+        Returns (Rect): the region the atom draws onto
+        """
+        return self.getRect().inflate(1, 1) # outlines are drawn onto the right and bottom edge
+
+    def _getDrawnColors(self) -> Iterable[Color]:
+        """
+        _getDrawnColors returns the colors the atom currently draws with.
+        Overridden by every atom drawing colors.
+
+        Returns (Iterable[Color]): the drawn colors
+        """
+        return ()
+
+    @override
+    def _drawsTranslucent(self) -> bool:
+        if self.__translucent is None:
+            self.__translucent = any(tColor.to_rgba(color)[3] != 255 for color in self._getDrawnColors())
+        return self.__translucent
+
+    @override
+    def _getRenderState(self) -> tuple[Rect, Any]:
+        state: tuple[Any, ...] = (self.getPosition(), self.getSize(), self._renderVersion)
+        if self.__renderBounds is None or self.__renderBounds[0] != state:
+            self.__renderBounds = (state, self._calcRenderBounds())
+        return self.__renderBounds[1], state
+
+    # -------------------- batched drawing --------------------
+
+    __drawBatches: Optional[list[DrawBatch]]
+
+    @staticmethod
+    def __packDrawCalls(renderCache: list[tuple[Rect | LineSegment, Color]]) -> list[DrawBatch]:
+        """
+        __packDrawCalls packs a render cache into batches of consecutive rects / lines
+        (keeping the drawing order).
+
+        Args:
+            renderCache (list[tuple[Rect | LineSegment, Color]]): the rects and lines to draw
+
+        Returns (list[DrawBatch]): the batches to draw
+        """
+        batches: list[DrawBatch] = []
+        for ob, color in renderCache:
+            isRect: bool = isinstance(ob, Rect)
+            if not batches or batches[-1][0] != isRect:
+                batches.append((isRect, [], []))
+            batches[-1][1].append(ob) # type: ignore
+            batches[-1][2].append(color)
+        return batches
+
+    def _drawBatched(self, surface: Surface, renderCache: list[tuple[Rect | LineSegment, Color]]) -> None:
+        """
+        _drawBatched draws a render cache with one drawrects / drawlines call per batch.
+        The batches are packed once per render data update (see _invalidate).
+
+        Args:
+            surface     (Surface)                               : the surface to draw onto
+            renderCache (list[tuple[Rect | LineSegment, Color]]): the rects and lines to draw
+        """
+        assert self._drawer is not None
+        if self.__drawBatches is None:
+            self.__drawBatches = Atom.__packDrawCalls(renderCache)
+        for isRect, geometry, colors in self.__drawBatches:
+            if isRect:
+                self._drawer.drawrects(surface, geometry, colors) # type: ignore
+            else:
+                self._drawer.drawlines(surface, geometry, colors) # type: ignore
+
     @abstractmethod
     def updateRenderData(self) -> None:
         """Update render data from current state.
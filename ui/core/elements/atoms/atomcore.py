@@ -57,6 +57,17 @@ class AtomCore(ElementCore, ABC):
 
     # -------------------- access-point --------------------
 
+    _changed: bool = False # if the last call of set changed any property
+
+    def wasChanged(self) -> bool:
+        """
+        wasChanged returns if the last call of set changed any property
+        (writing the value a property already has does not count as a change).
+
+        Returns (bool): if a property value changed
+        """
+        return self._changed
+
     @abstractmethod
     def set(self, args: dict[str, Any], skips: bool) -> bool:
         pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from dataclasses import fields
+from typing import Any, ClassVar
 
 from ..elementdata import ElementData
 
@@ -27,15 +28,48 @@ class AtomData(ElementData, ABC):
     - Validation is thread-safe
     """
 
+    _changed: bool = False # if the last call of set changed any property
+    __fieldNames: ClassVar[dict[type, tuple[str, ...]]] = {} # dataclass field names of every subclass
+
+    def wasChanged(self) -> bool:
+        """Check if the last call of set changed any property.
+
+        set() reports if any argument matched (used for counting sets); writing
+        the value a property already has does not count as a change.
+
+        Returns:
+            bool: True if a property value changed
+        """
+        return self._changed
+
+    def _snapshot(self) -> tuple[Any, ...]:
+        """Capture the current property values to detect changes.
+
+        Containers are copied one level deep, as set() replaces their items.
+
+        Returns:
+            tuple[Any, ...]: the values of all dataclass fields
+        """
+        names: tuple[str, ...] | None = AtomData.__fieldNames.get(type(self))
+        if names is None:
+            names = tuple(f.name for f in fields(self)) # type: ignore[arg-type]
+            AtomData.__fieldNames[type(self)] = names
+        values: list[Any] = []
+        for name in names:
+            value: Any = getattr(self, name)
+            values.append(value.copy() if isinstance(value, (dict, list, set)) else value)
+        return tuple(values)
+
     @abstractmethod
     def copy(self) -> 'AtomData':
-        """Create a deep copy of render data.
+        """Create a copy of render data.
 
         Returns:
             New AtomData instance with copied properties
 
         Note:
-            Implementations must ensure deep copy of all properties
+            Implementations must not share mutable state with the copy
+            (containers are copied, their items are replaced by set())
         """
         pass
 
@@ -0,0 +1,84 @@
+from typing import Any
+
+from ..element import Element
+from .atom     import Atom
+
+class Binding:
+    """A handle to a single property of an atom, resolved once from an element tree.
+
+    Applying a value through Element.set() walks the whole element tree (matching every
+    key on every level and counting skips) to find the atom to update. A Binding resolves
+    that atom once and applies later values directly to it, so per-frame updates (e.g.
+    telemetry labels) only cost the update of the atom itself. Unchanged values are
+    elided like in set().
+
+    Usage:
+        fps: Binding = ui.bind('fps', 'content', index=1)
+        fps.set('60.0')
+    """
+
+    __atom: Atom
+    __key: str
+
+    def __init__(self, atom: Atom, key: str) -> None:
+        if not isinstance(atom, Atom):
+            raise TypeError(f'atom must be an Atom, got {type(atom)}')
+        if not isinstance(key, str):
+            raise TypeError(f'key must be a str, got {type(key)}')
+        self.__atom = atom
+        self.__key = key
+
+    @staticmethod
+    def resolve(element: Element, key: str, index: int=0) -> 'Binding':
+        """
+        resolve binds the property of the atom set() would apply the key to with skips=[index].
+
+        Args:
+            element (Element)   : the root of the element tree to search
+            key     (str)       : the property to bind (any key accepted by set())
+            index   (int)       : the amount of matching atoms to skip
+
+        Returns (Binding): the handle to the property
+
+        Raises:
+            ValueError: If no atom matches the key at the given index
+        """
+        if not isinstance(index, int):
+            raise TypeError(f'index must be int, got {type(index)}')
+        matching: list[Atom] = Atom.collectMatching(element, {key: None})
+        if not 0 <= index < len(matching):
+            raise ValueError(f'no atom matches {key=} at {index=} (found {len(matching)})')
+        return Binding(matching[index], key)
+
+    # -------------------- getter --------------------
+
+    def getAtom(self) -> Atom:
+        """
+        getAtom returns the bound atom.
+
+        Returns (Atom): the bound atom
+        """
+        return self.__atom
+
+    def getKey(self) -> str:
+        """
+        getKey returns the bound property.
+
+        Returns (str): the bound key
+        """
+        return self.__key
+
+    # -------------------- access-point --------------------
+
+    def set(self, value: Any) -> bool:
+        """
+        set applies the value to the bound property.
+
+        Args:
+            value (Any): the new value of the property
+
+        Returns (bool): if the value changed the atom
+        """
+        atom: Atom = self.__atom
+        atom._set({self.__key: value})
+        return atom.getCore().wasChanged() or atom._renderData.wasChanged()
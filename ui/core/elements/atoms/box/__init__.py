@@ -1 +1,2 @@
 from .box             import Box
+from .boxrasterizer   import BoxRasterizer
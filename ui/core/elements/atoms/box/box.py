@@ -1,15 +1,12 @@
-from typing import Any, Optional, override
+from typing import Any, Callable, Iterable, Optional, override
 
-from .....utility import Rect, Color
+from .....utility import Rect, Color, tColor
 from .....display import Surface
-from .....interaction import EventManager
 
-from ...body           import Body
 from ..atom            import Atom
 from .boxcore          import BoxCore
 from .boxdata          import BoxData, AltMode, Filters
-
-filtertype = Filters | tuple[Filters, tuple[float, float, tuple[float, float]], bool]
+from .boxrasterizer    import BoxRasterizer, Partition, filtertype
 
 class Box(Atom[BoxCore, BoxData]):
     """
@@ -36,7 +33,7 @@ class Box(Atom[BoxCore, BoxData]):
         super().__init__(BoxCore(), renderData, active)
 
         self.__renderCache = []
-        EventManager.quickSubscribe(Body.getLayoutUpdateEvent(), self.updateRenderData)
+        self.__raster = None
 
     @override
     def copy(self) -> 'Box':
@@ -45,16 +42,27 @@ class Box(Atom[BoxCore, BoxData]):
         Returns:
             Box: A new Box instance with copied render data and active state.
         """
-        return Box(renderData=self._renderData.copy(), active=self.isActive())
+        return self._finishCopy(Box(renderData=self._renderData.copy()))
 
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Box':
-        return Box(renderData=BoxData.parseFromArgs(args))
+        return Box.fromArgs(args | Box.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        return {'renderData': BoxData.parseFromArgs(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Box':
+        return Box(renderData=args['renderData'])
 
     # -------------------- rendering --------------------
 
     __renderCache: list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]]
+    __raster: Optional[tuple[tuple[int, int], Surface]] # rasterized patterns (position, pixel surface), see BoxRasterizer
 
     def _validateRect(self, rect: Rect) -> Rect:
         """Validate and normalize a rectangle for rendering.
@@ -90,7 +98,9 @@ class Box(Atom[BoxCore, BoxData]):
         - Pattern generation
         - Filter application
         """
+        self._invalidate()
         self.__renderCache = []
+        self.__raster = None
 
         #calculate render borderbox
         rect: Rect = self._validateRect(self.getRect())
@@ -195,6 +205,10 @@ class Box(Atom[BoxCore, BoxData]):
                         return (point[0] - xx)**2 + (point[1] - yy)**2 <= dd**2
             return False
 
+        #rasterize fine-grained patterns into one pixel buffer
+        if BoxRasterizer.isEnabled() and self.__rasterize(rect, applyPartial):
+            return
+
         #apply partitioning
         partitionSizeX, partitionSizeY, partitionLabels = self._renderData.partitioning
         partitionSize: tuple[float, float] = (rect.width / partitionSizeX, rect.height / partitionSizeY)
@@ -356,7 +370,138 @@ class Box(Atom[BoxCore, BoxData]):
                         if partitionColor is not None and isInsideFilter(partitionRect, partitionFilter, tile.getPoint(USE_POINT_TO_CHECK_FILTER)):
                             self.__renderCache.append((tile, partitionColor))
 
+        #merge adjacent tiles of the same color
+        self.__renderCache = Box.__mergeTiles(self.__renderCache)
+
+    # -------------------- tile-merging --------------------
+
+    __emittedTiles: int = 0 # tiles created by the pattern loops
+    __mergedRects: int = 0  # rects left after merging (draw calls)
+
+    @staticmethod
+    def getMergeStats() -> dict[str, int]:
+        """
+        getMergeStats returns how many tiles the pattern loops created and how many rects
+        are left after merging adjacent tiles of the same color (the reduction in draw calls).
+
+        Returns (dict[str, int]): the created tiles and the rects left after merging
+        """
+        return {'tiles': Box.__emittedTiles, 'rects': Box.__mergedRects}
+
+    @staticmethod
+    def resetMergeStats() -> None:
+        Box.__emittedTiles = 0
+        Box.__mergedRects = 0
+
+    @staticmethod
+    def __mergeTiles(renderCache: list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]]) -> list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]]:
+        """
+        __mergeTiles coalesces contiguous tiles of the same color into maximal rects:
+        first the tiles of a row are merged into runs, then runs of consecutive rows
+        covering the same columns are merged. Tiles never overlap, so the drawn pixels
+        do not change (tiles separated by a rounding gap are not merged).
 
+        Args:
+            renderCache (list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]]): the tiles in drawing order
+
+        Returns (list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]]): the merged tiles
+        """
+        def colorKey(color: Color) -> Any:
+            return color.value if isinstance(color, tColor) else color
+
+        # merge horizontally adjacent tiles of a row
+        runs: list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]] = []
+        for ob, color in renderCache:
+            if runs and isinstance(ob, Rect) and ob.width > 0 and ob.height > 0:
+                last, lastColor = runs[-1]
+                if isinstance(last, Rect) and last.right == ob.left and last.top == ob.top and last.height == ob.height \
+                   and last.width > 0 and colorKey(lastColor) == colorKey(color):
+                    runs[-1] = (Rect((last.left, last.top), (last.width + ob.width, last.height)), lastColor)
+                    continue
+            runs.append((ob, color))
+
+        # merge vertically adjacent runs covering the same columns
+        merged: list[tuple[Rect | tuple[tuple[int, int], tuple[int, int], int], Color]] = []
+        openRuns: dict[tuple[int, int, int, Any], int] = {} # (left, width, bottom, color) -> index in merged
+        for ob, color in runs:
+            if not isinstance(ob, Rect):
+                openRuns.clear() # keep the drawing order around lines
+            elif ob.width > 0 and ob.height > 0:
+                key: tuple[int, int, int, Any] = (ob.left, ob.width, ob.top, colorKey(color))
+                index: Optional[int] = openRuns.pop(key, None)
+                if index is not None:
+                    above: Rect = merged[index][0] # type: ignore
+                    merged[index] = (Rect((above.left, above.top), (above.width, above.height + ob.height)), merged[index][1])
+                    openRuns[(ob.left, ob.width, ob.bottom, key[3])] = index
+                    continue
+                openRuns[(ob.left, ob.width, ob.bottom, key[3])] = len(merged)
+            merged.append((ob, color))
+
+        Box.__emittedTiles += len(renderCache)
+        Box.__mergedRects += len(merged)
+        return merged
+
+    def __rasterize(self, rect: Rect, applyPartial: Callable[[Rect, Any], Rect]) -> bool:
+        """
+        __rasterize tries to bake the patterns of all partitions into one pixel surface
+        (see BoxRasterizer).
+
+        Args:
+            rect            (Rect)                          : the render borderbox (global inset applied)
+            applyPartial    (Callable[[Rect, Any], Rect])   : applies a partial inset to a rect
+
+        Returns (bool): if the box got rasterized
+        """
+        if self._drawer is None:
+            return False
+        partitions: list[Partition] = []
+        partitionSizeX, partitionSizeY, partitionLabels = self._renderData.partitioning
+        partitionSize: tuple[float, float] = (rect.width / partitionSizeX, rect.height / partitionSizeY)
+        iPartitionSize: tuple[int, int] = (int(rect.width / partitionSizeX), int(rect.height / partitionSizeY))
+        for ypartitionindex in range(partitionSizeY):
+            for xpartitionindex in range(partitionSizeX):
+                label: str = partitionLabels[partitionSizeX * ypartitionindex + xpartitionindex]
+
+                partitionRect: Rect = Rect((int(rect.left + xpartitionindex * partitionSize[0]), int(rect.top + ypartitionindex * partitionSize[1])), iPartitionSize)
+                partitionpartialInset: tuple[float, float] | float | tuple[int, int] | int = self._renderData.partialInset[label] if label != '' and label in self._renderData.partialInset else 0.0
+                partitionRect = applyPartial(partitionRect, partitionpartialInset)
+
+                order: list[str] = self._renderData.orders[label] if label in self._renderData.orders else []
+                if len(order) == 0:
+                    order = ['asiujdbfnoiasdjf']
+                altmode: AltMode = self._renderData.altMode[label] if label in self._renderData.altMode else self._renderData.altMode['']
+                altsize: float | int = self._renderData.altLen[label] if label in self._renderData.altLen else self._renderData.altLen['']
+                partitionColor: Optional[Color] = self._renderData.colors[label] if label in self._renderData.colors else self._renderData.colors['']
+                partitionFilter: filtertype = self._renderData.filters[label] if label in self._renderData.filters else self._renderData.filters['']
+
+                if isinstance(altsize, float):
+                    altsize = altsize * min(partitionRect.width, partitionRect.height)
+                if altmode == AltMode.DEFAULT:
+                    partitions.append((partitionRect, altmode, altsize, [partitionColor], [partitionFilter]))
+                else:
+                    partitions.append((partitionRect, altmode, altsize,
+                                       [self._renderData.colors[o] if o in self._renderData.colors else partitionColor for o in order],
+                                       [self._renderData.filters[o] if o in self._renderData.filters else partitionFilter for o in order]))
+
+        baked = BoxRasterizer.rasterize(partitions)
+        if baked is None:
+            return False
+        region, pixels = baked
+        surface: Optional[Surface] = self._drawer.createPixelSurface(region, pixels)
+        if surface is None:
+            return False
+        self.__raster = (region.getPosition(), surface)
+        return True
+
+    @override
+    def _calcRenderBounds(self) -> Rect:
+        thickness: int = max((ob[2] for ob, _ in self.__renderCache if isinstance(ob, tuple)), default=0)
+        margin: int = thickness // 2 + 1
+        return self.getRect().inflate(margin, margin)
+
+    @override
+    def _getDrawnColors(self) -> Iterable[Color]:
+        return (color for _, color in self.__renderCache)
 
     @override
     def render(self, surface: Surface) -> None:
@@ -374,9 +519,8 @@ class Box(Atom[BoxCore, BoxData]):
         """
         assert self._drawer is not None
         
-        if self._active:
-            for ob, color in self.__renderCache:
-                if isinstance(ob, Rect):
-                    self._drawer.drawrect(surface, ob, color)
-                elif isinstance(ob, tuple):
-                    self._drawer.drawline(surface, ob[0], ob[1], color, thickness=ob[2])
+        if self._active and self._trackDraw(self):
+            if self.__raster is not None:
+                surface.blit(self.__raster[1], self.__raster[0])
+            else:
+                self._drawBatched(surface, self.__renderCache)
@@ -1,5 +1,4 @@
 from dataclasses import dataclass, field
-from copy import deepcopy
 from enum import Enum
 from typing import Any, Optional, override
 
@@ -47,10 +46,11 @@ class BoxData(AtomData):
 
     @override
     def copy(self) -> 'BoxData':
-        return BoxData(deepcopy(self.colors), deepcopy(self.partialInset),
-                       deepcopy(self.partitioning), deepcopy(self.altMode),
-                       deepcopy(self.orders), deepcopy(self.altLen),
-                       deepcopy(self.filters))
+        # set() replaces the items of the containers, so the (immutable) items are shared
+        return BoxData(dict(self.colors), dict(self.partialInset),
+                       (self.partitioning[0], self.partitioning[1], list(self.partitioning[2])), dict(self.altMode),
+                       {label: list(order) for label, order in self.orders.items()}, dict(self.altLen),
+                       dict(self.filters))
 
     @staticmethod
     @override
@@ -118,6 +118,7 @@ class BoxData(AtomData):
             raise TypeError(f'skips must be a bool, got {type(skips)}')
 
         s: bool = False
+        before: tuple[Any, ...] = () if skips else self._snapshot()
         for arg, v in args.items():
             if arg not in ['boxpart', 'partitioning', 'part']:
                 if not isinstance(v, str):
@@ -192,6 +193,7 @@ class BoxData(AtomData):
                         if not skips:
                             self.partitioning = BoxData.parsePartition(v)
 
+        self._changed = s and not skips and self._snapshot() != before
         return s
 
     @staticmethod
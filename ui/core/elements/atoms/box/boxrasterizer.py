@@ -0,0 +1,244 @@
+from typing import Any, Optional
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional
+    np = None  # type: ignore[assignment]
+
+from .....utility import Color, Rect, tColor
+from .boxdata     import AltMode, Filters
+
+filtertype = Filters | tuple[Filters, tuple[float, float, tuple[float, float]], bool]
+Partition = tuple[Rect, AltMode, float | int, list[Optional[Color]], list[filtertype]] # (rect, altmode, altsize, color & filter of every order index)
+
+class BoxRasterizer:
+    """Optional NumPy rasterizer baking the fill patterns and filters of a Box into one pixel buffer.
+
+    Instead of creating one rect command per pattern tile (thousands for fine-grained
+    patterns on large boxes), the tile grid of every partition is computed as arrays:
+    the order index of every tile (checkerboard / striped), the filter masks (evaluated
+    at the tile centers) and the resulting palette index are expanded to a pixel map,
+    which is written into an RGBA buffer covering the box. The Box blits the buffer once.
+
+    The result is pixel identical to drawing the tiles. The rasterizer is only used if
+    numpy is installed, it is enabled, the drawer supports pixel surfaces
+    (SurfaceDrawer.createPixelSurface), all colors are opaque and the amount of tiles
+    reaches the threshold.
+
+    Usage:
+        BoxRasterizer.setEnabled(True)    # enable rasterization of box patterns
+        BoxRasterizer.setThreshold(256)   # minimum amount of tiles to rasterize
+    """
+
+    __enabled: bool = False
+    __threshold: int = 256
+
+    # -------------------- configuration --------------------
+
+    @staticmethod
+    def isAvailable() -> bool:
+        """
+        isAvailable returns if numpy is installed and the rasterizer can be used.
+
+        Returns (bool): numpy is available
+        """
+        return np is not None
+
+    @staticmethod
+    def isEnabled() -> bool:
+        return BoxRasterizer.__enabled
+
+    @staticmethod
+    def setEnabled(enabled: bool) -> None:
+        """
+        setEnabled enables or disables the rasterization of box patterns.
+
+        Args:
+            enabled (bool): if the rasterizer should be used
+
+        Raises:
+            RuntimeError: If enabling while numpy is not installed
+        """
+        if enabled and np is None:
+            raise RuntimeError('BoxRasterizer requires numpy to be installed')
+        BoxRasterizer.__enabled = enabled
+
+    @staticmethod
+    def setThreshold(threshold: int) -> None:
+        """
+        setThreshold sets the minimum amount of tiles for which a box is rasterized.
+
+        Args:
+            threshold (int): minimum amount of tiles (>= 1)
+        """
+        if not isinstance(threshold, int):
+            raise TypeError(f'threshold must be int, got {type(threshold)}')
+        if threshold < 1:
+            raise ValueError(f'threshold must be at least 1, got {threshold}')
+        BoxRasterizer.__threshold = threshold
+
+    # -------------------- tile-grid --------------------
+
+    @staticmethod
+    def __tileStarts(start: int, end: int, altsize: float | int) -> tuple[list[int], list[int]]:
+        """
+        __tileStarts calculates the tiles along one dimension of a partition
+        (exactly like the tile loops of Box.updateRenderData).
+
+        Args:
+            start   (int)           : the start of the partition
+            end     (int)           : the end of the partition
+            altsize (float | int)   : the size of the tiles
+
+        Returns (tuple[list[int], list[int]]): the starts and sizes of the tiles
+        """
+        starts: list[int] = []
+        sizes: list[int] = []
+        pos: float = start
+        while pos + altsize < end:
+            starts.append(int(pos))
+            sizes.append(int(altsize))
+            pos += altsize
+        starts.append(int(pos))
+        sizes.append(end - int(pos))
+        return starts, sizes
+
+    @staticmethod
+    def __segments(starts: list[int], sizes: list[int], begin: int, end: int) -> tuple[list[int], list[int]]:
+        """
+        __segments splits a dimension into the tiles and the (rounding) gaps between them.
+
+        Returns (tuple[list[int], list[int]]): the tile of every segment (-1 for gaps) and the sizes of the segments
+        """
+        tiles: list[int] = []
+        lengths: list[int] = []
+        pos: int = begin
+        for i, (start, size) in enumerate(zip(starts, sizes)):
+            if start > pos:
+                tiles.append(-1)
+                lengths.append(start - pos)
+            tiles.append(i)
+            lengths.append(size)
+            pos = start + size
+        if end > pos:
+            tiles.append(-1)
+            lengths.append(end - pos)
+        return tiles, lengths
+
+    @staticmethod
+    def __insideFilter(rect: Rect, filt: filtertype, x: Any, y: Any) -> Any:
+        """
+        __insideFilter checks for all given points if they are inside the filtered area
+        (vectorized version of the filter check of Box.updateRenderData).
+
+        Args:
+            rect    (Rect)              : the partition the filter is applied to
+            filt    (filtertype)        : the filter configuration (type, parameters, inversion)
+            x, y    (NDArray[np.int64]) : the coordinates of the points
+
+        Returns (NDArray[np.bool_]): if the points are inside the filtered area
+        """
+        assert np is not None
+        if not isinstance(filt, tuple):
+            return np.ones(np.broadcast(x, y).shape, dtype=np.bool_)
+        if filt[0] not in (Filters.LINEAR, Filters.QUADRATIC):
+            return np.zeros(np.broadcast(x, y).shape, dtype=np.bool_)
+        fx, fy, d = filt[1]
+        xx, yy = rect.getPoint((fx, fy))
+        dd: float
+        if d[0] > 0.0 and d[1] > 0.0:
+            dd = max(d[0] * rect.width, d[1] * rect.height)
+        else:
+            dd = d[0] * rect.width + d[1] * rect.height
+        if filt[0] == Filters.LINEAR:
+            distance = np.abs(x - xx) + np.abs(y - yy)
+        else:
+            distance = (x - xx)**2 + (y - yy)**2
+            dd = dd**2
+        return distance >= dd if filt[2] else distance <= dd
+
+    # -------------------- rasterization --------------------
+
+    @staticmethod
+    def rasterize(partitions: list[Partition]) -> Optional[tuple[Rect, Any]]:
+        """
+        rasterize bakes the tiles of the given partitions into one pixel buffer.
+
+        Args:
+            partitions (list[Partition]): the resolved partitions of the box
+
+        Returns (Optional[tuple[Rect, NDArray[np.uint8]]]): the covered region and its (height, width, 4) RGBA pixels
+                                                             or None if the box should be drawn tile by tile
+        """
+        if not BoxRasterizer.__enabled or np is None:
+            return None
+
+        # resolve the tile grids (and check if rasterizing is possible and worth it)
+        grids: list[tuple[Partition, tuple[list[int], list[int]], tuple[list[int], list[int]]]] = []
+        tiles: int = 0
+        for partition in partitions:
+            rect, altmode, altsize, colors, filters = partition
+            if rect.width <= 0 or rect.height <= 0 or all(color is None for color in colors):
+                continue
+            if altmode == AltMode.DEFAULT and not isinstance(filters[0], tuple):
+                grids.append((partition, ([rect.left], [rect.width]), ([rect.top], [rect.height])))
+                tiles += 1
+                continue
+            if altsize < 1:
+                return None
+            cols = BoxRasterizer.__tileStarts(rect.left, rect.right, altsize)
+            rows = BoxRasterizer.__tileStarts(rect.top, rect.bottom, altsize)
+            grids.append((partition, cols, rows))
+            tiles += len(cols[0]) * len(rows[0])
+        if not grids or tiles < BoxRasterizer.__threshold:
+            return None
+
+        palette: dict[tuple[int, int, int, int], int] = {}
+        for (_, _, _, colors, _), _, _ in grids:
+            for color in colors:
+                if color is not None:
+                    rgba: tuple[int, int, int, int] = tColor.to_rgba(color)
+                    if rgba[3] != 255:
+                        return None # translucent tiles are blended by the drawer, not overwritten
+                    palette.setdefault(rgba, len(palette))
+
+        region: Rect = grids[0][0][0]
+        for (rect, *_), _, _ in grids[1:]:
+            region = region.union(rect)
+        pixels = np.zeros((region.height, region.width, 4), dtype=np.uint8)
+        colorTable = np.array(list(palette) + [(0, 0, 0, 0)], dtype=np.uint8) # index -1: not drawn
+
+        for (rect, altmode, _, colors, filters), (colStarts, colSizes), (rowStarts, rowSizes) in grids:
+            # order index of every tile
+            r = np.arange(len(rowStarts))[:, None]
+            c = np.arange(len(colStarts))[None, :]
+            match altmode:
+                case AltMode.CHECKERBOARD:
+                    index = (r + c) % len(colors)
+                case AltMode.STRIPED_V:
+                    index = np.broadcast_to(c % len(colors), (r.size, c.size))
+                case AltMode.STRIPED_H:
+                    index = np.broadcast_to(r % len(colors), (r.size, c.size))
+                case _:
+                    index = np.zeros((r.size, c.size), dtype=np.intp)
+
+            # palette index of every tile (-1 if not drawn)
+            centerX = (np.array(colStarts) + 0.5 * np.array(colSizes)).astype(np.int64)[None, :]
+            centerY = (np.array(rowStarts) + 0.5 * np.array(rowSizes)).astype(np.int64)[:, None]
+            tileColors = np.full(index.shape, -1, dtype=np.intp)
+            for k, (color, filt) in enumerate(zip(colors, filters)):
+                if color is None:
+                    continue
+                selected = (index == k) & BoxRasterizer.__insideFilter(rect, filt, centerX, centerY)
+                tileColors[selected] = palette[tColor.to_rgba(color)]
+
+            # expand the tiles (and the gaps between them) to the pixels of the partition
+            colTiles, colLengths = BoxRasterizer.__segments(colStarts, colSizes, rect.left, rect.right)
+            rowTiles, rowLengths = BoxRasterizer.__segments(rowStarts, rowSizes, rect.top, rect.bottom)
+            segmentColors = tileColors[rowTiles][:, colTiles]
+            segmentColors[np.array(rowTiles) < 0, :] = -1
+            segmentColors[:, np.array(colTiles) < 0] = -1
+            image = np.repeat(np.repeat(colorTable[segmentColors], rowLengths, axis=0), colLengths, axis=1)
+            pixels[rect.top - region.top:rect.bottom - region.top, rect.left - region.left:rect.right - region.left] = image
+
+        return region, pixels
@@ -1,11 +1,9 @@
-from typing import Any, Optional, override
+from typing import Any, Iterable, Optional, override
 from math import sqrt
 
 from .....utility import Rect, Color
 from .....display import Surface
-from .....interaction import EventManager
 
-from ...body    import Body
 from ..atom             import Atom
 from .linecore          import LineCore
 from .linedata          import LineData, AltMode
@@ -48,15 +46,13 @@ class Line(Atom[LineCore, LineData]):
         # Initialize base with default core
         super().__init__(LineCore(), renderData, active)
         
-        # Initialize render cache and subscribe to updates
+        # Initialize render cache
         self.__renderCache: list[tuple[Rect | tuple[tuple[int, int], 
                                                tuple[int, int], int], Color]] = []
-        EventManager.quickSubscribe(
-            Body.getLayoutUpdateEvent(), self.updateRenderData)
 
     @override
     def copy(self) -> 'Line':
-        return Line(renderData=self._renderData.copy(), active=self.isActive())
+        return self._finishCopy(Line(renderData=self._renderData.copy()))
 
     @staticmethod
     @override
@@ -83,7 +79,17 @@ class Line(Atom[LineCore, LineData]):
             raise TypeError(f'args must be dictionary, got {type(args)}')
 
         # Parse render data and create line
-        return Line(renderData=LineData.parseFromArgs(args))
+        return Line.fromArgs(args | Line.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        return {'renderData': LineData.parseFromArgs(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Line':
+        return Line(renderData=args['renderData'])
 
     # -------------------- rendering --------------------
 
@@ -140,6 +146,7 @@ class Line(Atom[LineCore, LineData]):
         - Section properties (color, thickness, mode)
         """
         # Clear existing cache
+        self._invalidate()
         self.__renderCache = []
 
         # Get and validate bounds
@@ -334,6 +341,16 @@ class Line(Atom[LineCore, LineData]):
                     else:
                         self.__renderCache.append((((int(cline[0]), int(cline[1])), (rect.right, rect.bottom), thickness), color))
 
+    @override
+    def _calcRenderBounds(self) -> Rect:
+        thickness: int = max((ob[2] for ob, _ in self.__renderCache if isinstance(ob, tuple)), default=0)
+        margin: int = thickness // 2 + 1
+        return self.getRect().inflate(margin, margin)
+
+    @override
+    def _getDrawnColors(self) -> Iterable[Color]:
+        return (color for _, color in self.__renderCache)
+
     def _validate_render_state(self) -> bool:
         """Validate line state for rendering.
 
@@ -384,19 +401,12 @@ class Line(Atom[LineCore, LineData]):
             raise RuntimeError('No drawer available for rendering')
 
         # Only render if active and cache exists
-        if not self._active or not self.__renderCache:
+        if not self._active or not self.__renderCache or not self._trackDraw(self):
             return
 
         try:
-            for obj, color in self.__renderCache:
-                if isinstance(obj, Rect):
-                    # Draw rectangle segment
-                    self._drawer.drawrect(surface, obj, color)
-                elif isinstance(obj, tuple):
-                    # Draw line segment with thickness
-                    start, end, thickness = obj
-                    self._drawer.drawline(
-                        surface, start, end, color, thickness=thickness)
+            # Draw all segments with one call per batch of rects / lines
+            self._drawBatched(surface, self.__renderCache)
         except Exception as e:
             raise RuntimeError(
                 f'Failed to render line segments: {e}')
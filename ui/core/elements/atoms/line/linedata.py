@@ -1,4 +1,3 @@
-from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional, override
@@ -93,17 +92,17 @@ class LineData(AtomData):
             New LineData instance with copied properties
 
         Note:
-            Ensures deep copy of all nested structures
+            Copies the containers, their items are immutable (set() replaces them)
         """
         try:
             return LineData(
-                colors=deepcopy(self.colors),
-                sizes=deepcopy(self.sizes),
-                thickness=deepcopy(self.thickness),
-                altmode=deepcopy(self.altmode),
-                inset=deepcopy(self.inset),
-                flip=deepcopy(self.flip),
-                order=deepcopy(self.order)
+                colors=dict(self.colors),
+                sizes=dict(self.sizes),
+                thickness=dict(self.thickness),
+                altmode=dict(self.altmode),
+                inset=self.inset,
+                flip=self.flip,
+                order=list(self.order)
             )
         except Exception as e:
             raise RuntimeError(f'Failed to copy LineData: {e}')
@@ -180,6 +179,7 @@ class LineData(AtomData):
             raise TypeError(f'args must be dictionary, got {type(args)}')
 
         s: bool = False
+        before: tuple[Any, ...] = () if skips else self._snapshot()
         for arg, v in args.items():
             if arg not in ['lineinset', 'inset', 'flip', 'lineorder', 'sectionorder', 'order']:
                 if not isinstance(v, str):
@@ -234,4 +234,5 @@ class LineData(AtomData):
                         s = True
                         if not skips:
                             self.order = LineData.parseList(v)
+        self._changed = s and not skips and self._snapshot() != before
         return s
@@ -1,10 +1,8 @@
-from typing import Optional, override
+from typing import Any, Iterable, Optional, override
 
-from .....utility import Rect
-from .....display import Surface, Font, FontManager
-from .....interaction import EventManager
+from .....utility import Color, Rect
+from .....display import Surface, FontManager, GlyphAtlas, TextCache
 
-from ...body        import Body
 from ..atom             import Atom
 from .textcore          import TextCore
 from .textdata          import TextData
@@ -19,20 +17,20 @@ class Text(Atom[TextCore, TextData]):
     - Hold textual content in a `TextCore` and rendering parameters in `TextData`.
     - Maintain a render-cache (surface + position) computed by
       `updateRenderData()` and used by `render()`.
-    - Subscribe to layout updates (via `Body.getLayoutUpdateEvent()`) and
-      recompute its render cache when layout or data changes.
+    - Recompute its render cache when its body is moved or resized by a
+      layout update (via `Body.getChangeEvent()`) or its data changes.
 
     Rendering contract
     - `updateRenderData()` computes the surface used to draw the text and
       the top-left position where it should be blitted. It must not perform
       long-running operations and should return quickly.
-    - `render(surface)` simply blits the prepared surface if available.
+    - `render(surface)` simply blits the prepared surfaces if available.
 
     Color and font handling
     - `TextData.textColor` may be a `tColor` instance, an RGB/RGBA tuple or
-      a named/hex string; `Text` will try to pass the value to the active
-      `Font` implementation and contains fallbacks to common representations
-      (`.rgb` / `.value`) for compatibility with different font backends.
+      a named/hex string; `Text` passes the value to the active `Font`
+      implementation through the shared `TextCache`, which keys rendered
+      texts by the resolved RGBA value.
 
     Notes
     - This class performs lightweight validation in the constructor; heavy
@@ -50,22 +48,31 @@ class Text(Atom[TextCore, TextData]):
             raise TypeError(f'renderData must be a TextData instance, got {type(renderData)}')
         super().__init__(TextCore(content), renderData, active)
 
-        self.__renderCache = None
-        EventManager.quickSubscribe(Body.getLayoutUpdateEvent(), self.updateRenderData)
+        self.__renderCache = []
 
     @override
     def copy(self) -> 'Text':
-        return Text(self._core.getContent(), renderData=self._renderData.copy(), active=self.isActive())
+        return self._finishCopy(Text(self._core.getContent(), renderData=self._renderData.copy()))
 
     @staticmethod
     @override
-    def parseFromArgs(args: dict[str, str]) -> 'Text':
-        return Text(args['content'], renderData=TextData.parseFromArgs(args))
+    def parseFromArgs(args: dict[str, Any]) -> 'Text':
+        return Text.fromArgs(args | Text.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        return {'content': args['content'], 'renderData': TextData.parseFromArgs(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Text':
+        return Text(args['content'], renderData=args['renderData'])
 
 
     # -------------------- rendering --------------------
 
-    __renderCache: Optional[tuple[Surface, tuple[int, int]]]
+    __renderCache: list[tuple[Surface, tuple[int, int]]] # surfaces (whole text or glyphs) and their blit positions
 
     @override
     def updateRenderData(self) -> None:
@@ -78,16 +85,17 @@ class Text(Atom[TextCore, TextData]):
           configured insets (absolute or fractional).
         - If dynamic text sizing is enabled, compute `fontSize` so the text
           fits into the available box using `getDynamicFontSize()`.
-        - Use the active `Font` implementation to render the text. The
-          method attempts the provided color format first and falls back
-          to `.rgb`/`.value` attributes for compatibility.
-        - Store the resulting `(Surface, (x,y))` tuple in `self.__renderCache`
-          so `render()` can blit it.
+        - Get the rendered text from the shared `TextCache` (rendered with
+          the active `Font` implementation on a miss), or compose it from
+          cached glyphs of the `GlyphAtlas` if `glyphAtlas` is enabled.
+        - Store the resulting `(Surface, (x,y))` tuples in `self.__renderCache`
+          so `render()` can blit them.
 
         The method avoids raising exceptions for transient rendering errors;
         instead it clears the render cache so nothing is drawn.
         """
-        self.__renderCache = None
+        self._invalidate()
+        self.__renderCache = []
         #calculate render borderbox
         rect: Rect = self.getRect()
 
@@ -132,29 +140,26 @@ class Text(Atom[TextCore, TextData]):
             self._renderData.fontSize = getDynamicFontSize(self._renderData.sysFontName, rect.getSize(), self._core.getContent())
 
         if self._renderData.textColor is not None and self._renderData.fontSize is not None:
-            font: Font = FontManager.getFont().SysFont(self._renderData.sysFontName, self._renderData.fontSize)
-            # Attempt to render using the color as provided; on failure, try common fallbacks
-            color_param = self._renderData.textColor
+            glyphs: list[tuple[Surface, int]]
+            text_size: tuple[int, int]
             try:
-                text_render: Surface = font.render(self._core.getContent(), color_param)
+                if self._renderData.glyphAtlas:
+                    # compose the text from cached glyphs
+                    glyphs, text_size = GlyphAtlas.layout(self._renderData.sysFontName, self._renderData.fontSize,
+                                                          self._core.getContent(), self._renderData.textColor)
+                else:
+                    # rendered texts are shared between all Text elements with the same font, size, content and color
+                    text_render: Surface = TextCache.render(self._renderData.sysFontName, self._renderData.fontSize,
+                                                            self._core.getContent(), self._renderData.textColor)
+                    glyphs, text_size = [(text_render, 0)], text_render.getSize()
             except Exception:
-                # fallback: if tColor instance, try rgb tuple then rgba tuple
-                try:
-                    if hasattr(color_param, 'rgb'):
-                        text_render = font.render(self._core.getContent(), color_param)
-                    elif hasattr(color_param, 'value'):
-                        text_render = font.render(self._core.getContent(), color_param)
-                    else:
-                        raise
-                except Exception:
-                    # Cannot render text with provided color; clear cache and exit
-                    self.__renderCache = None
-                    return
+                # Cannot render text with provided color; clear cache and exit
+                self.__renderCache = []
+                return
 
-            text_size: tuple[int, int] = text_render.getSize()
             textPosX: int = int(rect.left + (rect.width - text_size[0]) * self._renderData.fontAlign[0])
             textPosY: int = int(rect.top + (rect.height - text_size[1]) * self._renderData.fontAlign[1])
-            self.__renderCache = (text_render, (textPosX, textPosY))
+            self.__renderCache = [(glyph, (textPosX + offset, textPosY)) for glyph, offset in glyphs]
 
 
     @override
@@ -168,8 +173,21 @@ class Text(Atom[TextCore, TextData]):
         assert self._drawer is not None
 
         # check if UIElement should be rendered
-        if self._active and self.__renderCache is not None:
-            surface.blit(self.__renderCache[0], self.__renderCache[1])
+        if self._active and self.__renderCache and self._trackDraw(self):
+            for glyph, position in self.__renderCache:
+                surface.blit(glyph, position)
+
+    @override
+    def _calcRenderBounds(self) -> Rect:
+        bounds: Rect = super()._calcRenderBounds()
+        for glyph, position in self.__renderCache:
+            bounds = bounds.union(Rect(position, glyph.getSize()))
+        return bounds
+
+    @override
+    def _getDrawnColors(self) -> Iterable[Color]:
+        color: Optional[Color] = self._renderData.textColor
+        return () if color is None or not self.__renderCache else (color,)
 
 # -------------------------------------------------- helpers --------------------------------------------------
 
@@ -186,23 +204,4 @@ def getDynamicFontSize(font_name: str, box_size: tuple[int, int], text: str) ->
     Returns:
         int = the maximal fontsize to still fit in the box
     """
-
-    def text_fits_in_box(text_render: Surface) -> bool:
-        nonlocal box_size
-        text_size: tuple[int, int] = text_render.getSize()
-        return (box_size[0] > text_size[0]) and (box_size[1] > text_size[1])
-
-    start_search: int = 0
-    end_search: int = min(box_size)
-    while start_search < end_search:
-        mid_search: int = int((start_search + end_search) / 2)
-        
-        test_font = FontManager.getFont().SysFont(font_name, mid_search)
-        test_render: Surface = test_font.render(text, (255, 255, 255))
-
-        if text_fits_in_box(test_render):
-            start_search = mid_search + 1
-        else: 
-            end_search = mid_search - 1
-
-    return start_search
+    return FontManager.getFittingFontSize(font_name, box_size, text)
@@ -62,12 +62,14 @@ class TextCore(AtomCore):
             raise TypeError('skips must be a bool')
 
         s: bool = False
+        self._changed = False
         for tag, value in args.items():
             match tag:
                 case 'content':
                     s = True
                     if not skips:
                         if isinstance(value, str):
+                            self._changed |= value != self._content
                             self._content = value
                         else:
                             raise TypeError('content expects a str')
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional, override
 
@@ -33,6 +32,8 @@ class TextData(AtomData):
     - `sysFontName` : system font family name to use for rendering
     - `fontSize` : optional explicit font size (ignored when `dynamicText` is True)
     - `fontAlign` : tuple of horizontal and vertical alignment (0..1)
+    - `glyphAtlas` : if True, the text is composed from cached glyphs instead
+      of being rendered as a whole (cheap updates of rapidly changing labels)
 
     Responsibilities
     - Provide parsing (`parseFromArgs`) and `set()` for applying attribute
@@ -45,12 +46,13 @@ class TextData(AtomData):
     sysFontName : str                   = 'Arial'
     fontSize    : Optional[int]         = 24
     fontAlign   : tuple[float, float]   = field(default_factory=lambda: (0.5, 0.5))
+    glyphAtlas  : bool                  = False
 
     @override
     def copy(self) -> 'TextData':
-        return TextData(deepcopy(self.inset), deepcopy(self.dynamicText),
-                        deepcopy(self.textColor), deepcopy(self.sysFontName),
-                        deepcopy(self.fontSize), deepcopy(self.fontAlign))
+        # all properties are immutable (set() replaces them)
+        return TextData(self.inset, self.dynamicText, self.textColor, self.sysFontName,
+                        self.fontSize, self.fontAlign, self.glyphAtlas)
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'TextData':
@@ -63,6 +65,7 @@ class TextData(AtomData):
     @override
     def set(self, args: dict[str, Any], skips: bool) -> bool:
         s: bool = False
+        before: tuple[Any, ...] = () if skips else self._snapshot()
         for arg, value in args.items():
             match arg:
                 case 'inset':
@@ -91,6 +94,13 @@ class TextData(AtomData):
                                     self.fontSize = int(TextData.extractNum(str(value)))
                                 except Exception:
                                     raise ValueError(f'invalid fontsize: {value}')
+                case 'glyphatlas' | 'glyphs' | 'atlas':
+                    s = True
+                    if not skips:
+                        if isinstance(value, bool):
+                            self.glyphAtlas = value
+                        else:
+                            self.glyphAtlas = str(value).strip().lower() not in ('false', '0', 'no', 'off')
                 case 'fontname' | 'sysfont' | 'font':
                     s = True
                     if not skips:
@@ -137,4 +147,5 @@ class TextData(AtomData):
                                     case 'r':
                                         xx = 1.0
                             self.fontAlign = (xx, xx)
+        self._changed = s and not skips and self._snapshot() != before
         return s
@@ -1 +1,2 @@
-from .body          import Body
+from .body          import Body, LayoutState
+from .batchsolver    import BatchSolver
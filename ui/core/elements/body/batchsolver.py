@@ -0,0 +1,259 @@
+from typing import Any, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError: # numpy is optional
+    np = None  # type: ignore[assignment]
+
+from ....utility import Rect, iRect
+
+if TYPE_CHECKING:
+    from .body import Body
+
+class BatchSolver:
+    """Optional vectorized solver for the Body constraint system.
+
+    The BatchSolver compiles the fix points (relpoint1/relpoint2 of both dimensions) of
+    a set of bodies into flat NumPy arrays (isGlobal, myP, otherP, offset, reference index)
+    and solves positions and sizes level by level (bodies of one level only reference
+    bodies of lower levels or constant rects) in batched array operations.
+
+    The compiled arrays are kept between solves; only bodies whose constraints changed
+    since the last solve are recompiled (e.g. the root body on a window resize).
+
+    The results are identical to the per-body evaluation of RelativePoints.getDimension.
+    The solver is only used if numpy is installed, it is enabled and the amount of
+    bodies to update reaches the threshold.
+
+    Usage:
+        BatchSolver.setEnabled(True)    # enable batched solving
+        BatchSolver.setThreshold(256)   # minimum amount of bodies to solve batched
+    """
+
+    __enabled: bool = False
+    __threshold: int = 512
+
+    # compiled batch (reused while the same bodies are solved)
+    __order: list['Body'] = []
+    __versions: list[int] = []
+    __columns: list[Any] = []                       # isGlobal, myP, otherP, offset, refIndex, constStart, constLength
+    __levels: list[Any] = []                        # row indices of every level
+    __bodyRefs: dict[int, tuple[int, iRect]] = {}  # flat index -> (dimension, mutable reference outside the batch)
+
+    # -------------------- configuration --------------------
+
+    @staticmethod
+    def isAvailable() -> bool:
+        """
+        isAvailable returns if numpy is installed and the solver can be used.
+
+        Returns (bool): numpy is available
+        """
+        return np is not None
+
+    @staticmethod
+    def setEnabled(enabled: bool) -> None:
+        """
+        setEnabled enables or disables batched solving.
+
+        Args:
+            enabled (bool): if the batch solver should be used
+
+        Raises:
+            RuntimeError: If enabling while numpy is not installed
+        """
+        if enabled and np is None:
+            raise RuntimeError('BatchSolver requires numpy to be installed')
+        BatchSolver.__enabled = enabled
+
+    @staticmethod
+    def setThreshold(threshold: int) -> None:
+        """
+        setThreshold sets the minimum amount of bodies for which the batch solver is used.
+
+        Args:
+            threshold (int): minimum amount of bodies (>= 1)
+        """
+        if not isinstance(threshold, int):
+            raise TypeError(f'threshold must be int, got {type(threshold)}')
+        if threshold < 1:
+            raise ValueError(f'threshold must be at least 1, got {threshold}')
+        BatchSolver.__threshold = threshold
+
+    @staticmethod
+    def shouldSolve(count: int) -> bool:
+        """
+        shouldSolve returns if a batch of the given size should be solved by the batch solver.
+
+        Args:
+            count (int): amount of bodies to update
+
+        Returns (bool): the batch solver should be used
+        """
+        return BatchSolver.__enabled and np is not None and count >= BatchSolver.__threshold
+
+    # -------------------- compilation --------------------
+
+    @staticmethod
+    def __compileBody(i: int, body: 'Body', index: dict['Body', int]) -> tuple[list[list[Any]], dict[int, tuple[int, iRect]]]:
+        """
+        __compileBody compiles the fix points of a single body.
+
+        Args:
+            i       (int)               : the index of the body in the batch
+            body    (Body)              : the body to compile
+            index   (dict[Body, int])   : the indices of all bodies in the batch
+
+        Returns (tuple[list[list[Any]], dict[int, tuple[int, Body]]]): the 4 values of every column
+                                                                       and the mutable references outside the batch
+        """
+        columns: list[list[Any]] = [[] for _ in range(7)]
+        bodyRefs: dict[int, tuple[int, iRect]] = {}
+        for dim, relations in enumerate(body.getRelations()):
+            for r, relpoint in enumerate((relations.relpoint1, relations.relpoint2)):
+                ref: int = index.get(relpoint.other, -1) # type: ignore[call-overload]
+                if ref == i:
+                    raise ReferenceError('UI Layout references itself!')
+                columns[0].append(relpoint.isGlobal)
+                columns[1].append(relpoint.myP)
+                columns[2].append(relpoint.otherP)
+                columns[3].append(relpoint.offset)
+                columns[4].append(ref)
+                if ref >= 0:
+                    columns[5].append(0)
+                    columns[6].append(0)
+                else:
+                    columns[5].append(relpoint.other.getPosition()[dim])
+                    columns[6].append(relpoint.other.getSize()[dim])
+                    if not isinstance(relpoint.other, Rect): # only Rects are immutable
+                        bodyRefs[4 * i + 2 * dim + r] = (dim, relpoint.other)
+        return columns, bodyRefs
+
+    @staticmethod
+    def __compileLevels(refIndex: Any) -> list[Any]:
+        """
+        __compileLevels groups the rows of a batch into levels, so that every row only
+        references rows of lower levels.
+
+        Args:
+            refIndex (ndarray): the reference indices of the batch (n x 2 x 2)
+
+        Returns (list[ndarray]): the row indices of every level
+        """
+        refs: list[list[int]] = refIndex.reshape(-1, 4).tolist()
+        level: list[int] = [0] * len(refs)
+        for i, rowRefs in enumerate(refs):
+            for ref in rowRefs:
+                if ref >= 0 and level[ref] >= level[i]:
+                    level[i] = level[ref] + 1
+        levels = np.asarray(level, dtype=np.int64)
+        return [np.nonzero(levels == currentLevel)[0] for currentLevel in range(int(levels.max()) + 1)] if level else []
+
+    @staticmethod
+    def __compile(order: list['Body']) -> None:
+        """
+        __compile compiles the fix points of the given bodies into flat arrays.
+        If the same bodies were compiled before, only changed bodies are recompiled.
+
+        Args:
+            order (list[Body]): the bodies to compile in topological order
+        """
+        versions: list[int] = [body.getConstraintVersion() for body in order]
+        index: dict['Body', int] = {body: i for i, body in enumerate(order)}
+        dtypes = (bool, np.float64, np.float64, np.float64, np.int64, np.float64, np.float64)
+
+        if order == BatchSolver.__order:
+            changed: list[int] = [i for i, (new, old) in enumerate(zip(versions, BatchSolver.__versions)) if new != old]
+            relink: bool = False
+            for i in changed:
+                columns, bodyRefs = BatchSolver.__compileBody(i, order[i], index)
+                for flat in range(4 * i, 4 * i + 4):
+                    BatchSolver.__bodyRefs.pop(flat, None)
+                BatchSolver.__bodyRefs.update(bodyRefs)
+                for col, values in enumerate(columns):
+                    row = np.asarray(values, dtype=dtypes[col]).reshape(2, 2)
+                    if col == 4 and not np.array_equal(BatchSolver.__columns[col][i], row):
+                        relink = True
+                    BatchSolver.__columns[col][i] = row
+            if relink:
+                BatchSolver.__levels = BatchSolver.__compileLevels(BatchSolver.__columns[4])
+            BatchSolver.__versions = versions
+            return
+
+        flatColumns: list[list[Any]] = [[] for _ in range(7)]
+        allBodyRefs: dict[int, tuple[int, iRect]] = {}
+        for i, body in enumerate(order):
+            columns, bodyRefs = BatchSolver.__compileBody(i, body, index)
+            for col, values in enumerate(columns):
+                flatColumns[col].extend(values)
+            allBodyRefs.update(bodyRefs)
+
+        BatchSolver.__order = list(order)
+        BatchSolver.__versions = versions
+        BatchSolver.__columns = [np.asarray(values, dtype=dtypes[col]).reshape(len(order), 2, 2) for col, values in enumerate(flatColumns)]
+        BatchSolver.__levels = BatchSolver.__compileLevels(BatchSolver.__columns[4])
+        BatchSolver.__bodyRefs = allBodyRefs
+
+    # -------------------- solving --------------------
+
+    @staticmethod
+    def solve(order: list['Body']) -> None:
+        """
+        solve calculates the positions and sizes of the given bodies and applies them.
+
+        Args:
+            order (list[Body]): the bodies to update in topological order (every body is
+                                listed after all bodies of the list it references)
+
+        Raises:
+            ReferenceError: If a body references itself
+            ZeroDivisionError: If the fix points of a body do not define a dimension
+        """
+        BatchSolver.__compile(order)
+        isGlobal, myP, otherP, offset, refIndex, constStart, constLength = BatchSolver.__columns
+
+        # refresh mutable references outside the batch
+        flatStart, flatLength = constStart.reshape(-1), constLength.reshape(-1)
+        for flat, (dim, other) in BatchSolver.__bodyRefs.items():
+            flatStart[flat] = other.getPosition()[dim]
+            flatLength[flat] = other.getSize()[dim]
+
+        n: int = len(order)
+        position = np.zeros((n, 2), dtype=np.float64)
+        size     = np.zeros((n, 2), dtype=np.float64)
+        dims     = np.broadcast_to(np.arange(2).reshape(1, 2, 1), (n, 2, 2))
+
+        for rows in BatchSolver.__levels:
+            ref, d = refIndex[rows], dims[rows]
+            hasRef = ref >= 0
+            safeRef = np.where(hasRef, ref, 0)
+            refStart  = np.where(hasRef, position[safeRef, d], constStart[rows])
+            refLength = np.where(hasRef, size[safeRef, d], constLength[rows])
+
+            # absolute positions of the fix points
+            oP, off = otherP[rows], offset[rows]
+            absPos = np.where(isGlobal[rows],
+                              np.trunc(np.trunc(refStart + oP * refLength) + off),
+                              np.trunc(refLength * oP + off))
+
+            a1, a2 = absPos[:, :, 0], absPos[:, :, 1]
+            m1, m2 = myP[rows][:, :, 0], myP[rows][:, :, 1]
+            g1, g2 = isGlobal[rows][:, :, 0], isGlobal[rows][:, :, 1]
+            both = g1 & g2
+            onlyFirst = g1 & ~g2
+
+            numerator   = np.where(both, a2 - a1, np.where(onlyFirst, a2, a1))
+            denominator = np.where(both, m2 - m1, np.where(onlyFirst, m2, m1))
+            if np.any(denominator == 0):
+                raise ZeroDivisionError('UI Layout fix points do not define a dimension!')
+
+            length = np.trunc(numerator / denominator)
+            start  = np.where(g1, np.trunc(a1 - length * m1), np.trunc(a2 - length * m2))
+
+            position[rows] = start
+            size[rows] = np.maximum(0, length)
+
+        positions: list[list[int]] = position.astype(np.int64).tolist()
+        sizes: list[list[int]] = size.astype(np.int64).tolist()
+        for body, (x, y), (w, h) in zip(order, positions, sizes):
+            body._applyDimensions((x, y), (w, h))
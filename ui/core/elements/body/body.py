@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import override
+from typing import Optional, override
 
 from ....utility import Rect, iRect, AlignType
 from ....interaction import EventManager
 
+from .batchsolver import BatchSolver
+
 @dataclass
 class RelPoint:
     """A relative point that defines a positional relationship between two rectangles.
@@ -108,6 +110,9 @@ class RelativePoints:
 Point = tuple[float, float]
 """Type alias for a 2D point using relative coordinates (0.0 to 1.0 for each dimension)"""
 
+LayoutState = tuple[tuple[RelPoint, RelPoint, RelPoint, RelPoint], tuple[int, int], tuple[int, int]]
+"""Type alias for a solved body: ((x-relpoint1, x-relpoint2, y-relpoint1, y-relpoint2), position, size)"""
+
 class Body(iRect):
     """A sophisticated rectangle implementation with constraint-based positioning system.
     
@@ -119,8 +124,8 @@ class Body(iRect):
     Features:
         - Constraint-based positioning using relative and absolute fix points
         - Automatic size calculation based on constraints
-        - Circular dependency detection
-        - Event-based update system for efficient layout recalculation
+        - Circular dependency detection when connections are added
+        - Dependency-graph based incremental layout recalculation
         - Alignment helpers for common positioning scenarios
     
     The positioning system uses two pairs of RelativePoints (one for x-axis, one for
@@ -138,16 +143,23 @@ class Body(iRect):
                                   (0, 0), (True, True))
         ```
     """
-    __resetBodyUpdateStatusEvent: str = EventManager.createEvent()
-    __updateBodyEvent: str = EventManager.createEvent()
     __updateLayoutEvent: str = EventManager.createEvent()
 
-    __updating: bool
+    __dirtyBodies: dict['Body', None] = {} # bodies with changed constraints since the last layout update (ordered set)
+    __graphVersion: int = 0                 # incremented on every change of any fix point
+
     __updated: bool
 
     __setXRelations: RelativePoints
     __setYRelations: RelativePoints
 
+    __constraintVersion: int          # incremented on every change of the fix points
+    __changeEvent: Optional[str]      # triggered when position or size change (created on demand)
+
+    __dependencies: list['Body']   # bodies referenced by the current fix points
+    __dependents: dict['Body', None] # bodies referencing this body (ordered set)
+    __level: int                     # greater than the level of every dependency (topological order)
+
     __position: tuple[int, int]
     __size: tuple[int, int]
 
@@ -165,28 +177,108 @@ class Body(iRect):
         """
         return Body.__updateLayoutEvent
 
+    @staticmethod
+    def getGraphVersion() -> int:
+        """Gets a counter that changes whenever the fix points of any body change.
+        
+        Returns:
+            int: The current version of the constraint graph
+        """
+        return Body.__graphVersion
+
+    @staticmethod
+    def collectDependents(bodies: list['Body']) -> list['Body']:
+        """Collects the given bodies and all bodies (transitively) depending on them.
+        
+        Args:
+            bodies (list[Body]): the bodies to start from
+
+        Returns:
+            list[Body]: the given bodies and all of their dependents (without duplicates)
+        """
+        collected: dict[Body, None] = {}
+        stack: list[Body] = list(bodies)
+        while stack:
+            body = stack.pop()
+            if body not in collected:
+                collected[body] = None
+                stack.extend(body.__dependents)
+        return list(collected)
+
     @staticmethod
     def updateBodys() -> None:
-        """Triggers a global update of all Body instances.
+        """Triggers an incremental update of all Body instances affected by a change.
         
-        This method initiates a two-phase update process:
-        1. Resets the update status of all bodies (allows detection of circular deps)
-        2. Triggers the actual update calculation for all bodies
+        Only bodies whose constraints changed since the last update (dirty bodies)
+        and the bodies transitively depending on them are recalculated. They are
+        recalculated in topological order, so every body is computed exactly once
+        and only after all of its references.
         
         Note:
             This is typically called when the layout needs to be recalculated,
             such as after window resizing or content changes.
         """
-        EventManager.triggerEvent(Body.__resetBodyUpdateStatusEvent)
-        EventManager.triggerEvent(Body.__updateBodyEvent)
+        if not Body.__dirtyBodies:
+            return
+        dirty: list[Body] = list(Body.__dirtyBodies)
+        Body.__dirtyBodies = {}
+        Body.__updateFrom(dirty)
+
+    @staticmethod
+    def __updateFrom(changed: list['Body']) -> None:
+        """
+        __updateFrom recalculates the given bodies and all of their (transitive) dependents
+        in topological order.
+
+        Args:
+            changed (list[Body]): the bodies whose constraints changed
+        """
+        # collect all affected bodies
+        affected: dict[Body, int] = {}
+        stack: list[Body] = list(changed)
+        while stack:
+            body = stack.pop()
+            if body in affected:
+                continue
+            affected[body] = 0
+            stack.extend(body.__dependents)
+
+        # count the references of every affected body to other affected bodies
+        for body in affected:
+            for dependency in body.__dependencies:
+                if dependency in affected:
+                    affected[body] += 1
+            body.__updated = False
+
+        # Kahn's algorithm: a body is ordered once all of its references are ordered
+        order: list[Body] = []
+        ready: list[Body] = [body for body, count in affected.items() if count == 0]
+        while ready:
+            body = ready.pop()
+            order.append(body)
+            for dependent in body.__dependents:
+                affected[dependent] -= 1
+                if affected[dependent] == 0:
+                    ready.append(dependent)
+
+        if BatchSolver.shouldSolve(len(order)):
+            BatchSolver.solve(order)
+            return
+
+        # cycles are rejected when connections are added, so every affected body is ordered
+        for body in order:
+            body.__updateDimensions()
 
     # -------------------- creation --------------------
 
     def __init__(self, rect: Rect=Rect()) -> None:
         super().__init__()
 
-        EventManager.quickSubscribe(Body.__resetBodyUpdateStatusEvent, self.__unsetUpdated)
-        EventManager.quickSubscribe(Body.__updateBodyEvent, self.update)
+        self.__constraintVersion = 0
+        self.__changeEvent = None
+        self.__dependencies = []
+        self.__dependents = {}
+        self.__level = 0
 
         self.__setXRelations = RelativePoints(0, RelPoint(False, 1.0, 1.0, 0, rect), RelPoint(True, 0.0, 0.0, 0, rect))
         self.__setYRelations = RelativePoints(1, RelPoint(False, 1.0, 1.0, 0, rect), RelPoint(True, 0.0, 0.0, 0, rect))
@@ -194,15 +286,27 @@ class Body(iRect):
         self.__updateDimensions()
 
     def __updateDimensions(self) -> None:
-        self.__updating = True
-
         dimX = self.__setXRelations.getDimension()
         dimY = self.__setYRelations.getDimension()
 
-        self.__position = (dimX[0], dimY[0])
-        self.__size = (dimX[1], dimY[1])
+        self._applyDimensions((dimX[0], dimY[0]), (dimX[1], dimY[1]))
+
+    def _applyDimensions(self, position: tuple[int, int], size: tuple[int, int]) -> None:
+        """
+        _applyDimensions stores solved dimensions of the body and triggers
+        the change event if they changed.
+        (should only be accessed by the layout solvers)
+
+        Args:
+            position    (tuple[int, int]): the solved position of the body
+            size        (tuple[int, int]): the solved size of the body
+        """
+        changed: bool = self.__changeEvent is not None and (position != self.__position or size != self.__size)
+        self.__position = position
+        self.__size = size
         self.__updated = True
-        self.__updating = False
+        if changed:
+            EventManager.triggerEvent(self.__changeEvent) # type: ignore[arg-type]
 
     def copy(self) -> 'Body':
         """Creates a new empty Body instance.
@@ -228,9 +332,6 @@ class Body(iRect):
         """
         if self.__updated:
             return self.__size
-        if self.__updating:
-            raise ReferenceError('UI Layout references itself!')
-        
         self.update()
 
         return self.__size
@@ -244,9 +345,6 @@ class Body(iRect):
         """
         if self.__updated:
             return self.__position
-        if self.__updating:
-            raise ReferenceError('UI Layout references itself!')
-        
         self.update()
 
         return self.__position
@@ -261,15 +359,162 @@ class Body(iRect):
         """
         return Rect(self.__position, self.__size)
 
+    def __str__(self) -> str:
+        """Create string representation.
+
+        Returns:
+            String in format: Body(topleft:(x,y), size:(w,h))
+        """
+        return f'Body(topleft:{self.__position}, size:{self.__size})'
+
+    def getRelations(self) -> tuple[RelativePoints, RelativePoints]:
+        """
+        getRelations returns the fix points defining the body.
+
+        Returns (tuple[RelativePoints, RelativePoints]): (x-axis, y-axis) ~ the fix points of both dimensions
+        """
+        return (self.__setXRelations, self.__setYRelations)
+
+    def getChangeEvent(self) -> str:
+        """
+        getChangeEvent returns the event triggered whenever the position or size of the body change.
+
+        Returns (str): the change event of the body
+        """
+        if self.__changeEvent is None:
+            self.__changeEvent = EventManager.createEvent()
+        return self.__changeEvent
+
+    def getConstraintVersion(self) -> int:
+        """
+        getConstraintVersion returns a counter that changes whenever the fix points of the body change.
+
+        Returns (int): the current constraint version of the body
+        """
+        return self.__constraintVersion
+
+    # -------------------- layout-state --------------------
+
+    def getLayoutState(self) -> LayoutState:
+        """
+        getLayoutState returns the fix points and the solved dimensions of the body.
+
+        Returns (LayoutState): the current state of the body
+        """
+        self.update()
+        return ((self.__setXRelations.relpoint1, self.__setXRelations.relpoint2,
+                 self.__setYRelations.relpoint1, self.__setYRelations.relpoint2),
+                self.__position, self.__size)
+
+    def setLayoutState(self, state: LayoutState) -> None:
+        """
+        setLayoutState restores a state previously returned by getLayoutState
+        without recalculating the body.
+
+        Args:
+            state (LayoutState): the state to restore
+        """
+        relpoints, position, size = state
+        self.__setXRelations.relpoint1, self.__setXRelations.relpoint2 = relpoints[0], relpoints[1]
+        self.__setYRelations.relpoint1, self.__setYRelations.relpoint2 = relpoints[2], relpoints[3]
+        self.__constraintVersion += 1
+        Body.__graphVersion += 1
+        self.__updateDependencies()
+        Body.__dirtyBodies.pop(self, None)
+        self._applyDimensions(position, size)
+
     # -------------------- positional-setter --------------------
 
-    def __unsetUpdated(self) -> None:
+    def __markDirty(self) -> None:
         """Internal method to mark this body as needing an update.
         
-        This is called during the first phase of the global update process
-        to prepare all bodies for recalculation.
+        The body (and its dependents) will be recalculated with the next
+        layout update.
+        """
+        Body.__dirtyBodies[self] = None
+
+    def __findPath(self, target: 'Body') -> Optional[list['Body']]:
+        """Internal method to find a chain of references from this body to the target.
+        
+        Every body on such a chain has a level between the levels of the target and this body,
+        so only the dependents of the target inside this band are searched.
+
+        Args:
+            target (Body): the body to search for
+
+        Returns (Optional[list[Body]]): the bodies from this body to the target (both included)
+                                        or None if this body does not reference the target
         """
-        self.__updated = False
+        if self is not target and self.__level <= target.__level:
+            return None
+        children: dict[Body, Optional[Body]] = {target: None}
+        stack: list[Body] = [target]
+        while stack:
+            body = stack.pop()
+            if body is self:
+                path: list[Body] = []
+                current: Optional[Body] = body
+                while current is not None:
+                    path.append(current)
+                    current = children[current]
+                return path
+            for dependent in body.__dependents:
+                if dependent not in children and (dependent is self or dependent.__level < self.__level):
+                    children[dependent] = body
+                    stack.append(dependent)
+        return None
+
+    def __validateConnection(self, other: iRect) -> None:
+        """Internal method to check that referencing the other rect does not create a cycle.
+        
+        Args:
+            other (iRect): the rect to reference
+
+        Raises:
+            ReferenceError: If the connection would make the layout reference itself
+        """
+        if not isinstance(other, Body) or other in self.__dependencies:
+            return # constant rects and existing edges cannot close a cycle
+        cycle: Optional[list[Body]] = other.__findPath(self)
+        if cycle is not None:
+            raise ReferenceError(
+                'UI Layout references itself! Connection would create the cycle: '
+                + ' -> '.join(str(body) for body in [self] + cycle))
+
+    def __raiseLevel(self) -> None:
+        """Internal method to restore the level order after dependencies were added.
+        
+        The level of the body is raised above the levels of its dependencies and
+        the raise is propagated to all dependents whose level is not above anymore.
+        """
+        stack: list[Body] = [self]
+        while stack:
+            body = stack.pop()
+            level: int = 1 + max((dependency.__level for dependency in body.__dependencies), default=-1)
+            if level > body.__level:
+                body.__level = level
+                stack.extend(body.__dependents)
+
+    def __updateDependencies(self) -> None:
+        """Internal method to rebuild the dependency edges of this body.
+        
+        Every Body referenced by one of the fix points is a dependency;
+        other rects (e.g. Rect) are constant and not tracked.
+        """
+        dependencies: list[Body] = []
+        for relations in (self.__setXRelations, self.__setYRelations):
+            for relpoint in (relations.relpoint1, relations.relpoint2):
+                if isinstance(relpoint.other, Body) and relpoint.other is not self and relpoint.other not in dependencies:
+                    dependencies.append(relpoint.other)
+
+        for dependency in self.__dependencies:
+            if dependency not in dependencies:
+                del dependency.__dependents[self]
+        for dependency in dependencies:
+            if dependency not in self.__dependencies:
+                dependency.__dependents[self] = None
+        self.__dependencies = dependencies
+        self.__raiseLevel()
 
     def update(self) -> None:
         if not self.__updated:
@@ -281,9 +526,10 @@ class Body(iRect):
         This method explicitly invalidates the current layout calculations
         and triggers an immediate update, regardless of the body's current
         update status. Use this when you need to ensure fresh calculations.
+        Bodies depending on this body are recalculated as well.
         """
-        self.__updated = False
-        self.update()
+        Body.__dirtyBodies.pop(self, None)
+        Body.__updateFrom([self])
 
     def addReferenceConnection(self, other: iRect, connectionDimension: tuple[bool, bool],
                         myFixPoint: Point, otherFixPoint: Point, offset: tuple[int, int]=(0,0),
@@ -302,7 +548,18 @@ class Body(iRect):
                                                                             (in reference to the object itself)
             keepSize            (tuple[bool, bool])                     : boolean if the fixations should keep relative-fixes and just
                                                                             override global fixes
+
+        Raises:
+            ReferenceError: If the connection would make the layout reference itself
         """
+        if connectionDimension[0] or connectionDimension[1]:
+            self.__validateConnection(other)
+        self.__applyConnection(other, connectionDimension, myFixPoint, otherFixPoint, offset, fixedGlobal, keepSize)
+
+    def __applyConnection(self, other: iRect, connectionDimension: tuple[bool, bool],
+                          myFixPoint: Point, otherFixPoint: Point, offset: tuple[int, int],
+                          fixedGlobal: tuple[bool, bool], keepSize: tuple[bool, bool]) -> None:
+        """Internal method to set an already validated connection of the body (see addReferenceConnection)."""
         # set new x-axis fixpoints
         if connectionDimension[0]:
             self.__setXRelations.setRelpoint(other, myFixPoint[0], otherFixPoint[0], offset=offset[0], globalFix=fixedGlobal[0], keepSize=keepSize[0])
@@ -310,6 +567,12 @@ class Body(iRect):
         # set new y-axis fixpoints
         if connectionDimension[1]:
             self.__setYRelations.setRelpoint(other, myFixPoint[1], otherFixPoint[1], offset=offset[1], globalFix=fixedGlobal[1], keepSize=keepSize[1])
+
+        if connectionDimension[0] or connectionDimension[1]:
+            self.__constraintVersion += 1
+            Body.__graphVersion += 1
+            self.__updateDependencies()
+            self.__markDirty()
     
     
     def align(self, alignagainst: iRect, align: AlignType, alignX: bool=True, alignY: bool=True,
@@ -320,19 +583,26 @@ class Body(iRect):
         Args:
             other   (Element or Core or Rect)   : the reference to align against
             align   (Align)                     : the type of alignment to use
+
+        Raises:
+            ReferenceError: If the alignment would make the layout reference itself
+                            (the body is left unchanged)
         """
+        if alignX or alignY:
+            self.__validateConnection(alignagainst) # validate once before applying any connection
         kSize: tuple[bool, bool] = (keepSize, keepSize)
+        fixedGlobal: tuple[bool, bool] = (True, True)
         xalign, xi, yalign, yi = (align.value & 0b11, (align.value & 0b100) >> 2, (align.value & 0b11000) >> 3, (align.value & 0b100000) >> 5)
         if alignX:
             if xi:
-                self.addReferenceConnection(alignagainst, (True, False), (xalign * 0.5, 0.0), (xalign * 0.5, 0.0), offset=offset, keepSize=kSize)
+                self.__applyConnection(alignagainst, (True, False), (xalign * 0.5, 0.0), (xalign * 0.5, 0.0), offset, fixedGlobal, kSize)
             else:
-                self.addReferenceConnection(alignagainst, (True, False), ((2 - xalign) * 0.5, 0.0), (xalign * 0.5, 0.0), offset=(offset[0], offset[1]), keepSize=kSize)
+                self.__applyConnection(alignagainst, (True, False), ((2 - xalign) * 0.5, 0.0), (xalign * 0.5, 0.0), (offset[0], offset[1]), fixedGlobal, kSize)
         if alignY:
             if yi:
-                self.addReferenceConnection(alignagainst, (False, True), (0.0, yalign * 0.5), (0.0, yalign * 0.5), offset=offset, keepSize=kSize)
+                self.__applyConnection(alignagainst, (False, True), (0.0, yalign * 0.5), (0.0, yalign * 0.5), offset, fixedGlobal, kSize)
             else:
-                self.addReferenceConnection(alignagainst, (False, True), (0.0, (2 - yalign) * 0.5), (0.0, yalign * 0.5), offset=(offset[0], offset[1]), keepSize=kSize)
+                self.__applyConnection(alignagainst, (False, True), (0.0, (2 - yalign) * 0.5), (0.0, yalign * 0.5), (offset[0], offset[1]), fixedGlobal, kSize)
 
 
 EventManager.quickSubscribe(Body.getLayoutUpdateEvent(), Body.updateBodys)
@@ -2,4 +2,5 @@ from .addons import Framed, Grouped, Dropdown
 from .interactables import Button, Toggle, Slider, Multiselect, Dropdownselect
 
 from .section import Section
+from .listview import Listview
 from .ui import UI
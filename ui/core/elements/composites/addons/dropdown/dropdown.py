@@ -3,6 +3,7 @@ from typing import Any, override
 from ......display      import Surface
 from ....element        import Element
 from ..addon            import Addon
+from ..grouped          import Grouped
 
 from .dropdowncore         import DropdownCore
 from .dropdowndata         import DropdownData
@@ -29,6 +30,16 @@ class Dropdown(Addon[DropdownCore, DropdownData]):
         self._renderData.alignInner(self)
         self._core.quickSubscribeToToggleState(0, self._renderData.dropdown.setActive, False)
         self._core.quickSubscribeToToggleState(1, self._renderData.dropdown.setActive, True)
+        # the opened dropdown is queued for post-rendering
+        self._core.quickSubscribeToToggleState(0, self._invalidateRender)
+        self._core.quickSubscribeToToggleState(1, self._invalidateRender)
+
+    @override
+    def copy(self) -> 'Dropdown':
+        dropdown: Dropdown = Dropdown(self._core.getInner().copy(), self._renderData.copy(), dropdownActive=self._core.getButtonActive())
+        dropdown._core.copyTriggerEvents(self._core)
+        self._finishCopy(dropdown) # the clone starts collapsed
+        return dropdown
 
     @override
     def setActive(self, active: bool) -> None:
@@ -49,9 +60,20 @@ class Dropdown(Addon[DropdownCore, DropdownData]):
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Dropdown':
+        return Dropdown.fromArgs(args | Dropdown.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        return Grouped.convertArgs(args) | {'triggers': DropdownCore.parseTriggerEvents(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Dropdown':
         inner: list[Element] = args['inner']
-        dpd = Dropdown(inner[0], DropdownData.parseFromArgs(args))
-        dpd._core.adjustFromArgs(args, hasTrigger=False)
+        sizings: list[float] = Dropdown.applyAdjustments([1.0 for _ in inner[1:]], args['sizings'])
+        dpd = Dropdown(inner[0], DropdownData.fromInner(inner[1:], sizings, args['vertical'], args['offset']))
+        dpd._core.addTriggerEvents(args['triggers'])
         return dpd
 
     # -------------------- access-point --------------------
@@ -100,6 +122,7 @@ class Dropdown(Addon[DropdownCore, DropdownData]):
             surface (Surface): the surface the UIElement should be drawn on
         """
         assert self._drawer is not None
+        self._trackRender()
 
         if self._active:
             self._core.getInner().render(surface)
@@ -1,7 +1,6 @@
 from typing import Any, Callable, override
 
-from ......utility      import Parsable
-from ......interaction  import InputEvent, InputManager, Togglable
+from ......interaction  import Togglable
 from ....element    import Element
 from ..addoncore    import AddonCore
 from ..grouped      import Grouped
@@ -19,26 +18,6 @@ class DropdownCore(AddonCore[Element], Togglable):
         self.quickSubscribeToToggleState(0, dpd.setActive, False)
         self.quickSubscribeToToggleState(1, dpd.setActive, True)
 
-    def adjustFromArgs(self, args: dict[str, Any], hasTrigger: bool=True) -> None:
-        for tag, value in args.items():
-            match tag:
-                case 'trigger':
-                    hasTrigger = True
-                    for v in Parsable.parseList(value):
-                        if v.lower() == 'click':
-                            self.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                        else:
-                            self.addTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                case 'globaltrigger' | 'gtrigger' | 'global':
-                    hasTrigger = True
-                    for v in Parsable.parseList(value):
-                        if v.lower() == 'click':
-                            self.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                        else:
-                            self.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-        if not hasTrigger:
-            self.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-
     # -------------------- inner --------------------
 
     @override
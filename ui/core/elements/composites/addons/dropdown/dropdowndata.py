@@ -46,10 +46,28 @@ class DropdownData(AddonData):
                     offset = int(DropdownData.extractNum(v))
                 case 'size' | 'sizes' | 'sizing' | 'sizings':
                     sizings = list(map(DropdownData.parseNum, DropdownData.adjustList(list(map(str, sizings)), DropdownData.parseList(v))))
-        gpd: Grouped = Grouped(list(zip(inner[1:], sizings)), alignVertical=verticalDropdown, offset=offset)
+        return DropdownData.fromInner(inner[1:], sizings, verticalDropdown, offset)
+
+    @staticmethod
+    def fromInner(inner: list[Element], sizings: list[float], verticalDropdown: bool, offset: int) -> 'DropdownData':
+        """
+        fromInner creates the render data of a dropdown opening the given elements.
+
+        Args:
+            inner               (list[Element]) : the elements of the dropdown (without the head)
+            sizings             (list[float])   : the relative sizes of the elements
+            verticalDropdown    (bool)          : if the dropdown opens downwards (else to the right)
+            offset              (int)           : the spacing between the elements
+
+        Returns (DropdownData): the render data
+        """
+        gpd: Grouped = Grouped(list(zip(inner, sizings)), alignVertical=verticalDropdown, offset=offset)
         gpd.setActive(False)
         return DropdownData(gpd, offset, len(sizings), sum(sizings), verticalDropdown)
 
+    def copy(self) -> 'DropdownData':
+        return DropdownData(self.dropdown.copy(), self.offset, self.innercount, self.innersize, self.verticalDropdown)
+
     # -------------------- access-point --------------------
 
     def set(self, args: dict[str, Any], skips: bool) -> bool:
@@ -60,4 +78,4 @@ class DropdownData(AddonData):
 
     @override
     def setZIndex(self, zindex: int) -> None:
-        self.dropdown.setZIndex(zindex+100)
+        self.dropdown.setZIndex(zindex+100) # click priority of the opened dropdown over the elements beneath it
@@ -29,6 +29,12 @@ class Framed(Addon[FramedCore, FramedData]):
         super().__init__(FramedCore(inner, offset=offset), renderData, active)
         self._renderData.alignInner(self)
 
+    @override
+    def copy(self) -> 'Framed':
+        framed: Framed = Framed(self._core.getInner().copy(), self._renderData.copy(), offset=self._core.getOffset())
+        self._finishCopy(framed)
+        return framed
+
     @staticmethod
     @override
     def getMinRequiredChildren() -> int:
@@ -37,9 +43,11 @@ class Framed(Addon[FramedCore, FramedData]):
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Framed':
-        inner: list[Element] = args['inner']
-        style: str = args['fixstyle']
+        return Framed.fromArgs(args | Framed.convertArgs(args))
 
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
         offset: int = 0
         str_bg: str = str(StyledDefault.BACKGROUND)
         str_border: str = str(StyledDefault.BORDER)
@@ -51,7 +59,17 @@ class Framed(Addon[FramedCore, FramedData]):
                     str_bg = v.strip()
                 case 'border':
                     str_border = v.strip()
-        
+        return {'offset': offset, 'background': str_bg, 'border': str_border}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Framed':
+        inner: list[Element] = args['inner']
+        style: str = args['fixstyle']
+        offset: int = args['offset']
+        str_bg: str = args['background']
+        str_border: str = args['border']
+
         pbg: Optional[Element] = Framed.getStyledElement(str_bg, style)
         pborders: tuple[Optional[Element], Optional[Element], Optional[Element], Optional[Element]] =\
                  (Framed.getStyledElement(str_border, style), Framed.getStyledElement(str_border, style),
@@ -131,6 +149,7 @@ class Framed(Addon[FramedCore, FramedData]):
     def render(self, surface: Surface) -> None:
         """
         render renders the UI-Element onto the given surface
+        (through the offscreen cache while nothing inside changes)
 
         Args:
             surface (Surface): the surface the UIElement should be drawn on
@@ -138,12 +157,15 @@ class Framed(Addon[FramedCore, FramedData]):
         assert self._drawer is not None
         
         if self._active:
-            # background
-            self._renderData.fillData.render(surface)
+            self._renderCached(surface, self.__renderContent)
+
+    def __renderContent(self, surface: Surface) -> None:
+        # background
+        self._renderData.fillData.render(surface)
 
-            # inner element
-            self._core.getInner().render(surface)
+        # inner element
+        self._core.getInner().render(surface)
 
-            # outlines
-            for border in self._renderData.borderData:
-                border.render(surface)
+        # outlines
+        for border in self._renderData.borderData:
+            border.render(surface)
@@ -32,11 +32,15 @@ class FramedData(AddonData):
     def parseFromArgs(args: dict[str, Any]) -> 'FramedData':
         return FramedData(Box.parseFromArgs({}), (Box.parseFromArgs({}), Box.parseFromArgs({}), Box.parseFromArgs({}), Box.parseFromArgs({})))
 
+    def copy(self) -> 'FramedData':
+        b0, b1, b2, b3 = self.borderData
+        return FramedData(self.fillData.copy(), (b0.copy(), b1.copy(), b2.copy(), b3.copy()))
+
     @override
     def setZIndex(self, zindex: int) -> None:
-        self.fillData.setZIndex(zindex-1)
+        self.fillData.setZIndex(zindex)
         for brd in self.borderData:
-            brd.setZIndex(zindex+1)
+            brd.setZIndex(zindex)
 
     # -------------------- access-point --------------------
 
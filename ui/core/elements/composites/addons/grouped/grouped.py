@@ -1,4 +1,4 @@
-from typing import Any, override
+from typing import Any, Optional, override
 
 from ......display   import Surface
 from ....element     import Element
@@ -26,6 +26,13 @@ class Grouped(Addon[GroupedCore, GroupedData]):
     def __init__(self, inner: list[tuple[Element, float]], alignVertical: bool=True, offset: int=0, active: bool = True) -> None:
         super().__init__(GroupedCore(inner, alignVertical=alignVertical, offset=offset), GroupedData(), active)
 
+    @override
+    def copy(self) -> 'Grouped':
+        inner: list[tuple[Element, float]] = [(el.copy(), sizing) for el, sizing in zip(self._core.getInner(), self._core.getRelativeSizing())]
+        grouped: Grouped = Grouped(inner, alignVertical=self._core.isVertical(), offset=self._core.getOffset())
+        self._finishCopy(grouped)
+        return grouped
+
     @staticmethod
     @override
     def getMinRequiredChildren() -> int:
@@ -34,10 +41,14 @@ class Grouped(Addon[GroupedCore, GroupedData]):
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Grouped':
-        inner: list[Element] = args['inner']
+        return Grouped.fromArgs(args | Grouped.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
         alignVertical = True
         offset = 0
-        sizings: list[float] = [1.0 for _ in inner]
+        sizings: list[tuple[Optional[int], int | float]] = []
         for arg, v in args.items():
             match arg:
                 case 'vertical' | 'vert':
@@ -47,8 +58,15 @@ class Grouped(Addon[GroupedCore, GroupedData]):
                 case 'offset' | 'spacing':
                     offset = int(Grouped.extractNum(v))
                 case 'size' | 'sizes' | 'sizing' | 'sizings':
-                    sizings = list(map(Grouped.parseNum, Grouped.adjustList(list(map(str, sizings)), Grouped.parseList(v))))
-        return Grouped(list(zip(inner, sizings)), alignVertical=alignVertical, offset=offset)
+                    sizings = Grouped.parseAdjustments(v)
+        return {'vertical': alignVertical, 'offset': offset, 'sizings': sizings}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Grouped':
+        inner: list[Element] = args['inner']
+        sizings: list[float] = Grouped.applyAdjustments([1.0 for _ in inner], args['sizings'])
+        return Grouped(list(zip(inner, sizings)), alignVertical=args['vertical'], offset=args['offset'])
 
     #-------------------- access-point --------------------
 
@@ -80,6 +98,7 @@ class Grouped(Addon[GroupedCore, GroupedData]):
     def render(self, surface: Surface) -> None:
         """
         render renders the UI-Element onto the given surface
+        (through the offscreen cache while nothing inside changes)
 
         Args:
             surface (Surface): the surface the UIElement should be drawn on
@@ -87,5 +106,8 @@ class Grouped(Addon[GroupedCore, GroupedData]):
         assert self._drawer is not None
 
         if self._active:
-            for el in self._core.getInner():
-                el.render(surface)
+            self._renderCached(surface, self.__renderContent)
+
+    def __renderContent(self, surface: Surface) -> None:
+        for el in self._core.getInner():
+            el.render(surface)
@@ -21,6 +21,17 @@ class GroupedCore(AddonCore[list[Element]]):
 
         super().__init__(Rect(), [el[0] for el in inner])
 
+    # -------------------- getter --------------------
+
+    def isVertical(self) -> bool:
+        return self.__alignVertical
+
+    def getOffset(self) -> int:
+        return self.__offset
+
+    def getRelativeSizing(self) -> list[float]:
+        return self.__relativeSizing
+
     # -------------------- inner --------------------
 
     @override
@@ -14,6 +14,9 @@ class GroupedData(AddonData):
     def parseFromArgs(args: dict[str, Any]) -> 'GroupedData':
         return GroupedData()
 
+    def copy(self) -> 'GroupedData':
+        return GroupedData()
+
     @override
     def setZIndex(self, zindex: int) -> None:
         pass
@@ -2,7 +2,6 @@ from typing import Any, Callable, Optional, override
 
 from ......utility      import StyledDefault
 from ......display      import Surface
-from ......interaction  import InputEvent, InputManager
 
 from ....element    import Element
 from ....atoms      import Box
@@ -34,55 +33,55 @@ class Button(Interactable[ButtonCore, ButtonData]):
         super().__init__(ButtonCore(buttonActive), ButtonData(off, on), active)
         
         self._renderData.alignInner(self)
+
+        # the drawn element depends on the pressed-state
+        self._core.quickSubscribeToClick(self._invalidateRender)
+        self._core.quickSubscribeToRelease(self._invalidateRender)
+
+    @override
+    def copy(self) -> 'Button':
+        data: ButtonData = self._renderData.copy()
+        button: Button = Button(data.off, data.on, buttonActive=self._core.getButtonActive())
+        button._core.copyTriggerEvents(self._core)
+        self._finishCopy(button)
+        return button
     
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Button':
+        return Button.fromArgs(args | Button.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        return {'off': args.get('off'), 'triggers': ButtonCore.parseTriggerEvents(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Button':
         inner: list[Element] = args['inner']
         style: str = args['fixstyle']
+        styledOff: Optional[str] = args['off']
         off: Element
         on: Optional[Element]
         bactive: bool = True
         match len(inner):
             case 0:
-                poff: Optional[Element] = Button.getStyledElement(args['off'], style) if 'off' in args else\
+                poff: Optional[Element] = Button.getStyledElement(styledOff, style) if styledOff is not None else\
                                           Button.getStyledElement(StyledDefault.BUTTON_OFF, style)
                 off = Box.parseFromArgs({}) if poff is None else poff
-                on = Button.getStyledElement(args['off'], style) if 'off' in args else\
+                on = Button.getStyledElement(styledOff, style) if styledOff is not None else\
                      Button.getStyledElement(StyledDefault.BUTTON_ON, style)
             case 1:
                 off = inner[0]
-                on = Button.getStyledElement(args['off'], style) if 'off' in args else\
+                on = Button.getStyledElement(styledOff, style) if styledOff is not None else\
                      Button.getStyledElement(StyledDefault.BUTTON_ON, style)
             case _:
                 off = inner[0]
                 on = inner[1]
 
         button: Button = Button(off, on, buttonActive=bactive)
-        hasTrigger: bool = False
-        for tag, value in args.items():
-            match tag:
-                case 'trigger':
-                    hasTrigger = True
-                    for v in Button.parseList(value):
-                        if v.lower() == 'click':
-                            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                            button._core.addReleaseEvent(InputManager.getEvent(InputEvent.LEFTUP))
-                        else:
-                            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                            button._core.addReleaseEvent(InputManager.getEvent(InputEvent(InputEvent.fromStr(value).value+1)))
-                case 'globaltrigger' | 'gtrigger' | 'global':
-                    hasTrigger = True
-                    for v in Button.parseList(value):
-                        if v.lower() == 'click':
-                            button._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                            button._core.addReleaseEvent(InputManager.getEvent(InputEvent.LEFTUP))
-                        else:
-                            button._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                            button._core.addReleaseEvent(InputManager.getEvent(InputEvent(InputEvent.fromStr(value).value+1)))
-        if not hasTrigger:
-            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-            button._core.addReleaseEvent(InputManager.getEvent(InputEvent.LEFTUP))
+        button._core.addTriggerEvents(args['triggers'])
         return button
 
     # -------------------- access-point --------------------
@@ -163,6 +162,7 @@ class Button(Interactable[ButtonCore, ButtonData]):
             surface (Surface): the surface the UIElement should be drawn on
         """
         assert self._drawer is not None
+        self._trackRender()
 
         if self._active:
             if self._renderData.on is not None and self._core.isPressed():
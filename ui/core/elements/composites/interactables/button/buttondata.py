@@ -28,6 +28,9 @@ class ButtonData(InteractableData):
             self.on.align(against)
             self.on.alignSize(against)
     
+    def copy(self) -> 'ButtonData':
+        return ButtonData(self.off.copy(), None if self.on is None else self.on.copy())
+
     def setinner(self, args: dict[str, Any], sets: int = -1, maxDepth: int = -1, skips: list[int]=[0]) -> int:
         s: int = 0
         cs: int
@@ -1,10 +1,10 @@
 from typing import Any, Callable, Optional, override
 
 from ......utility      import StyledDefault
-from ......interaction  import InputEvent, InputManager
 from ......display      import Surface
 from ....element        import Element
 from ....atoms          import Box
+from ...addons          import Dropdown
 from ..interactable     import Interactable
 
 from .dropdownselectcore         import DropdownselectCore
@@ -31,37 +31,40 @@ class Dropdownselect(Interactable[DropdownselectCore, DropdownselectData]):
         super().__init__(core, renderData, active)
         self._renderData.alignInner(self)
 
+        # the drawn head depends on the selected state
+        for state in range(self._core.getNumberOfToggleStates()):
+            self._core.quickSubscribeToToggleState(state, self._invalidateRender)
+
+    @override
+    def copy(self) -> 'Dropdownselect':
+        core: DropdownselectCore = DropdownselectCore([el.copy() for el in self._core.getOptions()], startState=self._core.getCurrentToggleState(),
+                                                      buttonActive=self._core.getButtonActive(), **self._core.getDropdownArgs())
+        dropdownselect: Dropdownselect = Dropdownselect(core, self._renderData.copy())
+        dropdownselect._core.copyTriggerEvents(self._core)
+        self._finishCopy(dropdownselect)
+        return dropdownselect
+
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Dropdownselect':
-        inner: list[Element] = args['inner']
-        style: str = args['fixstyle']
-
-        strOptions: list[str] = Dropdownselect.parseList(args['content'])
-        numOptions: int = len(strOptions)
+        return Dropdownselect.fromArgs(args | Dropdownselect.convertArgs(args))
 
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
         genericHead: str = str(StyledDefault.TEXTBOX)
         genericDropdown: str = str(StyledDefault.BUTTON_TXT)
-        specificHeads: list[Element] = []
-        specificDropdowns: list[Element] = []
+        numSpecificHeads: Optional[int] = None
+        dpdOptions: dict[str, Any] = {}
         for arg, v in args.items():
             match arg.lower():
                 case 'customheads' | 'custheads' | 'specificheads' | 'spheads':
-                    numSpecificHeads: int = int(Dropdownselect.parseNum(v))
-                    specificHeads = inner[:numSpecificHeads]
-                    if numSpecificHeads < len(inner):
-                        specificDropdowns = inner[numSpecificHeads:]
+                    numSpecificHeads = int(Dropdownselect.parseNum(v))
                 case 'generichead' | 'ghead' | 'head':
                     genericHead = str(v).strip()
                 case 'genericdropdown' | 'genericdrop' | 'gdrop' | 'dropdown' | 'drop':
                     genericDropdown = str(v).strip()
-        if not len(specificHeads) and not len(specificDropdowns):
-            specificHeads = inner
-        numOptions += len(specificDropdowns)
 
-        dpdOptions: dict[str, Any] = {}
-        for arg, v in args.items():
-            match arg.lower():
                 case 'vertical' | 'vert':
                     dpdOptions['vert'] = v
                 case 'horizontal' | 'hor':
@@ -70,6 +73,31 @@ class Dropdownselect(Interactable[DropdownselectCore, DropdownselectData]):
                     dpdOptions['offset'] = v
                 case 'size' | 'sizes' | 'sizing' | 'sizings':
                     dpdOptions['size'] = v
+        return {'options': Dropdownselect.parseList(args['content']), 'specificHeads': numSpecificHeads,
+                'genericHead': genericHead, 'genericDropdown': genericDropdown,
+                'dropdown': Dropdown.convertArgs(dpdOptions), 'triggers': DropdownselectCore.parseTriggerEvents(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Dropdownselect':
+        inner: list[Element] = args['inner']
+        style: str = args['fixstyle']
+
+        strOptions: list[str] = args['options']
+        numOptions: int = len(strOptions)
+
+        genericHead: str = args['genericHead']
+        genericDropdown: str = args['genericDropdown']
+        specificHeads: list[Element] = []
+        specificDropdowns: list[Element] = []
+        numSpecificHeads: Optional[int] = args['specificHeads']
+        if numSpecificHeads is not None:
+            specificHeads = inner[:numSpecificHeads]
+            if numSpecificHeads < len(inner):
+                specificDropdowns = inner[numSpecificHeads:]
+        if not len(specificHeads) and not len(specificDropdowns):
+            specificHeads = inner
+        numOptions += len(specificDropdowns)
 
         startHead: Optional[Element] = Dropdownselect.getStyledElement(genericHead, style)
         startHead.set({'content':'SELECT'}) if startHead is not None else None
@@ -95,27 +123,8 @@ class Dropdownselect(Interactable[DropdownselectCore, DropdownselectData]):
                 drops.append(gdrop)
                 optidx += 1
 
-        button = Dropdownselect(DropdownselectCore(drops, **dpdOptions), DropdownselectData(heads))
-
-        hasTrigger: bool = False
-        for tag, value in args.items():
-            match tag:
-                case 'trigger':
-                    hasTrigger = True
-                    for v in Dropdownselect.parseList(value):
-                        if v.lower() == 'click':
-                            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                        else:
-                            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                case 'globaltrigger' | 'gtrigger' | 'global':
-                    hasTrigger = True
-                    for v in Dropdownselect.parseList(value):
-                        if v.lower() == 'click':
-                            button._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                        else:
-                            button._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-        if not hasTrigger:
-            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
+        button = Dropdownselect(DropdownselectCore(drops, **args['dropdown']), DropdownselectData(heads))
+        button._core.addTriggerEvents(args['triggers'])
         return button
 
     @override
@@ -201,6 +210,7 @@ class Dropdownselect(Interactable[DropdownselectCore, DropdownselectData]):
             surface (Surface): the surface the UIElement should be drawn on
         """
         assert self._drawer is not None
+        self._trackRender()
 
         if self.isActive():
             self._core.getDropdown().render(surface)
@@ -1,6 +1,6 @@
-from typing import Any, override
+from typing import Any, Optional, override
 
-from ......utility      import Rect, Parsable
+from ......utility      import Rect
 from ......interaction  import Togglable, InputEvent, InputManager
 from ....element        import Element
 from ....atoms          import Box
@@ -13,11 +13,22 @@ class DropdownselectCore(InteractableCore, Togglable):
     """
     # -------------------- setup --------------------
     __dropdown: Dropdown
+    __options: list[Element]
+    __dropdownArgs: dict[str, Any]
 
     def __init__(self, opts: list[Element], startState: int=0, buttonActive: bool=True, **dpdkwargs) -> None:
+        """
+        Args:
+            opts            (list[Element]) : the elements of the dropdown
+            startState      (int)           : the selected option (0 = none)
+            buttonActive    (bool)          : if the element can be clicked
+            dpdkwargs                       : the converted arguments of the dropdown (see Dropdown.convertArgs)
+        """
         InteractableCore.__init__(self, Rect())
         Togglable.__init__(self, numberOfStates=len(opts)+1, startState=startState, buttonActive=buttonActive)
 
+        self.__options = list(opts)
+        self.__dropdownArgs = dict(dpdkwargs)
         self.__innerSetup(opts, **dpdkwargs)
 
     def __innerSetup(self, inner: list[Element], **kwargs) -> None:
@@ -31,35 +42,30 @@ class DropdownselectCore(InteractableCore, Togglable):
                 el.set({'quickSubscribeToClick':(self._onCustomTrigger, [lambda _, k=nr+1: k])})
 
         inner.insert(0, Box.parseFromArgs({}))
-        kwargs['inner'] = inner
-        self.__dropdown = Dropdown.parseFromArgs(kwargs)
+        self.__dropdown = Dropdown.fromArgs(kwargs | {'inner': inner})
 
         self.__dropdown.set({'removeTriggerEvent':InputManager.getEvent(InputEvent.LEFTDOWN)}, 1)
         self.__dropdown.set({'addGlobalTriggerEvent':self._onclick}, 1)
 
         self.__dropdown.align(self)
         self.__dropdown.alignSize(self)
-        
-        hasTrigger: bool = False
-        for tag, value in kwargs.items():
-            match tag:
-                case 'trigger':
-                    hasTrigger = True
-                    for v in Parsable.parseList(value):
-                        event: str = ''
-                        if v.lower() == 'click':
-                            event = InputManager.getEvent(InputEvent.LEFTDOWN)
-                        else:
-                            event = InputManager.getEvent(InputEvent.fromStr(v))
-                        self.__dropdown.set({'addTriggerEvent':event}, 1)
-        if not hasTrigger:
-            self.__dropdown.set({'addTriggerEvent':InputManager.getEvent(InputEvent.LEFTDOWN)}, 1)
+
+        triggers: Optional[list[tuple[bool, InputEvent]]] = kwargs['triggers']
+        for isGlobal, event in [(False, InputEvent.LEFTDOWN)] if triggers is None else triggers:
+            if not isGlobal:
+                self.__dropdown.set({'addTriggerEvent':InputManager.getEvent(event)}, 1)
 
     # -------------------- getter --------------------
 
     def getDropdown(self) -> Dropdown:
         return self.__dropdown
 
+    def getOptions(self) -> list[Element]:
+        return self.__options
+
+    def getDropdownArgs(self) -> dict[str, Any]:
+        return self.__dropdownArgs
+
     @override
     def getInnerSizing(self, elSize: tuple[int, int], args: dict[str, Any]) -> tuple[int, int]:
         return elSize
@@ -73,21 +79,29 @@ class DropdownselectCore(InteractableCore, Togglable):
     @override
     def addTriggerEvent(self, event: str) -> bool:
         self.__dropdown.set({'addTriggerEvent':event})
+        if event not in self._triggerEvents:
+            self._triggerEvents.append(event)
         return True
 
     @override
     def removeTriggerEvent(self, event: str) -> bool:
         self.__dropdown.set({'removeTriggerEvent':event})
+        if event in self._triggerEvents:
+            self._triggerEvents.remove(event)
         return True
 
     @override
     def addGlobalTriggerEvent(self, event: str) -> bool:
         self.__dropdown.set({'addGlobalTriggerEvent':event})
+        if event not in self._globalTriggerEvents:
+            self._globalTriggerEvents.append(event)
         return True
 
     @override
     def removeGlobalTriggerEvent(self, event: str) -> bool:
         self.__dropdown.set({'removeGlobalTriggerEvent':event})
+        if event in self._globalTriggerEvents:
+            self._globalTriggerEvents.remove(event)
         return True
 
     # -------------------- active-state --------------------
@@ -17,6 +17,9 @@ class DropdownselectData(InteractableData):
             el.align(against)
             el.alignSize(against)
 
+    def copy(self) -> 'DropdownselectData':
+        return DropdownselectData([el.copy() for el in self.heads])
+
     def setinner(self, args: dict[str, Any], sets: int=-1, maxDepth: int=-1, skips: list[int]=[0]) -> int:
         s: int = 0
         cs: int
@@ -1,4 +1,4 @@
-from typing import Any, override
+from typing import Any, Optional, override
 
 from ......display  import Surface
 from ....element    import Element
@@ -28,14 +28,28 @@ class Multiselect(Interactable[MultiselectCore, MultiselectData]):
     def __init__(self, core: MultiselectCore, renderData: MultiselectData, active: bool = True) -> None:
         super().__init__(core, renderData, active)
         renderData.alignInner(self)
+
+    @override
+    def copy(self) -> 'Multiselect':
+        data: MultiselectData = self._renderData.copy()
+        core: MultiselectCore = MultiselectCore(data.group.getCore().getInner(), startState=self._core.getState(),
+                                                restriction=self._core.getRestriction(), buttonActive=self._core.getButtonActive())
+        multiselect: Multiselect = Multiselect(core, data)
+        multiselect._core.copyTriggerEvents(self._core)
+        self._finishCopy(multiselect)
+        return multiselect
     
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Multiselect':
-        inner: list[Element] = args['inner']
+        return Multiselect.fromArgs(args | Multiselect.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
         gpdargs: dict[str, Any] = {}
         startState: int = 0
-        limit: int = len(args['inner'])
+        limit: Optional[int] = None
         for arg, v in args.items():
             match arg.lower():
                 case 'vertical' | 'vert':
@@ -51,9 +65,15 @@ class Multiselect(Interactable[MultiselectCore, MultiselectData]):
                     startState = int(Multiselect.extractNum(v))
                 case 'max' | 'restr' | 'limit':
                     limit = int(Multiselect.extractNum(v))
-        gpdargs['inner'] = inner
-        data = MultiselectData(Grouped.parseFromArgs(gpdargs))
-        core = MultiselectCore(inner, startState=startState, restriction=lambda x, m=len(args['inner']), l=limit: 2**m-1 if bin(x)[2:].count('1') < l else x)
+        return {'group': Grouped.convertArgs(gpdargs), 'start': startState, 'limit': limit}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Multiselect':
+        inner: list[Element] = args['inner']
+        limit: int = len(inner) if args['limit'] is None else args['limit']
+        data = MultiselectData(Grouped.fromArgs(args['group'] | {'inner': inner}))
+        core = MultiselectCore(inner, startState=args['start'], restriction=lambda x, m=len(inner), l=limit: 2**m-1 if bin(x)[2:].count('1') < l else x)
         return Multiselect(core, data)
 
     @override
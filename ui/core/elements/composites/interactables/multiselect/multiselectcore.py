@@ -65,6 +65,9 @@ class MultiselectCore(InteractableCore, Togglable):
     def getState(self) -> int:
         return self._currentState
 
+    def getRestriction(self) -> Callable[[int], int]:
+        return self.__restriction
+
     def getSelectorState(self, selector: int) -> bool:
         return bool(self._currentState & (1 << selector))
 
@@ -77,6 +80,7 @@ class MultiselectCore(InteractableCore, Togglable):
     @override
     def setButtonActive(self, buttonActive: bool) -> None:
         self._buttonActive = buttonActive
+        self._syncHitGrid()
         if buttonActive:
             self.__applyRestriction()
         else:
@@ -2,7 +2,6 @@ from typing import Any, Callable, override
 
 from ......utility  import Rect
 from ......display  import Surface
-from ......interaction  import InputEvent, InputManager
 from ..interactable import Interactable
 
 from .slidercore    import SliderCore
@@ -31,35 +30,37 @@ class Slider(Interactable[SliderCore, SliderData]):
 
         super().__init__(SliderCore(sliderStartState=sliderStart, horizontalSlider=horizontalSlider, sliderActive=sliderActive), renderData, active)
         self._renderData.alignInner(self, horizontalSlider)
+
+        # the slider-state is applied to the layout on render
+        self._core.quickSubscribeToHold(self.__onSliderHold)
+
+    def __onSliderHold(self) -> None:
+        if self._core.getSliderState() != self.__prevRenderState:
+            self._invalidateRender()
+
+    @override
+    def copy(self) -> 'Slider':
+        slider: Slider = Slider(self._renderData.copy(), sliderStart=self._core.getSliderState(), horizontalSlider=self._core.isHorizontalSlider(),
+                                sliderActive=self._core.getButtonActive())
+        slider._core.copyTriggerEvents(self._core)
+        self._finishCopy(slider)
+        return slider
     
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Slider':
+        return Slider.fromArgs(args | Slider.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        return {'triggers': SliderCore.parseTriggerEvents(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Slider':
         slider: Slider = Slider(SliderData.parseFromArgs(args))
-        hasTrigger: bool = False
-        for tag, value in args.items():
-            match tag:
-                case 'trigger':
-                    hasTrigger = True
-                    for v in Slider.parseList(value):
-                        if v.lower() == 'click':
-                            slider._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                            slider._core.addReleaseEvent(InputManager.getEvent(InputEvent.LEFTUP))
-                        else:
-                            slider._core.addTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                            slider._core.addReleaseEvent(InputManager.getEvent(InputEvent(InputEvent.fromStr(value).value+1)))
-                case 'globaltrigger' | 'gtrigger' | 'global':
-                    hasTrigger = True
-                    for v in Slider.parseList(value):
-                        if v.lower() == 'click':
-                            slider._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                            slider._core.addReleaseEvent(InputManager.getEvent(InputEvent.LEFTUP))
-                        else:
-                            slider._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                            slider._core.addReleaseEvent(InputManager.getEvent(InputEvent(InputEvent.fromStr(value).value+1)))
-        if not hasTrigger:
-            slider._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-            slider._core.addReleaseEvent(InputManager.getEvent(InputEvent.LEFTUP))
+        slider._core.addTriggerEvents(args['triggers'])
         return slider
 
     # -------------------- access-point --------------------
@@ -129,6 +130,7 @@ class Slider(Interactable[SliderCore, SliderData]):
             surface (Surface): the surface the UIElement should be drawn on
         """
         assert self._drawer is not None
+        self._trackRender()
 
         if not self._active:
             return
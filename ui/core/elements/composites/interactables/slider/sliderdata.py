@@ -24,6 +24,9 @@ class SliderData(InteractableData):
             self.fillData.alignSize(against, alignY=False)
             self.lineData.align(against, AlignType.iTiM)
 
+    def copy(self) -> 'SliderData':
+        return SliderData(self.fillData.copy(), self.lineData.copy())
+
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'SliderData':
@@ -2,7 +2,6 @@ from typing import Any, Callable, Optional, override
 
 from ......utility  import StyledDefault
 from ......display  import Surface
-from ......interaction  import InputEvent, InputManager
 from ....element    import Element
 from ....atoms      import Box
 from ..interactable import Interactable
@@ -30,13 +29,34 @@ class Toggle(Interactable[ToggleCore, ToggleData]):
         super().__init__(ToggleCore(len(renderData.stateElements), startState=startState, buttonActive=toggleActive), renderData, active)
         renderData.alignInner(self)
         self._core.quickSubscribeToClick(self.changeState)
+
+    @override
+    def copy(self) -> 'Toggle':
+        toggle: Toggle = Toggle(self._renderData.copy(), startState=self._core.getCurrentToggleState(), toggleActive=self._core.getButtonActive())
+        toggle._core.copyTriggerEvents(self._core)
+        self._finishCopy(toggle)
+        return toggle
     
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Toggle':
+        return Toggle.fromArgs(args | Toggle.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        rawContent: str = args.get('content', '').strip()
+        return {'typ': args['typ'], 'off': args.get('off'), 'textbox': args.get('textbox'),
+                'options': Toggle.parseList(rawContent) if len(rawContent) > 0 else [],
+                'triggers': ToggleCore.parseTriggerEvents(args)}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Toggle':
         typ: str = args['typ']
         inner: list[Element] = args['inner']
         style: str = args['fixstyle']
+        styledOff: Optional[str] = args['off']
         data: ToggleData
         match typ:
             case 'checkbox':
@@ -44,15 +64,15 @@ class Toggle(Interactable[ToggleCore, ToggleData]):
                 on: Element
                 match len(inner):
                     case 0:
-                        poff: Optional[Element] = Toggle.getStyledElement(args['off'], style) if 'off' in args else\
+                        poff: Optional[Element] = Toggle.getStyledElement(styledOff, style) if styledOff is not None else\
                                                   Toggle.getStyledElement(StyledDefault.CHECKBOX_OFF, style)
                         off = Box.parseFromArgs({}) if poff is None else poff
-                        pon: Optional[Element] = Toggle.getStyledElement(args['off'], style) if 'off' in args else\
+                        pon: Optional[Element] = Toggle.getStyledElement(styledOff, style) if styledOff is not None else\
                                                  Toggle.getStyledElement(StyledDefault.CHECKBOX_ON, style)
                         on = Box.parseFromArgs({}) if pon is None else pon
                     case 1:
                         off = inner[0]
-                        pon: Optional[Element] = Toggle.getStyledElement(args['off'], style) if 'off' in args else\
+                        pon: Optional[Element] = Toggle.getStyledElement(styledOff, style) if styledOff is not None else\
                                                  Toggle.getStyledElement(StyledDefault.CHECKBOX_ON, style)
                         on = Box.parseFromArgs({}) if pon is None else pon
                     case _:
@@ -60,40 +80,19 @@ class Toggle(Interactable[ToggleCore, ToggleData]):
                         on = inner[1]
                 data = ToggleData([off, on])
             case _:
-                rawContent: str = args['content'].strip()
-                if len(rawContent) > 0:
-                    for opt in Toggle.parseList(rawContent):
-                        newEl: Optional[Element] = Toggle.getStyledElement(args['textbox'], style) if 'textbox' in args else\
-                                                   Toggle.getStyledElement(StyledDefault.TEXTBOX, style)
-                        if newEl is not None:
-                            newEl.set({'content':opt}, sets=1)
-                            inner.append(newEl)
+                for opt in args['options']:
+                    newEl: Optional[Element] = Toggle.getStyledElement(args['textbox'], style) if args['textbox'] is not None else\
+                                               Toggle.getStyledElement(StyledDefault.TEXTBOX, style)
+                    if newEl is not None:
+                        newEl.set({'content':opt}, sets=1)
+                        inner.append(newEl)
                 data = ToggleData(inner)
         for el in data.stateElements[1:]:
             el.setActive(False)
 
         bactive: bool = True
         button: Toggle = Toggle(data, toggleActive=bactive)
-        
-        hasTrigger: bool = False
-        for tag, value in args.items():
-            match tag:
-                case 'trigger':
-                    hasTrigger = True
-                    for v in Toggle.parseList(value):
-                        if v.lower() == 'click':
-                            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                        else:
-                            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-                case 'globaltrigger' | 'gtrigger' | 'global':
-                    hasTrigger = True
-                    for v in Toggle.parseList(value):
-                        if v.lower() == 'click':
-                            button._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
-                        else:
-                            button._core.addGlobalTriggerEvent(InputManager.getEvent(InputEvent.fromStr(value)))
-        if not hasTrigger:
-            button._core.addTriggerEvent(InputManager.getEvent(InputEvent.LEFTDOWN))
+        button._core.addTriggerEvents(args['triggers'])
         return button
 
     # -------------------- state-change --------------------
@@ -17,6 +17,9 @@ class ToggleData(InteractableData):
             el.align(against)
             el.alignSize(against)
 
+    def copy(self) -> 'ToggleData':
+        return ToggleData([el.copy() for el in self.stateElements])
+
     def setinner(self, args: dict[str, Any], sets: int = -1, maxDepth: int = -1, skips: list[int]=[0]) -> int:
         s: int = 0
         cs: int
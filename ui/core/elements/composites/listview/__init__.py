@@ -0,0 +1 @@
+from .listview import Listview
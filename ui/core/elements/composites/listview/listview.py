@@ -0,0 +1,144 @@
+from typing import Any, Callable, Optional, Sequence, override
+
+from .....utility import StyledDefault
+from .....display   import Surface
+from ...element     import Element
+from ...atoms       import Text
+
+from .listviewcore        import ListviewCore, RowBinder
+from .listviewdata        import ListviewData
+
+class Listview(Element[ListviewCore, ListviewData]):
+    """A virtualized list element showing a window of rows onto a (large) sequence of items.
+
+    The Listview only creates a fixed amount of row elements and recycles them while
+    scrolling, so showing a sequence of 100k items costs as much as showing a full page:
+    - Rows are created by a row factory (default: the styled text) and aligned once
+    - Items are taken from a sequence provider (anything supporting len() and indexing)
+    - A binder shows an item on a row (default: sets the string of the item as content)
+    - Scrolling by mouse wheel or up/down arrows while hovered (or scrollTo/scrollBy)
+
+    After the items of the provider changed, refresh has to be called to rebind the rows.
+    """
+
+    # -------------------- creation --------------------
+
+    def __init__(self, provider: Sequence[Any], rowFactory: Optional[Callable[[], Element]]=None, rows: int=10,
+                 binder: Optional[RowBinder]=None, scrollStep: int=1, offset: int=0, active: bool = True) -> None:
+        if rowFactory is None:
+            rowFactory = Listview.defaultRow
+        super().__init__(ListviewCore(rowFactory, provider, rows=rows, binder=binder, scrollStep=scrollStep, offset=offset),
+                         ListviewData(), active)
+
+    @staticmethod
+    def defaultRow() -> Element:
+        """
+        defaultRow creates a row of the default style (or a plain text if the style has none).
+
+        Returns (Element): the new row
+        """
+        row: Optional[Element] = Listview.getStyledElement(StyledDefault.TEXT)
+        return Text.parseFromArgs({'content': ''}) if row is None else row
+
+    @override
+    def copy(self) -> 'Listview':
+        listview: Listview = Listview(self._core.getProvider(), rowFactory=self._core.getRowFactory(), rows=len(self._core.getRows()),
+                                      binder=self._core.getBinder(), scrollStep=self._core.getScrollStep(), offset=self._core.getOffset())
+        listview._core.scrollTo(self._core.getFirstIndex())
+        self._finishCopy(listview)
+        return listview
+
+    @staticmethod
+    @override
+    def getMinRequiredChildren() -> int:
+        return 0
+
+    @staticmethod
+    @override
+    def parseFromArgs(args: dict[str, Any]) -> 'Listview':
+        return Listview.fromArgs(args | Listview.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        items: list[str] = Listview.parseList(args['content']) if args.get('content') else []
+        rows: int = 10
+        scrollStep: int = 1
+        offset: int = 0
+        for arg, v in args.items():
+            match arg.lower():
+                case 'rows' | 'rowcount' | 'visible':
+                    rows = int(Listview.extractNum(v))
+                case 'step' | 'scrollstep':
+                    scrollStep = int(Listview.extractNum(v))
+                case 'offset' | 'spacing':
+                    offset = int(Listview.extractNum(v))
+        return {'items': items, 'rows': rows, 'step': scrollStep, 'offset': offset}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Listview':
+        inner: list[Element] = args.get('inner', [])
+        # the first inner element is used as template of the rows
+        rowFactory: Optional[Callable[[], Element]] = inner[0].copy if len(inner) else None
+        return Listview(list(args['items']), rowFactory=rowFactory, rows=args['rows'], scrollStep=args['step'], offset=args['offset'])
+
+    # -------------------- active-state --------------------
+
+    @override
+    def setActive(self, active: bool) -> None:
+        super().setActive(active)
+        self._core.setActive(active)
+
+    @override
+    def toggleActive(self) -> bool:
+        bb = super().toggleActive()
+        self._core.setActive(bb)
+        return bb
+
+    # -------------------- access-point --------------------
+
+    @override
+    def _set(self, args: dict[str, Any], sets: int = -1, maxDepth: int = -1, skips: bool = False) -> bool:
+        s: bool = super()._set(args, sets, maxDepth, skips)
+        for tag, value in args.items():
+            match tag.lower():
+                case 'scrollto' | 'scroll':
+                    s = True
+                    if not skips:
+                        Listview._validateType(value, int, 'scrollTo')
+                        self._core.scrollTo(value)
+                case 'refresh':
+                    s = True
+                    if not skips:
+                        self._core.refresh()
+        return s
+
+    @override
+    def set(self, args: dict[str, Any], sets: int = -1, maxDepth: int = -1, skips: list[int] = [0]) -> int:
+        return int(self._set(args, sets, maxDepth, bool(skips[0])))
+
+    # -------------------- rendering --------------------
+
+    @override
+    def setZIndex(self, zindex: int) -> None:
+        super().setZIndex(zindex)
+        self._core.setInnerZIndex(zindex)
+
+    @override
+    def render(self, surface: Surface) -> None:
+        """
+        render renders the UI-Element onto the given surface
+        (through the offscreen cache while no shown row changes)
+
+        Args:
+            surface (Surface): the surface the UIElement should be drawn on
+        """
+        assert self._drawer is not None
+
+        if self._active:
+            self._renderCached(surface, self.__renderContent)
+
+    def __renderContent(self, surface: Surface) -> None:
+        for row in self._core.getVisibleRows():
+            row.render(surface)
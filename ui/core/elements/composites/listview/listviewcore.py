@@ -0,0 +1,210 @@
+from typing import Any, Callable, Sequence, override
+
+from .....utility   import Rect
+from .....interaction   import InputEvent, InputManager
+from ...element     import Element
+from ...elementcore import ElementCore
+
+RowBinder = Callable[[Element, Any], None] # shows an item of the provider on a row element
+
+class ListviewCore(ElementCore):
+    """Core implementation for the Listview composite managing the recycled rows.
+
+    Only a fixed amount of row elements is created (by the row factory). They are aligned
+    once as equally high slots of the list. Scrolling does not change the layout: the rows
+    are rebound (see RowBinder) to the items of the provider starting at the first visible
+    index, rows without an item are deactivated.
+
+    The provider can be any sequence (supporting len() and indexing), so the items can also
+    be created on access (e.g. the lines of a large log file). The cost of scrolling and
+    the memory of the list therefore only depend on the amount of rows.
+    """
+    _buttonActive: bool
+
+    __provider: Sequence[Any]
+    __rowFactory: Callable[[], Element]
+    __binder: RowBinder
+
+    __rows: list[Element]
+    __boundIndices: list[int]   # index of the item shown by every row (-1 if none)
+    __firstIndex: int
+    __scrollStep: int
+    __offset: int
+
+    def __init__(self, rowFactory: Callable[[], Element], provider: Sequence[Any], rows: int=10,
+                 binder: RowBinder | None=None, scrollStep: int=1, offset: int=0) -> None:
+        if not isinstance(rows, int):
+            raise TypeError(f'rows must be int, got {type(rows)}')
+        if rows < 1:
+            raise ValueError(f'rows must be at least 1, got {rows}')
+        if not isinstance(scrollStep, int):
+            raise TypeError(f'scrollStep must be int, got {type(scrollStep)}')
+        if scrollStep < 1:
+            raise ValueError(f'scrollStep must be at least 1, got {scrollStep}')
+        ElementCore.__init__(self, Rect())
+        self._buttonActive = True
+
+        self.__provider = provider
+        self.__rowFactory = rowFactory
+        self.__binder = ListviewCore.defaultBinder if binder is None else binder
+        self.__firstIndex = 0
+        self.__scrollStep = scrollStep
+        self.__offset = offset
+
+        self.__rows = []
+        self.__boundIndices = []
+        for i in range(rows):
+            row: Element = rowFactory()
+            if not isinstance(row, Element):
+                raise TypeError(f'row factory must return an Element, got {type(row)}')
+            row.setActive(False)
+            row.alignpoint(self, otherPoint=(0, i/rows), offset=(0, int(0.5*offset)))
+            row.alignSize(self, relativeAlign=(1, 1/rows), absoluteOffset=(0, -offset))
+            self.__rows.append(row)
+            self.__boundIndices.append(-1)
+        self.__bind()
+
+        InputManager.quickSubscribe(InputEvent.WHEELUP, self.scrollUp)
+        InputManager.quickSubscribe(InputEvent.WHEELDOWN, self.scrollDown)
+        InputManager.quickSubscribe(InputEvent.ARR_UP, self.scrollUp)
+        InputManager.quickSubscribe(InputEvent.ARR_DOWN, self.scrollDown)
+
+    @staticmethod
+    def defaultBinder(row: Element, item: Any) -> None:
+        """
+        defaultBinder shows the string of the item as content of the row.
+
+        Args:
+            row     (Element)   : the row to show the item on
+            item    (Any)       : the item to show
+        """
+        row.set({'content': str(item)})
+
+    # -------------------- getter --------------------
+
+    @override
+    def getInnerSizing(self, elSize: tuple[int, int], args: dict[str, Any]) -> tuple[int, int]:
+        return elSize
+
+    def getProvider(self) -> Sequence[Any]:
+        return self.__provider
+
+    def getRowFactory(self) -> Callable[[], Element]:
+        return self.__rowFactory
+
+    def getBinder(self) -> RowBinder:
+        return self.__binder
+
+    def getRows(self) -> list[Element]:
+        return self.__rows
+
+    def getVisibleRows(self) -> list[Element]:
+        """
+        getVisibleRows returns the rows currently showing an item.
+
+        Returns (list[Element]): the rows showing an item
+        """
+        return [row for row, idx in zip(self.__rows, self.__boundIndices) if idx >= 0]
+
+    def getFirstIndex(self) -> int:
+        return self.__firstIndex
+
+    def getMaxFirstIndex(self) -> int:
+        return max(0, len(self.__provider) - len(self.__rows))
+
+    def getScrollStep(self) -> int:
+        return self.__scrollStep
+
+    def getOffset(self) -> int:
+        return self.__offset
+
+    # -------------------- setter --------------------
+
+    def setProvider(self, provider: Sequence[Any]) -> None:
+        """
+        setProvider replaces the items of the list.
+
+        Args:
+            provider (Sequence[Any]): the new items
+        """
+        self.__provider = provider
+        self.refresh()
+
+    def setInnerZIndex(self, zindex: int) -> None:
+        for row in self.__rows:
+            row.setZIndex(zindex)
+
+    def refresh(self) -> None:
+        """
+        refresh rebinds all rows (e.g. after the items of the provider changed).
+        """
+        self.__firstIndex = max(0, min(self.__firstIndex, self.getMaxFirstIndex()))
+        self.__bind(force=True)
+
+    def scrollTo(self, index: int) -> bool:
+        """
+        scrollTo scrolls the list, so that the item at the given index is shown in the first row
+        (as far as possible).
+
+        Args:
+            index (int): the index of the first item to show
+
+        Returns (bool): if the list scrolled
+        """
+        index = max(0, min(int(index), self.getMaxFirstIndex()))
+        if index == self.__firstIndex:
+            return False
+        self.__firstIndex = index
+        self.__bind()
+        return True
+
+    def scrollBy(self, rows: int) -> bool:
+        """
+        scrollBy scrolls the list by the given amount of rows.
+
+        Args:
+            rows (int): the amount of rows to scroll (negative scrolls up)
+
+        Returns (bool): if the list scrolled
+        """
+        return self.scrollTo(self.__firstIndex + rows)
+
+    def scrollUp(self) -> None:
+        if self._buttonActive:
+            if self.getRect().collidepoint(InputManager.getMousePosition()):
+                self.scrollBy(-self.__scrollStep)
+
+    def scrollDown(self) -> None:
+        if self._buttonActive:
+            if self.getRect().collidepoint(InputManager.getMousePosition()):
+                self.scrollBy(self.__scrollStep)
+
+    # -------------------- binding --------------------
+
+    def __bind(self, force: bool=False) -> None:
+        """
+        __bind shows the items starting at the first index on the rows.
+
+        Args:
+            force (bool): if rows already showing the right index should be rebound
+        """
+        amount: int = len(self.__provider)
+        for i, row in enumerate(self.__rows):
+            idx: int = self.__firstIndex + i
+            if idx >= amount:
+                if self.__boundIndices[i] >= 0:
+                    self.__boundIndices[i] = -1
+                    row.setActive(False)
+                continue
+            if force or self.__boundIndices[i] != idx:
+                self.__binder(row, self.__provider[idx])
+                if self.__boundIndices[i] < 0:
+                    row.setActive(self._buttonActive)
+                self.__boundIndices[i] = idx
+
+    # -------------------- active-state --------------------
+
+    def setActive(self, active: bool) -> None:
+        self._buttonActive = active
+        for row, idx in zip(self.__rows, self.__boundIndices):
+            row.setActive(active and idx >= 0)
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Any, override
+
+from ...elementdata     import ElementData
+
+@dataclass
+class ListviewData(ElementData):
+    """Storage class for Listview element render information.
+
+    The rows of a Listview are rendered by themselves, so this class currently carries no
+    render attributes. It exists to keep the Listview in line with the other composites.
+    """
+    def copy(self) -> 'ListviewData':
+        return ListviewData()
+
+    @staticmethod
+    @override
+    def parseFromArgs(args: dict[str, Any]) -> 'ListviewData':
+        return ListviewData()
@@ -5,7 +5,7 @@ from .....display   import Surface
 from ...element     import Element
 from ...atoms       import Box
 
-from .sectioncore         import SectionCore
+from .sectioncore         import SectionCore, SectionEntry
 from .sectiondata         import SectionData
 
 class Section(Element[SectionCore, SectionData]):
@@ -18,23 +18,45 @@ class Section(Element[SectionCore, SectionData]):
     - Navigation buttons for section traversal
     - Section separators between header/content/footer
     - Keyboard navigation (left/right arrows)
+    - Lazy pages (inner factories are only built when their page is first shown)
     
     The content is automatically split into sections based on the innerLimit parameter,
     with navigation controls appearing when multiple sections are created.
+
+    Inner entries can be factories (callables returning an Element), which are only called
+    when their page is shown for the first time. With maxLoadedPages > 0 only the most
+    recently shown pages stay aligned into the layout.
     """
 
     # -------------------- creation --------------------
 
-    def __init__(self, header: Optional[tuple[Element, float]], footer: Optional[tuple[Element, float]], inner: list[tuple[Element, float]],
-                 separators: tuple[Optional[Element], Optional[Element]]=(None, None), innerLimit: float=5.0, offset: int=0, active: bool = True) -> None:
+    def __init__(self, header: Optional[tuple[Element, float]], footer: Optional[tuple[Element, float]], inner: list[tuple[SectionEntry, float]],
+                 separators: tuple[Optional[Element], Optional[Element]]=(None, None), innerLimit: float=5.0, offset: int=0,
+                 maxLoadedPages: int=0, active: bool = True) -> None:
         btn1: Optional[Element] = Section.getStyledElement(StyledDefault.BUTTON_TXT)
         btn2: Optional[Element] = Section.getStyledElement(StyledDefault.BUTTON_TXT)
         if btn1 is None:
             btn1 = Box.parseFromArgs({})
         if btn2 is None:
             btn2 = Box.parseFromArgs({})
-        super().__init__(SectionCore(header, footer, (btn1, btn2), inner, separators=separators, innerLimit=innerLimit, offset=offset), SectionData(), active)
+        super().__init__(SectionCore(header, footer, (btn1, btn2), inner, separators=separators, innerLimit=innerLimit, offset=offset,
+                                     maxLoadedPages=maxLoadedPages), SectionData(), active)
  
+    @override
+    def copy(self) -> 'Section':
+        header: Optional[Element] = self._core.getHeader()
+        footer: Optional[Element] = self._core.getFooter()
+        headerSizing, footerSizing, _ = self._core.getInnerSizings()
+        separators: tuple[Optional[Element], Optional[Element]] = self._core.getSeparators()
+        section: Section = Section(None if header is None or headerSizing is None else (header.copy(), headerSizing),
+                                   None if footer is None or footerSizing is None else (footer.copy(), footerSizing),
+                                   [(entry.copy() if isinstance(entry, Element) else entry, sizing) for entry, sizing in self._core.getEntries()],
+                                   separators=(None if separators[0] is None else separators[0].copy(), None if separators[1] is None else separators[1].copy()),
+                                   innerLimit=self._core.getInnerLimit(), offset=self._core.getOffset(), maxLoadedPages=self._core.getMaxLoadedPages())
+        section._core.setSection(self._core.getCurrentSection())
+        self._finishCopy(section)
+        return section
+
     @staticmethod
     @override
     def getMinRequiredChildren() -> int:
@@ -43,10 +65,15 @@ class Section(Element[SectionCore, SectionData]):
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'Section':
-        inner: list[Element] = args['inner']
+        return Section.fromArgs(args | Section.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
         offset = 0
-        sizings: list[float] = [1.0 for _ in inner]
+        sizings: list[tuple[Optional[int], int | float]] = []
         limit: float = 5.0
+        maxLoadedPages: int = 0
         useheader: bool = False
         usefooter: bool = False
         for arg, v in args.items():
@@ -54,26 +81,40 @@ class Section(Element[SectionCore, SectionData]):
                 case 'offset' | 'spacing':
                     offset = int(Section.extractNum(v))
                 case 'size' | 'sizes' | 'sizing' | 'sizings':
-                    sizings = list(map(Section.parseNum, Section.adjustList(list(map(str, sizings)), Section.parseList(v))))
+                    sizings = Section.parseAdjustments(v)
 
                 case 'limit' | 'innerlimit' | 'inneramount':
                     limit = float(Section.parseNum(v))
+                case 'pages' | 'maxpages' | 'loadedpages':
+                    maxLoadedPages = int(Section.extractNum(v))
                 case 'header':
                     useheader = True
                 case 'footer':
                     usefooter = True
+        return {'offset': offset, 'sizings': sizings, 'limit': limit, 'pages': maxLoadedPages, 'header': useheader, 'footer': usefooter}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'Section':
+        inner: list[Element] = args['inner']
+        offset: int = args['offset']
+        sizings: list[float] = Section.applyAdjustments([1.0 for _ in inner], args['sizings'])
+        limit: float = args['limit']
+        maxLoadedPages: int = args['pages']
+        useheader: bool = args['header']
+        usefooter: bool = args['footer']
         if len(inner) == 1:
-            return Section(None, None, list(zip(inner, sizings)), innerLimit=limit, offset=offset)
+            return Section(None, None, list(zip(inner, sizings)), innerLimit=limit, offset=offset, maxLoadedPages=maxLoadedPages)
         if useheader and usefooter and len(inner) > 2:
             separators = (Section.getStyledElement(StyledDefault.BORDER), Section.getStyledElement(StyledDefault.BORDER))
-            return Section((inner[0], sizings[0]), (inner[1], sizings[1]), list(zip(inner[2:], sizings[2:])), separators=separators, innerLimit=limit, offset=offset)
+            return Section((inner[0], sizings[0]), (inner[1], sizings[1]), list(zip(inner[2:], sizings[2:])), separators=separators, innerLimit=limit, offset=offset, maxLoadedPages=maxLoadedPages)
         elif useheader:
             separators = (Section.getStyledElement(StyledDefault.BORDER), None)
-            return Section((inner[0], sizings[0]), None, list(zip(inner[1:], sizings[1:])), separators=separators, innerLimit=limit, offset=offset)
+            return Section((inner[0], sizings[0]), None, list(zip(inner[1:], sizings[1:])), separators=separators, innerLimit=limit, offset=offset, maxLoadedPages=maxLoadedPages)
         elif usefooter:
             separators = (None, Section.getStyledElement(StyledDefault.BORDER))
-            return Section(None, (inner[0], sizings[0]), list(zip(inner[1:], sizings[1:])), separators=separators, innerLimit=limit, offset=offset)
-        return Section(None, None, list(zip(inner, sizings)), innerLimit=limit, offset=offset)
+            return Section(None, (inner[0], sizings[0]), list(zip(inner[1:], sizings[1:])), separators=separators, innerLimit=limit, offset=offset, maxLoadedPages=maxLoadedPages)
+        return Section(None, None, list(zip(inner, sizings)), innerLimit=limit, offset=offset, maxLoadedPages=maxLoadedPages)
 
 
     # -------------------- active-state --------------------
@@ -113,29 +154,30 @@ class Section(Element[SectionCore, SectionData]):
     @override
     def setZIndex(self, zindex: int) -> None:
         super().setZIndex(zindex)
-        for el in self._core.getInner():
-            el.setZIndex(zindex)
-        for btn in self._core.getButtons():
-            btn.setZIndex(zindex+5)
+        self._core.setInnerZIndex(zindex)
         hd, ft = self._core.getHeader(), self._core.getFooter()
         if hd:
-            hd.setZIndex(zindex+2)
+            hd.setZIndex(zindex)
         if ft:
-            ft.setZIndex(zindex+1)
+            ft.setZIndex(zindex)
+        for btn in self._core.getButtons():
+            btn.setZIndex(zindex+1) # click priority over the header / footer the buttons are placed on
 
     @override
     def render(self, surface: Surface) -> None:
         """
         render renders the UI-Element onto the given surface
+        (through the offscreen cache while nothing inside changes)
 
         Args:
             surface (Surface): the surface the UIElement should be drawn on
         """
         assert self._drawer is not None
         
-        if not self._active:
-            return
+        if self._active:
+            self._renderCached(surface, self.__renderContent)
 
+    def __renderContent(self, surface: Surface) -> None:
         # inner element
         header: Optional[Element] = self._core.getHeader()
         footer: Optional[Element] = self._core.getFooter()
@@ -1,4 +1,5 @@
-from typing import Any, Optional, override
+from collections import OrderedDict
+from typing import Any, Callable, Optional, override
 
 from .....utility   import Rect, AlignType
 from .....interaction   import InputEvent, InputManager
@@ -7,6 +8,8 @@ from ...elementcore import ElementCore
 
 from ...atoms           import Box
 
+SectionEntry = Element | Callable[[], Element] # an element or a factory building it when its page is first shown
+
 class SectionCore(ElementCore):
     """Core implementation for the Section composite managing content pagination and layout.
     
@@ -20,6 +23,11 @@ class SectionCore(ElementCore):
     
     The core automatically splits content into sections when it exceeds the specified
     height limit and manages the visibility of navigation controls based on section count.
+
+    Pages are built lazily: inner entries may be factories, which are only called when their
+    page is shown for the first time, and the elements of a page are only aligned into the
+    layout once the page is shown. With maxLoadedPages, pages not visited recently are
+    detached from the layout again (and re-aligned when they are shown again).
     """
     ___vbox: Box
     _buttonActive: bool
@@ -29,11 +37,15 @@ class SectionCore(ElementCore):
     __footer: Optional[tuple[Element, float]]
     __footersep: Optional[Element]
 
-    __inner: list[tuple[Element, float]]
+    __inner: list[tuple[SectionEntry, float]]
     __innerLimit: float
     __offset: int
-    
-    __sections: dict[int, list[Element]]
+    __innerZIndex: int
+
+    __pages: dict[int, list[tuple[int, float, float]]]  # page -> (inner index, relative top, relative height) of its entries
+    __sections: dict[int, list[Element]]                # materialized elements of the pages shown so far
+    __loadedPages: OrderedDict[int, None]               # pages aligned into the layout (least recently shown first)
+    __maxLoadedPages: int
     __sectionAmount: int
     __currentSection: int
 
@@ -41,7 +53,12 @@ class SectionCore(ElementCore):
     __nextButton: Element
 
     def __init__(self, header: Optional[tuple[Element, float]], footer: Optional[tuple[Element, float]], buttons: tuple[Element, Element],
-                 inner: list[tuple[Element, float]], separators: tuple[Optional[Element], Optional[Element]]=(None, None), innerLimit: float=5.0, offset: int=0) -> None:
+                 inner: list[tuple[SectionEntry, float]], separators: tuple[Optional[Element], Optional[Element]]=(None, None), innerLimit: float=5.0, offset: int=0,
+                 maxLoadedPages: int=0) -> None:
+        if not isinstance(maxLoadedPages, int):
+            raise TypeError(f'maxLoadedPages must be int, got {type(maxLoadedPages)}')
+        if maxLoadedPages < 0:
+            raise ValueError(f'maxLoadedPages must not be negative, got {maxLoadedPages}')
         ElementCore.__init__(self, Rect())
         self._buttonActive = True
 
@@ -57,9 +74,11 @@ class SectionCore(ElementCore):
         self.__prevButton.set({'quickSubscribeToClick':(self.prevSection, [])})
         self.__nextButton.set({'quickSubscribeToClick':(self.nextSection, [])})
 
-        self.__inner = inner
+        self.__inner = list(inner)
         self.__innerLimit = innerLimit
         self.__offset = offset
+        self.__innerZIndex = 0
+        self.__maxLoadedPages = maxLoadedPages
 
         self.__currentSection = 0
         self._alignInner()
@@ -85,26 +104,25 @@ class SectionCore(ElementCore):
         elif self.__headersep:
             self.__headersep.setActive(False)
 
-        idx: int = 0
-        self.__sections: dict[int, list[Element]] = {0:[]}
-        self.__sectionAmount: int = 0
+        # split the inner entries into pages (the elements are aligned when their page is shown)
+        self.__pages = {0:[]}
+        self.__sections = {}
+        self.__loadedPages = OrderedDict()
+        self.__sectionAmount = 0
         cRelHeight: float = 0.0
-        while idx < len(self.__inner):
-            el: Element = self.__inner[idx][0]
-            el.setActive(False)
-            relHeight: float = self.__inner[idx][1] * self.__inner[idx][0].getInnerSizing((1,1))[1]
+        for idx, (entry, sizing) in enumerate(self.__inner):
+            if isinstance(entry, Element):
+                entry.setActive(False)
+                relHeight: float = sizing * entry.getInnerSizing((1,1))[1]
+            else:
+                relHeight = sizing # factories are expected to build elements of inner sizing 1
             if relHeight <= self.__innerLimit:
                 if cRelHeight + relHeight > self.__innerLimit:
                     cRelHeight = 0.0
                     self.__sectionAmount += 1
-                    self.__sections[self.__sectionAmount] = [el]
-                else:
-                    self.__sections[self.__sectionAmount].append(el)
-
-                el.alignpoint(self.___vbox, otherPoint=(0, (currentRelHeight + cRelHeight)/totalRelHeight), offset=(0, int(0.5*self.__offset)))
+                    self.__pages[self.__sectionAmount] = []
+                self.__pages[self.__sectionAmount].append((idx, (currentRelHeight + cRelHeight)/totalRelHeight, relHeight/totalRelHeight))
                 cRelHeight += relHeight
-                el.alignSize(self.___vbox, relativeAlign=(1, relHeight/totalRelHeight), absoluteOffset=(0, -self.__offset))
-            idx += 1
         self.__sectionAmount += 1
         self.setSection(0)
 
@@ -154,8 +172,8 @@ class SectionCore(ElementCore):
         maxX: int = 0
         maxY: int = 0
         totY: int = 0
-        for (el, _) in self.__inner:
-            cX, cY = el.getInnerSizing(elSize, args)
+        for (entry, _) in self.__inner:
+            cX, cY = entry.getInnerSizing(elSize, args) if isinstance(entry, Element) else elSize
             maxX, maxY = max(maxX, cX), max(maxY, cY)
             totY += cY
         if 'sec_max' in args:
@@ -174,11 +192,58 @@ class SectionCore(ElementCore):
         return self.__footer[0] if self.__footer is not None else None
 
     def getInner(self) -> list[Element]:
-        return [x[0] for x in self.__inner]
+        """
+        getInner returns the inner elements built so far (factories of pages never shown are not called).
+
+        Returns (list[Element]): the built inner elements
+        """
+        return [x[0] for x in self.__inner if isinstance(x[0], Element)]
+
+    def getEntries(self) -> list[tuple[SectionEntry, float]]:
+        """
+        getEntries returns all inner entries with their relative heights
+        (the built element or the factory if its page was never shown).
+
+        Returns (list[tuple[SectionEntry, float]]): the inner entries
+        """
+        return list(self.__inner)
+
+    def getInnerSizings(self) -> tuple[Optional[float], Optional[float], list[float]]:
+        """
+        getInnerSizings returns the relative heights of the header, the footer and the inner entries.
+
+        Returns (tuple[Optional[float], Optional[float], list[float]]): the relative heights (None if there is no header/footer)
+        """
+        return (self.__header[1] if self.__header is not None else None,
+                self.__footer[1] if self.__footer is not None else None,
+                [x[1] for x in self.__inner])
+
+    def getMaxLoadedPages(self) -> int:
+        return self.__maxLoadedPages
+
+    def getLoadedPages(self) -> list[int]:
+        """
+        getLoadedPages returns the pages currently aligned into the layout (least recently shown first).
+
+        Returns (list[int]): the loaded pages
+        """
+        return list(self.__loadedPages)
+
+    def getInnerLimit(self) -> float:
+        return self.__innerLimit
+
+    def getOffset(self) -> int:
+        return self.__offset
+
+    def getCurrentSection(self) -> int:
+        return self.__currentSection
 
     def getCurrentSectionElements(self) -> list[Element]:
         return self.__sections[self.__currentSection]
 
+    def getSectionAmount(self) -> int:
+        return self.__sectionAmount
+
     def getButtons(self) -> list[Element]:
         return [x for x in [self.__prevButton, self.__nextButton] if x is not None]
 
@@ -188,10 +253,37 @@ class SectionCore(ElementCore):
         self.__innerLimit = abs(newLimit)
         self._alignInner()
 
+    def setInnerZIndex(self, zindex: int) -> None:
+        """
+        setInnerZIndex sets the z-index of the inner elements (also of the ones built later).
+
+        Args:
+            zindex (int): the z-index to use
+        """
+        self.__innerZIndex = zindex
+        for el in self.getInner():
+            el.setZIndex(zindex)
+
+    def setMaxLoadedPages(self, maxLoadedPages: int) -> None:
+        """
+        setMaxLoadedPages sets the amount of pages kept aligned into the layout.
+
+        Args:
+            maxLoadedPages (int): the maximum amount of loaded pages (0 keeps every shown page loaded)
+        """
+        if not isinstance(maxLoadedPages, int):
+            raise TypeError(f'maxLoadedPages must be int, got {type(maxLoadedPages)}')
+        if maxLoadedPages < 0:
+            raise ValueError(f'maxLoadedPages must not be negative, got {maxLoadedPages}')
+        self.__maxLoadedPages = maxLoadedPages
+        self.__evictPages()
+
     def setSection(self, section: int) -> None:
-        for el in self.getCurrentSectionElements():
-            el.setActive(False)
+        if self.__currentSection in self.__sections:
+            for el in self.getCurrentSectionElements():
+                el.setActive(False)
         self.__currentSection = max(0, min(section, self.__sectionAmount-1))
+        self.__loadPage(self.__currentSection)
         for el in self.getCurrentSectionElements():
             el.setActive(True)
 
@@ -205,6 +297,65 @@ class SectionCore(ElementCore):
             if self.getRect().collidepoint(InputManager.getMousePosition()):
                 self.setSection((self.__currentSection + 1) % self.__sectionAmount)
     
+    # -------------------- lazy pages --------------------
+
+    def __buildEntry(self, idx: int) -> Element:
+        """
+        __buildEntry returns the element of an inner entry (calling its factory on first use).
+
+        Args:
+            idx (int): the index of the inner entry
+
+        Returns (Element): the element of the entry
+        """
+        entry, sizing = self.__inner[idx]
+        if isinstance(entry, Element):
+            return entry
+        el: Element = entry()
+        if not isinstance(el, Element):
+            raise TypeError(f'section factory must return an Element, got {type(el)}')
+        el.setActive(False)
+        el.setZIndex(self.__innerZIndex)
+        self.__inner[idx] = (el, sizing)
+        return el
+
+    def __loadPage(self, page: int) -> None:
+        """
+        __loadPage builds the elements of a page and aligns them into the layout (if not loaded yet).
+
+        Args:
+            page (int): the page to load
+        """
+        if page in self.__loadedPages:
+            self.__loadedPages.move_to_end(page)
+            return
+        elements: list[Element] = []
+        for idx, relTop, relHeight in self.__pages[page]:
+            el: Element = self.__buildEntry(idx)
+            el.alignpoint(self.___vbox, otherPoint=(0, relTop), offset=(0, int(0.5*self.__offset)))
+            el.alignSize(self.___vbox, relativeAlign=(1, relHeight), absoluteOffset=(0, -self.__offset))
+            elements.append(el)
+        self.__sections[page] = elements
+        self.__loadedPages[page] = None
+        self.__evictPages()
+
+    def __evictPages(self) -> None:
+        """
+        __evictPages detaches the least recently shown pages from the layout until at most
+        maxLoadedPages pages are loaded. Their elements are kept and re-aligned when shown again.
+        """
+        if self.__maxLoadedPages <= 0:
+            return
+        for page in list(self.__loadedPages):
+            if len(self.__loadedPages) <= self.__maxLoadedPages:
+                break
+            if page == self.__currentSection:
+                continue
+            del self.__loadedPages[page]
+            for el in self.__sections[page]:
+                el.alignpoint(Rect())
+                el.alignSize(Rect())
+
     # -------------------- active-state --------------------
 
     def setActive(self, active: bool) -> None:
@@ -214,7 +365,7 @@ class SectionCore(ElementCore):
             if self.__headersep:
                 self.__headersep.setActive(active)
         if not active:
-            for (el, _) in self.__inner:
+            for el in self.getInner():
                 el.setActive(active)
         else:
             self.setSection(self.__currentSection)
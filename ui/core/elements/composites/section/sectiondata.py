@@ -14,6 +14,9 @@ class SectionData(ElementData):
     This class serves as a data container for Section-specific rendering attributes
     that may be added in future implementations to support advanced rendering features.
     """
+    def copy(self) -> 'SectionData':
+        return SectionData()
+
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'SectionData':
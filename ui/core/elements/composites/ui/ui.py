@@ -1,8 +1,12 @@
-from typing import Any, override
+from collections import OrderedDict
+from typing import Any, Optional, override
 
-from .....utility   import AlignType, iRect, Rect
+from .....utility   import AlignType, Color, iRect, Rect
 from .....display   import Surface
+from ....renderer   import RenderQueue
 from ...element     import Element
+from ...body        import Body, LayoutState
+from ...atoms       import Binding
 
 from .uicore        import UICore
 from .uidata        import UIData
@@ -14,23 +18,58 @@ class UI(Element[UICore, UIData]):
     and side bars. It supports named element lookup and maintains element activation states.
     Elements can be positioned and sized automatically based on the container's dimensions.
     
+    Solved layouts are kept in a bounded LRU cache keyed by the root size and the version of the
+    constraint graph, so resizing to a previously seen size (e.g. toggling fullscreen) restores the
+    layout instead of solving it again.
+    
     Attributes:
         __namedElements (dict[str, Element]): Maps element IDs to their corresponding Element instances
+        __renderQueue (RenderQueue): The inner elements in render order (updated on setActive and setZIndex)
+        __layoutCache (OrderedDict): Maps (root size, graph epoch) to the solved layouts (LRU order)
     """
 
     __namedElements: dict[str, Element]
+    __renderQueue: RenderQueue  # the inner elements in render order (inactive elements are skipped)
+
+    __layoutCache: OrderedDict[tuple[Any, ...], tuple[list[tuple[Body, LayoutState]], Any]]
+    __layoutCacheSize: int
+    __layoutEpoch: int          # incremented whenever the constraint graph was changed from outside
+    __layoutGraphVersion: int   # the graph version after the last resize
 
     # -------------------- creation --------------------
 
     def __init__(self, namedElements: dict[str, Element], core: UICore, active: bool = True) -> None:
         super().__init__(core, UIData(), active)
         self.__namedElements = namedElements
+        self.__renderQueue = RenderQueue(core.getInner())
+
+        self.__layoutCache = OrderedDict()
+        self.__layoutCacheSize = 8
+        self.__layoutEpoch = 0
+        self.__layoutGraphVersion = -1
     
+    @override
+    def copy(self) -> 'UI':
+        inner: list[Element] = []
+        copies: dict[Element, Element] = {}
+        for el in self._core.getInner():
+            clone, copied = Element._copyTracked(el)
+            inner.append(clone)
+            copies |= copied
+        ui: UI = UI({id: copies[el] for id, el in self.__namedElements.items()},
+                    UICore(self._core.usesHeader(), self._core.usesFooter(), inner, offset=self._core.getOffset(), sizing=self._core.getSizing()))
+        ui.setLayoutCacheSize(self.__layoutCacheSize)
+        self._finishCopy(ui)
+        return ui
+
     @staticmethod
     @override
     def parseFromArgs(args: dict[str, Any]) -> 'UI':
-        inner: list[Element] = args['inner']
-        named: dict[str, Element] = args['named']
+        return UI.fromArgs(args | UI.convertArgs(args))
+
+    @staticmethod
+    @override
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
         offset = 0
         sizing = 1.0
         useheader: bool = False
@@ -46,7 +85,14 @@ class UI(Element[UICore, UIData]):
                     useheader = True
                 case 'footer':
                     usefooter = True
-        return UI(named, UICore(useheader, usefooter, inner, offset=offset, sizing=sizing))
+        return {'offset': offset, 'sizing': sizing, 'header': useheader, 'footer': usefooter}
+
+    @staticmethod
+    @override
+    def fromArgs(args: dict[str, Any]) -> 'UI':
+        inner: list[Element] = args['inner']
+        named: dict[str, Element] = args['named']
+        return UI(named, UICore(args['header'], args['footer'], inner, offset=args['offset'], sizing=args['sizing']))
     # -------------------- active-state --------------------
 
     @override
@@ -71,6 +117,20 @@ class UI(Element[UICore, UIData]):
     def set(self, args: dict[str, Any], sets: int = -1, maxDepth: int = -1, skips: list[int] = [0]) -> int:
         return int(self._set(args, sets, maxDepth, bool(skips[0])))
 
+    def bind(self, id: str, key: str, index: int = 0) -> Binding:
+        """
+        bind resolves a property of a named element once and returns a handle applying
+        values directly to it (instead of walking the element tree on every set).
+
+        Args:
+            id      (str)   : the id of the element
+            key     (str)   : the property to bind (any key accepted by set())
+            index   (int)   : the amount of matching atoms to skip (like skips=[index] in set())
+
+        Returns (Binding): the handle to the property
+        """
+        return Binding.resolve(self.getElementByID(id), key, index)
+
     # -------------------- aligning --------------------
 
     def setPosition(self, position: tuple[int, int]) -> None:
@@ -100,10 +160,51 @@ class UI(Element[UICore, UIData]):
 
     @override
     def alignSize(self, other: 'Element | iRect', alignX: bool = True, alignY: bool = True, relativeAlign: float | tuple[float, float] = 1.0, absoluteOffset: int | tuple[int, int] = 0) -> None:
-        super().alignSize(other, alignX, alignY, relativeAlign, absoluteOffset)
-        self.updateLayout()
-        self._core.alignInner()
-        self.updateLayout()
+        if Body.getGraphVersion() != self.__layoutGraphVersion:
+            # the constraint graph changed since the cached layouts were solved
+            self.__layoutEpoch += 1
+            self.__layoutCache.clear()
+
+        key: tuple[Any, ...] | None = None
+        if isinstance(other, Rect):
+            key = (other.getSize(), alignX, alignY, relativeAlign, absoluteOffset, self.__layoutEpoch)
+
+        if key is not None and key in self.__layoutCache:
+            self.__layoutCache.move_to_end(key)
+            bodyStates, barState = self.__layoutCache[key]
+            for body, state in bodyStates:
+                body.setLayoutState(state)
+            self._core.setBarState(barState)
+            self.updateLayout()
+        else:
+            super().alignSize(other, alignX, alignY, relativeAlign, absoluteOffset)
+            self.updateLayout()
+            self._core.alignInner()
+            self.updateLayout()
+
+            if key is not None and self.__layoutCacheSize > 0:
+                roots: list[Body] = [self._core.getBody()] + [el.getCore().getBody() for el in self._core.getInner()]
+                self.__layoutCache[key] = ([(body, body.getLayoutState()) for body in Body.collectDependents(roots)],
+                                           self._core.getBarState())
+                while len(self.__layoutCache) > self.__layoutCacheSize:
+                    self.__layoutCache.popitem(last=False)
+
+        self.__layoutGraphVersion = Body.getGraphVersion()
+
+    def setLayoutCacheSize(self, size: int) -> None:
+        """
+        setLayoutCacheSize sets the maximum amount of solved layouts kept for resizing.
+
+        Args:
+            size (int): the maximum amount of cached layouts (0 disables the cache)
+        """
+        if not isinstance(size, int):
+            raise TypeError(f'size must be int, got {type(size)}')
+        if size < 0:
+            raise ValueError(f'size must not be negative, got {size}')
+        self.__layoutCacheSize = size
+        while len(self.__layoutCache) > size:
+            self.__layoutCache.popitem(last=False)
 
     # -------------------- rendering --------------------
 
@@ -120,8 +221,21 @@ class UI(Element[UICore, UIData]):
         if not self._active:
             return
 
-        for el in self._core.getCurrentElements():
+        for el in self.__renderQueue.getOrder():
             el.render(surface)
         
         if len(UI._postRenderQueue) > 0:
             UI._renderPost(surface)
+
+    def renderDirty(self, surface: Surface, background: Optional[Color]=None) -> list[Rect]:
+        """
+        renderDirty renders only the regions of the UI that changed since the last call
+        (see Renderer.renderAllDirty)
+
+        Args:
+            surface     (Surface)           : the surface the UIElement should be drawn on
+            background  (Optional[Color])   : color to clear the redrawn regions with
+
+        Returns (list[Rect]): the regions of the surface that were redrawn
+        """
+        return UI.renderAllDirty(surface, [self], background)
@@ -195,6 +195,30 @@ class UICore(ElementCore):
     def getBars(self) -> tuple[list[Element], list[Element], list[Element], list[Element]]:
         return (self.getTopBar(), self.getBottomBar(), self.getLeftBar(), self.getRightBar())
 
+    def getInner(self) -> list[Element]:
+        return self.__inner
+
+    def getOffset(self) -> int:
+        return self.__offset
+
+    def getSizing(self) -> float:
+        return self.__sizing
+
+    def usesHeader(self) -> bool:
+        return self.__useHeader
+
+    def usesFooter(self) -> bool:
+        return self.__useFooter
+
+    def getBarState(self) -> tuple[list[list[list[Element]]], list[int]]:
+        """
+        getBarState returns the current bar assignment of the inner elements.
+
+        Returns (tuple[list[list[list[Element]]], list[int]]): the (top, bottom, left, right) bars and the current bar indices
+        """
+        return ([[list(bar) for bar in bars] for bars in (self.__topBars, self.__bottomBars, self.__leftBars, self.__rightBars)],
+                [self.__currentTopBar, self.__currentBottomBar, self.__currentLeftBar, self.__currentRightBar])
+
     def getCurrentElements(self) -> list[Element]:
         els: list[Element] = [x for x in self.getTopBar()]
         els.extend(self.getBottomBar())
@@ -244,6 +268,25 @@ class UICore(ElementCore):
                 el.setActive(True)
             self.__currentRightBar = idx
     
+    def setBarState(self, state: tuple[list[list[list[Element]]], list[int]]) -> None:
+        """
+        setBarState restores a bar assignment previously returned by getBarState.
+
+        Args:
+            state (tuple[list[list[list[Element]]], list[int]]): the bar assignment to restore
+        """
+        bars, current = state
+        self.__topBars, self.__bottomBars, self.__leftBars, self.__rightBars = [[list(bar) for bar in b] for b in bars]
+        self.__numberOfTopBars, self.__numberOfBottomBars = len(self.__topBars), len(self.__bottomBars)
+        self.__numberOfLeftBars, self.__numberOfRightBars = len(self.__leftBars), len(self.__rightBars)
+
+        for el in self.__inner:
+            el.setActive(False)
+        self.setTopBar(current[0])
+        self.setBottomBar(current[1])
+        self.setLeftBar(current[2])
+        self.setRightBar(current[3])
+
     # -------------------- active-state --------------------
 
     def setActive(self, active: bool) -> None:
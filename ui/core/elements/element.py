@@ -1,11 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Any, Generic, Optional, TypeVar, override
-import xml.etree.ElementTree as ET
 
 from ...utility           import Rect, iRect, Parsable, AlignType, StyledDefault
 from ...interaction       import EventManager
 from ..renderer           import Renderer
-from ..style              import StyleManager
+from ..style              import StyleManager, LayoutNode
 from .body                import Body
 from .elementcore         import ElementCore
 from .elementdata         import ElementData
@@ -23,7 +22,7 @@ class Element(Generic[Core, Data], Renderer, Parsable, iRect, ABC):
     styleTags: list[str] = ['style', 'styled', 'styleid', 'styledid']
 
     parserCallEvent: str = EventManager.createEvent()
-    parserRequest: Optional[ET.Element] = None
+    parserRequest: Optional[LayoutNode] = None
     parserResponse: 'Optional[Element]' = None
 
     @staticmethod
@@ -76,6 +75,101 @@ class Element(Generic[Core, Data], Renderer, Parsable, iRect, ABC):
         self._renderData = renderData
         self.setZIndex(0) # set default z-index
 
+    @abstractmethod
+    def copy(self) -> 'Element':
+        """
+        copy creates a structural clone of the element. Inner elements are cloned as well and the
+        layout of the clone is rebuilt against the new instances (the clone has no outer alignment).
+        Subscriptions to the events of the element (e.g. clicks) are not copied.
+
+        Returns (Element): the clone of the element
+        """
+        pass
+
+    __copies: 'Optional[dict[Element, Element]]' = None # originals -> clones while a tracked copy is running
+
+    def _finishCopy(self, clone: ElementCls) -> ElementCls:
+        """
+        _finishCopy applies the z-index and active-state of the element to its clone.
+        Has to be called by every copy implementation.
+
+        Args:
+            clone (Element): the freshly constructed clone
+
+        Returns (Element): the clone
+        """
+        clone.setZIndex(self.getZIndex())
+        if not self.isActive():
+            clone.setActive(False)
+        if Element.__copies is not None:
+            Element.__copies[self] = clone
+        return clone
+
+    @staticmethod
+    def _copyTracked(element: ElementCls) -> 'tuple[ElementCls, dict[Element, Element]]':
+        """
+        _copyTracked copies an element and returns the clones of all elements copied along with it.
+
+        Args:
+            element (Element): the element to copy
+
+        Returns (tuple[Element, dict[Element, Element]]): the clone and the mapping of the copied elements to their clones
+        """
+        outer: Optional[dict[Element, Element]] = Element.__copies
+        copies: dict[Element, Element] = {}
+        Element.__copies = copies
+        try:
+            clone: ElementCls = element.copy() # type: ignore[assignment]
+        finally:
+            Element.__copies = outer
+        if outer is not None:
+            outer.update(copies)
+        return clone, copies
+
+    # -------------------- Parsable-implementation --------------------
+
+    @staticmethod
+    @abstractmethod
+    @override
+    def parseFromArgs(args: dict[str, Any]) -> 'Element':
+        """
+        parseFromArgs creates a new element from the given (parsed xml) arguments.
+
+        Args:
+            args (dict[str, Any]): the arguments of the element
+
+        Returns (Element): the new element
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def convertArgs(args: dict[str, Any]) -> dict[str, Any]:
+        """
+        convertArgs converts the (xml) string arguments of an element into the typed arguments used by fromArgs.
+        The conversion does not depend on the inner elements or the style, so a parsed node is converted once.
+
+        Args:
+            args (dict[str, Any]): the arguments of the element
+
+        Returns (dict[str, Any]): the converted arguments
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def fromArgs(args: dict[str, Any]) -> 'Element':
+        """
+        fromArgs creates a new element from converted arguments (see convertArgs) and the
+        'inner' elements and 'fixstyle'. The element takes over the converted render data.
+
+        Args:
+            args (dict[str, Any]): the converted arguments of the element
+
+        Returns (Element): the new element
+        """
+        pass
+
     # -------------------- iRect-implementation --------------------
 
     @override
@@ -96,6 +190,19 @@ class Element(Generic[Core, Data], Renderer, Parsable, iRect, ABC):
         """
         return self._core.getPosition()
 
+    # -------------------- dirty-tracking --------------------
+
+    @override
+    def _getRenderState(self) -> tuple[Rect, Any]:
+        """
+        _getRenderState returns the rect of the element (including outlines drawn onto the
+        right and bottom edge) and its position and size as render state.
+        Overridden by elements whose drawn content can change without moving.
+
+        Returns (tuple[Rect, Any]): the drawn region and the render state
+        """
+        return self.getRect().inflate(1, 1), (self.getPosition(), self.getSize())
+
     # -------------------- additional-getter --------------------
 
     def getRect(self) -> Rect:
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Any, override
 
-from ...utility import Rect, iRect
-from .body      import Body
+from ...utility     import Rect, iRect
+from ...interaction import EventManager, Clickable
+from .body          import Body
 
 Point = tuple[float, float]
 
@@ -25,6 +26,8 @@ class ElementCore(iRect, ABC):
 
     def __init__(self, rect: Rect) -> None:
         self._body = Body(rect)
+        if isinstance(self, Clickable): # keep the hit-testing bounds in sync with the layout
+            EventManager.quickSubscribe(self._body.getChangeEvent(), self._updateHitBounds)
 
     # -------------------- iRect-implementation --------------------
 
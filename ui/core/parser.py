@@ -1,14 +1,18 @@
 from typing import Any, Optional
+import hashlib
+import os
+import pickle
 import xml.etree.ElementTree as ET
 
 from ..interaction import EventManager
 
-from .style import StyleManager
+from .style import StyleManager, LayoutNode
 
 from .elements import Element, Line, Box, Text
 from .elements import Framed, Grouped, Dropdown
 from .elements import Button, Toggle, Slider, Multiselect, Dropdownselect
-from .elements import Section, UI
+from .elements import Section, Listview, UI
+from .elements.atoms.atomdata import AtomData
 
 class Parser:
 
@@ -16,6 +20,8 @@ class Parser:
     def loadLayoutFromXML(path: str) -> UI:
         """Load and parse a UI layout from an XML file.
 
+        The layout is read from the compiled cache if one is set (see setCacheDirectory).
+
         Args:
             path (str): Path to the XML layout file
 
@@ -26,21 +32,19 @@ class Parser:
             ValueError: If no valid root element is found
             ET.ParseError: If XML is malformed
         """
-        tree = ET.parse(path)
-        root = tree.getroot()
-        if root is None:
-            raise ValueError('XML file contains no root element')
-        newEl, rawNamedElements = Parser.__fromNode(root)
+        root: LayoutNode = Parser.__loadCompiled(path, Parser.__styleHashes)[0]
+        newEl, namedElements = Parser.__build(root, owned=True)
         if newEl is None:
             raise ValueError('Failed to parse root element from XML layout file')
         if not isinstance(newEl, UI):
-            namedElements = {k:v[1] for k, v in rawNamedElements.items()}
             return UI.parseFromArgs({'inner':[newEl], 'named': namedElements})
         return newEl
 
     @staticmethod
     def loadStyleFromXML(path: str) -> None:
         """Load style definitions from an XML file into the StyleManager.
+
+        The style file is read from the compiled cache if one is set (see setCacheDirectory).
         
         Args:
             path (str): Path to the XML style file
@@ -48,11 +52,9 @@ class Parser:
         Raises:
             ET.ParseError: If XML is malformed
         """
-        tree = ET.parse(path)
-        root = tree.getroot()
-        if root is None:
-            raise ValueError('XML file contains no root element')
-        Parser.__fromNode(root)
+        root, contentHash = Parser.__loadCompiled(path, [])
+        Parser.__styleHashes.append(contentHash)
+        Parser.__build(root, owned=True)
 
     @staticmethod
     def getAllStyles() -> list[str]:
@@ -62,14 +64,60 @@ class Parser:
     def setDefaultStyle(style: str) -> bool:
         return StyleManager.setDefaultStyle(style)
 
+    @staticmethod
+    def setCacheDirectory(path: Optional[str]) -> None:
+        """Set the directory of the compiled layout cache.
+
+        Layouts and style files loaded with a cache directory are stored there compiled (see
+        LayoutNode: the node tree with the arguments of every element already converted). Style
+        files are stored under their content hash, layouts under the content hash of the layout
+        and all loaded style files. Loading the same file again skips the xml parsing and the
+        conversion of the arguments. The entries are pickles, so the directory must not be
+        writable by untrusted users.
+
+        Args:
+            path (Optional[str]): the cache directory (created if missing), None disables the cache
+        """
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        Parser.__cacheDirectory = path
+
     
     # -------------------- parsing --------------------
 
 
     __namedElements: dict[str, Element]={}
 
+    # element tags -> (element type, additional args)
+    __elementTags: dict[str, tuple[type[Element], dict[str, Any]]] = {
+        **{tag: (Line, {})           for tag in ('line', 'l')},
+        **{tag: (Box, {})            for tag in ('box', 'b')},
+        **{tag: (Text, {})           for tag in ('text', 't')},
+        **{tag: (Framed, {})         for tag in ('framed', 'fr', 'f')},
+        **{tag: (Grouped, {})        for tag in ('group', 'grouped', 'gr', 'g')},
+        **{tag: (Dropdown, {})       for tag in ('dropdown', 'dpd')},
+        **{tag: (Button, {})         for tag in ('button',)},
+        **{tag: (Toggle, {'typ': 'checkbox'}) for tag in ('checkbox', 'selector')},
+        **{tag: (Toggle, {'typ': 'cycle'})    for tag in ('elementcycle', 'cycle', 'cyclebutton')},
+        **{tag: (Slider, {})         for tag in ('slider',)},
+        **{tag: (Multiselect, {})    for tag in ('multiselect', 'multi')},
+        **{tag: (Dropdownselect, {}) for tag in ('dropdownselect', 'dropselect', 'downselect', 'dropsel', 'dpds')},
+        **{tag: (Section, {})        for tag in ('section', 'sec', 's')},
+        **{tag: (Listview, {})       for tag in ('listview', 'list')},
+        **{tag: (UI, {})             for tag in ('ui',)},
+    }
+
     @staticmethod
-    def __fromNode(node: ET.Element) -> tuple[Optional[Element], dict[str, tuple[ET.Element, Element]]]:
+    def __compileNode(node: ET.Element) -> tuple[LayoutNode, dict[str, LayoutNode]]:
+        """
+        __compileNode compiles a parsed xml node and its children: the arguments of every element are
+        converted once (see Element.convertArgs), so the nodes are built without interpreting strings.
+
+        Args:
+            node (ET.Element): the node to compile
+
+        Returns (tuple[LayoutNode, dict[str, LayoutNode]]): the compiled node and the labeled nodes of its subtree
+        """
         # -------------------- setup --------------------
         idTags   : list[str] = ['label', 'tag', 'id', 'name']
         styleTags: list[str] = Element.styleTags
@@ -97,120 +145,153 @@ class Parser:
                 return tagValue
             return None
 
-        # -------------------- rec-parsing --------------------
-        attributes: dict[str, Any] = node.attrib
+        # -------------------- rec-compiling --------------------
+        attributes: dict[str, Any] = dict(node.attrib)
 
-        namedElements: dict[str, tuple[ET.Element, Element]] = {}
+        namedNodes: dict[str, LayoutNode] = {}
 
-        children: list[Element] = []
+        children: list[LayoutNode] = []
         for c in node:
-            newEl, subNamedElement = Parser.__fromNode(c)
-            if newEl is not None:
-                children.append(newEl)
-            if len(namedElements) + len(subNamedElement) != len(set(namedElements).union(subNamedElement)):
-                raise ValueError(f'labels={set(namedElements).intersection(subNamedElement)} appear twice!')
-            namedElements |= subNamedElement
-        attributes['inner'] = children
+            child, subNamedNodes = Parser.__compileNode(c)
+            children.append(child)
+            if len(namedNodes) + len(subNamedNodes) != len(set(namedNodes).union(subNamedNodes)):
+                raise ValueError(f'labels={set(namedNodes).intersection(subNamedNodes)} appear twice!')
+            namedNodes |= subNamedNodes
 
         # -------------------- styles --------------------
-        if node.tag.lower() in styleTags:
-            if len(namedElements):
-                newStyle: Optional[str] = getID(attributes, idTags)
-                if newStyle:
-                    StyleManager.addStyle(newStyle, {k:v[0] for k, v in namedElements.items()})
-            return None, {}
+        tag: str = node.tag.lower()
+        if tag in styleTags:
+            return LayoutNode(tag, {}, id=getID(attributes, idTags), styled=namedNodes), {}
 
         # -------------------- elements --------------------
-        attributes['content'] = node.text.strip() if node.text is not None else ''
-        if any([x in attributes for x in styleTags]):
-            attributes['fixstyle'] = attributes[styleTags[[x in attributes for x in styleTags].index(True)]]
-        else:
-            attributes['fixstyle'] = StyleManager.defaultStyle
+        args: dict[str, Any] = {}
+        if tag in Parser.__elementTags:
+            elementType, additionalArgs = Parser.__elementTags[tag]
+            content: str = node.text.strip() if node.text is not None else ''
+            args = elementType.convertArgs(attributes | additionalArgs | {'content': content})
+        fixStyle: Optional[str] = next((attributes[x] for x in styleTags if x in attributes), None)
+        texts: list[tuple[int, str]] = [(i, txt) for i, txt in enumerate(Element.parseList(attributes['text'])) if len(txt)]\
+                                        if 'text' in attributes else []
 
+        # -------------------- id --------------------
+        newNode: LayoutNode = LayoutNode(tag, args, children, getID(attributes, idTags, set(namedNodes)), fixStyle, texts)
+        if newNode.id:
+            namedNodes[newNode.id] = newNode
+
+        return newNode, namedNodes
+
+    @staticmethod
+    def __build(node: LayoutNode, owned: bool) -> tuple[Optional[Element], dict[str, Element]]:
+        """
+        __build builds the element of a compiled node and registers the styles of its style nodes.
+        Nodes of loaded files are built once and hand their converted render data to the elements,
+        style nodes are built for every styled element and copy it.
+
+        Args:
+            node    (LayoutNode)    : the compiled node
+            owned   (bool)          : if the converted arguments of the node can be taken over
 
+        Returns (tuple[Optional[Element], dict[str, Element]]): the element and the labeled elements of its subtree
+        """
+        # -------------------- styles --------------------
+        if node.tag in Element.styleTags:
+            if node.id and len(node.styled):
+                StyleManager.addStyle(node.id, node.styled)
+            return None, {}
+
+        # -------------------- rec-building --------------------
+        namedElements: dict[str, Element] = {}
+
+        children: list[Element] = []
+        for c in node.children:
+            newEl, subNamedElements = Parser.__build(c, owned)
+            if newEl is not None:
+                children.append(newEl)
+            namedElements |= subNamedElements
+
+        # -------------------- elements --------------------
+        style: str = StyleManager.defaultStyle if node.style is None else node.style
         newElement: Optional[Element] = None
-        match node.tag.lower():
-            case 'line' | 'l':
-                if len(children) >= Line.getMinRequiredChildren():
-                    newElement = Line.parseFromArgs(attributes)
-            case 'box' | 'b':
-                if len(children) >= Box.getMinRequiredChildren():
-                    newElement = Box.parseFromArgs(attributes)
-            case 'text' | 't':
-                if len(children) >= Text.getMinRequiredChildren():
-                    newElement = Text.parseFromArgs(attributes)
-            case 'framed' | 'fr' | 'f':
-                if len(children) >= Framed.getMinRequiredChildren():
-                    newElement = Framed.parseFromArgs(attributes)
-            case 'group' | 'grouped' | 'gr' | 'g':
-                if len(children) >= Grouped.getMinRequiredChildren():
-                    newElement = Grouped.parseFromArgs(attributes)
-            case 'dropdown' | 'dpd':
-                if len(children) >= Dropdown.getMinRequiredChildren():
-                    newElement = Dropdown.parseFromArgs(attributes)
-            
-            case 'button':
-                if len(children) >= Button.getMinRequiredChildren():
-                    newElement = Button.parseFromArgs(attributes)
-            
-            case 'checkbox' | 'selector':
-                attributes['typ'] = 'checkbox'
-                if len(children) >= Toggle.getMinRequiredChildren():
-                    newElement = Toggle.parseFromArgs(attributes)
-            case 'elementcycle' | 'cycle' | 'cyclebutton':
-                attributes['typ'] = 'cycle'
-                if len(children) >= Toggle.getMinRequiredChildren():
-                    newElement = Toggle.parseFromArgs(attributes)
-
-            case 'slider':
-                if len(children) >= Slider.getMinRequiredChildren():
-                    newElement = Slider.parseFromArgs(attributes)
-            case 'multiselect' | 'multi':
-                if len(children) >= Multiselect.getMinRequiredChildren():
-                    newElement = Multiselect.parseFromArgs(attributes)
-            case 'dropdownselect' | 'dropselect' | 'downselect' | 'dropsel' | 'dpds':
-                if len(children) >= Dropdownselect.getMinRequiredChildren():
-                    newElement = Dropdownselect.parseFromArgs(attributes)
-            case 'section' | 'sec' | 's':
-                if len(children) >= Section.getMinRequiredChildren():
-                    newElement = Section.parseFromArgs(attributes)
-            case 'ui':
-                if len(children) >= UI.getMinRequiredChildren():
-                    attributes['named'] = {k:v[1] for k, v in namedElements.items()}
-                    newElement = UI.parseFromArgs(attributes)
-
-            case _:
-                styleValue: str = StyleManager.defaultStyle
-                if any([x in attributes for x in styleTags]):
-                    styleValue: str = attributes[styleTags[[x in attributes for x in styleTags].index(True)]]
-                prefNode: Optional[ET.Element] = StyleManager.getStyledElementNode(node.tag.lower(), styleValue)
-                if prefNode:
-                    prefElement: Optional[Element] = Parser.__fromNode(prefNode)[0]
-                    if prefElement is not None:
-                        newElement = prefElement
+        if node.tag in Parser.__elementTags:
+            elementType: type[Element] = Parser.__elementTags[node.tag][0]
+            if len(children) >= elementType.getMinRequiredChildren():
+                args: dict[str, Any] = node.args if owned else\
+                                       {k: v.copy() if isinstance(v, AtomData) else v for k, v in node.args.items()}
+                args = args | {'inner': children, 'fixstyle': style}
+                if elementType is UI:
+                    args['named'] = dict(namedElements)
+                newElement = elementType.fromArgs(args)
+        else:
+            prefNode: Optional[LayoutNode] = StyleManager.getStyledElementNode(node.tag, style)
+            if prefNode is not None:
+                newElement = Parser.__build(prefNode, owned=False)[0]
         if newElement is None:
             return None, {}
 
-        # -------------------- post-parsing --------------------
-        if 'text' in attributes:
-            for i, txt in enumerate(Element.parseList(attributes['text'])):
-                if len(txt):
-                    newElement.set({'content':txt}, sets=1, skips=[i])
+        # -------------------- post-building --------------------
+        for i, txt in node.texts:
+            newElement.set({'content':txt}, sets=1, skips=[i])
 
-        # -------------------- id --------------------
-        newID: Optional[str] = getID(attributes, idTags, set(namedElements))
-        if newID:
-            namedElements[newID] = (node, newElement)
+        if node.id:
+            namedElements[node.id] = newElement
 
         return newElement, namedElements
 
-    
-
     @staticmethod
     def answerElementRequest() -> None:
-        elementRequest: Optional[ET.Element] = Element.parserRequest
+        elementRequest: Optional[LayoutNode] = Element.parserRequest
         if elementRequest is not None:
-            Element.parserResponse = Parser.__fromNode(elementRequest)[0]
+            Element.parserResponse = Parser.__build(elementRequest, owned=False)[0]
+
+    # -------------------- compiled-cache --------------------
+
+    # format of the cache entries (part of every key, entries of other formats are never read)
+    __cacheFormat: bytes = b'gpui-layout-2'
+    __cacheDirectory: Optional[str] = None
+    # content hashes of the loaded style files (in load order), part of every layout key
+    __styleHashes: list[bytes] = []
+
+    @staticmethod
+    def __loadCompiled(path: str, dependencies: list[bytes]) -> tuple[LayoutNode, bytes]:
+        """
+        __loadCompiled returns the compiled node tree of a layout or style file. With a cache directory set
+        the tree is read from the cache (keyed by the content hash of the file and the given dependencies)
+        or stored there after compiling.
+
+        Args:
+            path            (str)           : the path of the file
+            dependencies    (list[bytes])   : the hashes of the files the entry depends on
+
+        Returns (tuple[LayoutNode, bytes]): the root of the file and its content hash
+        """
+        with open(path, 'rb') as file:
+            content: bytes = file.read()
+        contentHash: bytes = hashlib.sha256(content).digest()
+        if Parser.__cacheDirectory is None:
+            return Parser.__compileNode(ET.fromstring(content))[0], contentHash
+
+        key = hashlib.sha256(Parser.__cacheFormat)
+        key.update(contentHash)
+        for dependency in dependencies:
+            key.update(dependency)
+        entry: str = os.path.join(Parser.__cacheDirectory, f'{key.hexdigest()}.pickle')
+
+        try:
+            with open(entry, 'rb') as file:
+                cached: LayoutNode = pickle.load(file)
+            return cached, contentHash
+        except Exception: # missing or unreadable entries are rebuilt
+            pass
+
+        root: LayoutNode = Parser.__compileNode(ET.fromstring(content))[0]
+        temporary: str = f'{entry}.{os.getpid()}.tmp'
+        try:
+            with open(temporary, 'wb') as file:
+                pickle.dump(root, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, entry)
+        except OSError: # the file is still loaded if the cache can not be written
+            pass
+        return root, contentHash
 
 
     @staticmethod
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
+from ..utility import Color, Rect
 from ..display import Font, FontManager, Surface, SurfaceDrawer
 
 RendererCls = TypeVar('RendererCls', bound='Renderer')
@@ -11,10 +14,16 @@ class Renderer(ABC):
 
     _active: bool   # boolean if the renderer is active or not
     _zIndex: int    # zIndex of the element (depth)
+    _renderQueue: Optional['RenderQueue'] = None # the render queue the renderer is registered with
+
+    __cacheOwner: Optional['Renderer']  # the cached subtree the renderer was last rendered in (None if not cached)
+    __cacheOwnerKnown: bool             # if the renderer was rendered since its creation
 
     def __init__(self, active: bool = True) -> None:
         self._active = active
         self._zIndex = 0
+        self.__cacheOwner = None
+        self.__cacheOwnerKnown = False
 
     # -------------------- active-state --------------------
 
@@ -33,6 +42,9 @@ class Renderer(ABC):
         Returns (bool): new active-state of the Renderer
         """
         self._active = not self._active
+        if self._renderQueue is not None:
+            self._renderQueue.update(self)
+        self._invalidateRender()
         return self._active
 
     def setActive(self, active: bool) -> None:
@@ -43,6 +55,9 @@ class Renderer(ABC):
             active (bool): new active-state of the Renderer
         """
         self._active = active
+        if self._renderQueue is not None:
+            self._renderQueue.update(self)
+        self._invalidateRender()
 
     def getZIndex(self) -> int:
         """
@@ -53,8 +68,146 @@ class Renderer(ABC):
     def setZIndex(self, zindex: int) -> None:
         """
         setZIndex sets the z-index of the Renderer
+        (and moves it to the matching bucket of its render queue if registered)
         """
         self._zIndex = zindex
+        if self._renderQueue is not None:
+            self._renderQueue.update(self)
+
+    # -------------------- dirty-tracking --------------------
+
+    @abstractmethod
+    def _getRenderState(self) -> tuple[Rect, Any]:
+        """
+        _getRenderState returns the screen-region the Renderer draws onto and a comparable
+        state which changes whenever the drawn content changes.
+
+        Returns (tuple[Rect, Any]): the drawn region and the render state
+        """
+        pass
+
+    def _drawsTranslucent(self) -> bool:
+        """
+        _drawsTranslucent returns if the Renderer draws non-opaque colors.
+        Overridden by every Renderer drawing directly onto a surface.
+
+        Returns (bool): if any drawn color is not fully opaque
+        """
+        return False
+
+    def _trackRender(self) -> None:
+        """
+        _trackRender registers the Renderer with the cached subtree it is currently rendered in.
+        Has to be called on render by every Renderer invalidating its drawn content itself
+        (see _invalidateRender), atoms are registered through _trackDraw.
+        """
+        self.__cacheOwner = Renderer.__currentCacheOwner
+        self.__cacheOwnerKnown = True
+
+    def _invalidateRender(self) -> None:
+        """
+        _invalidateRender marks the offscreen caches of all cached subtrees containing the Renderer
+        as outdated. Has to be called whenever the content drawn by the Renderer changes.
+        """
+        if not self.__cacheOwnerKnown:
+            # never rendered -> the subtree it will be drawn in is unknown
+            if self._active:
+                Renderer.__renderCache.clear()
+            return
+        element: Optional[Renderer] = self
+        while element is not None:
+            Renderer.__renderCache.pop(element, None)
+            element = element.__cacheOwner
+
+    def _renderCached(self, surface: Surface, draw: Callable[[Surface], None]) -> None:
+        """
+        _renderCached renders a subtree through an offscreen surface cache.
+        The subtree is drawn once onto an offscreen surface (see SurfaceDrawer.createSurface)
+        which is blitted until a renderer inside the subtree invalidates it (see _invalidateRender).
+
+        Subtrees queueing post-render elements or drawing translucent colors are drawn directly
+        (translucent colors would be blended twice: into the offscreen surface and again on blit).
+
+        Args:
+            surface (Surface)                   : the surface to render onto
+            draw    (Callable[[Surface], None]) : draws the subtree onto the given surface
+        """
+        self._trackRender()
+        outer: Optional[Renderer] = Renderer.__currentCacheOwner
+        Renderer.__currentCacheOwner = self
+        try:
+            self.__renderCachedSubtree(surface, draw)
+        finally:
+            Renderer.__currentCacheOwner = outer
+
+    def __renderCachedSubtree(self, surface: Surface, draw: Callable[[Surface], None]) -> None:
+        """
+        __renderCachedSubtree renders the subtree of _renderCached (filling the cache on a miss).
+
+        Args:
+            surface (Surface)                   : the surface to render onto
+            draw    (Callable[[Surface], None]) : draws the subtree onto the given surface
+        """
+        if Renderer.__renderCacheSize == 0 or Renderer._drawer is None:
+            draw(surface)
+            return
+
+        cached: Optional[tuple[dict[Renderer, tuple[Rect, Any]], Rect, Optional[Surface]]] = Renderer.__renderCache.get(self)
+        if cached is None:
+            if Renderer.__collecting:
+                # filled by the next drawing pass
+                draw(surface)
+                return
+            cached = self.__fillRenderCache(surface, draw)
+        else:
+            Renderer.__renderCache.move_to_end(self)
+
+        drawn, region, offscreen = cached
+        if offscreen is None:
+            draw(surface)
+        elif Renderer.__collecting:
+            Renderer.__drawn.update(drawn)
+        elif Renderer.__clip is None or region.intersects(Renderer.__clip):
+            surface.blit(offscreen, region.getPosition())
+
+    def __fillRenderCache(self, surface: Surface, draw: Callable[[Surface], None]) -> tuple[dict['Renderer', tuple[Rect, Any]], Rect, Optional[Surface]]:
+        """
+        __fillRenderCache draws the subtree onto a new offscreen surface and stores it in the cache.
+
+        Args:
+            surface (Surface)                   : the surface the subtree is rendered onto (only collected, not drawn)
+            draw    (Callable[[Surface], None]) : draws the subtree onto the given surface
+
+        Returns (tuple[dict[Renderer, tuple[Rect, Any]], Rect, Optional[Surface]]): the drawn renderers, the drawn region
+                                                                                    and the offscreen surface
+                                                                                    (None if the subtree has to be drawn directly)
+        """
+        assert Renderer._drawer is not None
+
+        created: Optional[Surface] = None
+        region: Rect = Rect()
+        drawn: Optional[dict[Renderer, tuple[Rect, Any]]] = Renderer.__collect(lambda: draw(surface))
+        if drawn and not any(element._drawsTranslucent() for element in drawn):
+            regions: list[Rect] = [region for region, _ in drawn.values()]
+            region = regions[0]
+            for other in regions[1:]:
+                region = region.union(other)
+            if not region.isEmpty():
+                created = Renderer._drawer.createSurface(region)
+
+        if created is not None:
+            clip: Optional[Rect] = Renderer.__clip
+            Renderer.__clip = None
+            try:
+                draw(created)
+            finally:
+                Renderer.__clip = clip
+
+        cached: tuple[dict[Renderer, tuple[Rect, Any]], Rect, Optional[Surface]] = (drawn or {}, region, created)
+        Renderer.__renderCache[self] = cached
+        while len(Renderer.__renderCache) > Renderer.__renderCacheSize:
+            Renderer.__renderCache.popitem(last=False)
+        return cached
 
     # -------------------- abstract-methods --------------------
 
@@ -72,10 +225,22 @@ class Renderer(ABC):
 
     _drawer: type[SurfaceDrawer] | None = None
 
-    __cachedSortedRenderer: list['Renderer'] = []
-
     _postRenderQueue: list['Renderer'] = []
 
+    # dirty-rect rendering
+    __collecting: bool = False                          # if the current pass only collects the drawn renderers
+    __clip: Optional[Rect] = None                       # the region currently redrawn
+    __drawn: dict['Renderer', tuple[Rect, Any]] = {}    # renderers drawn in the current frame -> render state
+    __lastDrawn: dict['Renderer', tuple[Rect, Any]] = {}
+    __lastScreenSize: Optional[tuple[int, int]] = None
+    __fullRedraw: bool = True
+    __maxDirtyRects: int = 8
+
+    # offscreen subtree cache
+    __renderCache: OrderedDict['Renderer', tuple[dict['Renderer', tuple[Rect, Any]], Rect, Optional[Surface]]] = OrderedDict()
+    __renderCacheSize: int = 64
+    __currentCacheOwner: Optional['Renderer'] = None   # the cached subtree currently rendered
+
     @staticmethod
     def init(drawer: type[SurfaceDrawer], font: type[Font]) -> None:
         """
@@ -118,17 +283,32 @@ class Renderer(ABC):
         Renderer._postRenderQueue = []
 
     @staticmethod
-    def renderAll(screen: Surface, elements: list['Renderer']) -> list['Renderer']:
+    def __inRenderOrder(elements: 'list[Renderer] | RenderQueue') -> list['Renderer']:
+        """
+        __inRenderOrder returns the elements to render in render order.
+
+        Args:
+            elements (list[Renderer] | RenderQueue): the elements to render (lists are sorted by z-index)
+
+        Returns (list[Renderer]): the elements in render order
+        """
+        if isinstance(elements, RenderQueue):
+            return elements.getOrder()
+        return sorted(elements, key=lambda x: x.getZIndex())
+
+    @staticmethod
+    def renderAll(screen: Surface, elements: 'list[Renderer] | RenderQueue') -> list['Renderer']:
         """
         Render all elements in z-index order followed by post-render elements.
 
-        Elements are sorted by z-index if the list has changed since last render.
+        A RenderQueue is rendered by walking it, a list of elements is sorted by z-index
+        on every call (elements rendered every frame should be kept in a RenderQueue).
         After normal elements are drawn, any elements in the post-render queue
         are rendered on top.
 
         Args:
             screen (Surface): Target surface to render onto
-            elements (list[Renderer]): List of elements to render
+            elements (list[Renderer] | RenderQueue): Elements to render
 
         Returns:
             list[Renderer]: The sorted list of elements that were rendered
@@ -138,14 +318,359 @@ class Renderer(ABC):
         """
         if Renderer._drawer is None:
             raise ValueError("Renderer::drawer not instantiated!")
-        
-        if elements != Renderer.__cachedSortedRenderer:
-            elements = sorted(elements, key=lambda x: x.getZIndex())
-            Renderer.__cachedSortedRenderer = elements
-        for element in elements:
+
+        ordered: list[Renderer] = Renderer.__inRenderOrder(elements)
+        for element in ordered:
             element.render(screen)
 
         if len(Renderer._postRenderQueue) > 0:
             Renderer._renderPost(screen)
 
-        return elements
+        return ordered
+
+    # -------------------- dirty-rect rendering --------------------
+
+    @staticmethod
+    def _trackDraw(element: 'Renderer') -> bool:
+        """
+        _trackDraw has to be called by every Renderer drawing directly onto a surface
+        right before drawing.
+
+        Args:
+            element (Renderer): the renderer about to draw
+
+        Returns (bool): if the renderer should draw in the current pass
+        """
+        element._trackRender()
+        if Renderer.__collecting:
+            Renderer.__drawn[element] = element._getRenderState()
+            return False
+        if Renderer.__clip is None:
+            return True
+        return element._getRenderState()[0].intersects(Renderer.__clip)
+
+    @staticmethod
+    def __collect(draw: Callable[[], None]) -> Optional[dict['Renderer', tuple[Rect, Any]]]:
+        """
+        __collect collects the renderers drawn by the given function without drawing.
+
+        Args:
+            draw (Callable[[], None]): the function rendering the elements
+
+        Returns (Optional[dict[Renderer, tuple[Rect, Any]]]): the drawn renderers and their render state
+                                                             (None if post-render elements were queued)
+        """
+        saved = (Renderer.__collecting, Renderer.__drawn, Renderer.__clip, Renderer._postRenderQueue)
+        Renderer.__collecting, Renderer.__drawn, Renderer.__clip = True, {}, None
+        Renderer._postRenderQueue = []
+        try:
+            draw()
+            drawn: dict[Renderer, tuple[Rect, Any]] = Renderer.__drawn
+            queued: bool = len(Renderer._postRenderQueue) > 0
+        finally:
+            Renderer.__collecting, Renderer.__drawn, Renderer.__clip, Renderer._postRenderQueue = saved
+        return None if queued else drawn
+
+    @staticmethod
+    def setRenderCacheSize(size: int) -> None:
+        """
+        setRenderCacheSize sets the maximum amount of subtrees kept in offscreen surfaces.
+
+        Args:
+            size (int): the maximum amount of cached subtrees (0 disables the cache)
+        """
+        if not isinstance(size, int):
+            raise TypeError(f'size must be int, got {type(size)}')
+        if size < 0:
+            raise ValueError(f'size must not be negative, got {size}')
+        Renderer.__renderCacheSize = size
+        while len(Renderer.__renderCache) > size:
+            Renderer.__renderCache.popitem(last=False)
+
+    @staticmethod
+    def clearRenderCache() -> None:
+        """
+        clearRenderCache removes all cached offscreen surfaces.
+        """
+        Renderer.__renderCache.clear()
+
+    @staticmethod
+    def invalidateAll() -> None:
+        """
+        invalidateAll forces the next call of renderAllDirty to redraw the whole surface
+        (e.g. after the surface was drawn on from outside).
+        """
+        Renderer.__fullRedraw = True
+
+    @staticmethod
+    def setMaxDirtyRects(count: int) -> None:
+        """
+        setMaxDirtyRects sets the amount of separate dirty regions after which the
+        regions are merged into their bounding rect and redrawn in a single pass.
+
+        Args:
+            count (int): maximum amount of separately redrawn regions (>= 1)
+        """
+        if not isinstance(count, int):
+            raise TypeError(f'count must be int, got {type(count)}')
+        if count < 1:
+            raise ValueError(f'count must be at least 1, got {count}')
+        Renderer.__maxDirtyRects = count
+
+    @staticmethod
+    def __mergeRects(rects: list[Rect], bounds: Rect) -> list[Rect]:
+        """
+        __mergeRects clips the rects to the bounds and merges all overlapping rects.
+
+        Args:
+            rects   (list[Rect]): the rects to merge
+            bounds  (Rect)      : the bounds of the surface
+
+        Returns (list[Rect]): non-overlapping rects covering all given rects
+        """
+        merged: list[Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if rect.isEmpty():
+                continue
+            overlapping: bool = True
+            while overlapping:
+                overlapping = False
+                for i, other in enumerate(merged):
+                    if rect.intersects(other):
+                        rect = rect.union(merged.pop(i))
+                        overlapping = True
+                        break
+            merged.append(rect)
+
+        if len(merged) > Renderer.__maxDirtyRects:
+            union: Rect = merged[0]
+            for rect in merged[1:]:
+                union = union.union(rect)
+            merged = [union]
+        return merged
+
+    @staticmethod
+    def __collectDirtyRects() -> list[Rect]:
+        """
+        __collectDirtyRects compares the renderers drawn in the current frame with the last frame.
+
+        Returns (list[Rect]): the old and new regions of all renderers that appeared,
+                              disappeared, moved or changed their content
+        """
+        dirty: list[Rect] = []
+        last: dict[Renderer, tuple[Rect, Any]] = Renderer.__lastDrawn
+        for element, (region, state) in Renderer.__drawn.items():
+            previous: Optional[tuple[Rect, Any]] = last.get(element)
+            if previous is None:
+                dirty.append(region)
+            elif previous[1] != state:
+                dirty.append(previous[0])
+                dirty.append(region)
+        for element, (region, _) in last.items():
+            if element not in Renderer.__drawn:
+                dirty.append(region)
+        return dirty
+
+    @staticmethod
+    def __renderPass(screen: Surface, elements: list['Renderer'], clip: Optional[Rect], background: Optional[Color]) -> None:
+        """
+        __renderPass renders all elements (and post-render elements) inside the clip.
+
+        Args:
+            screen      (Surface)           : target surface to render onto
+            elements    (list[Renderer])    : the sorted elements to render
+            clip        (Optional[Rect])    : the region to redraw (None for the whole surface)
+            background  (Optional[Color])   : color to clear the region with before rendering
+        """
+        assert Renderer._drawer is not None
+        Renderer.__clip = clip
+        try:
+            if background is not None:
+                Renderer._drawer.drawrect(screen, clip if clip is not None else Rect(size=screen.getSize()), background)
+            for element in elements:
+                element.render(screen)
+            if len(Renderer._postRenderQueue) > 0:
+                Renderer._renderPost(screen)
+        finally:
+            Renderer.__clip = None
+
+    @staticmethod
+    def renderAllDirty(screen: Surface, elements: 'list[Renderer] | RenderQueue', background: Optional[Color]=None) -> list[Rect]:
+        """
+        Render only the regions of the screen that changed since the last call.
+
+        Every frame the drawn elements are collected (without drawing) and compared to
+        the last frame. The old and new regions of all elements that appeared, disappeared,
+        moved or changed their content are merged and redrawn under a clip of the surface.
+        If the surface does not support clipping (see Surface.setClip) the whole surface is
+        redrawn.
+
+        Usage (pygame):
+            rects = Renderer.renderAllDirty(screen, [ui], background='black')
+            pygame.display.update([pygame.Rect(r.getPosition(), r.getSize()) for r in rects])
+
+        Args:
+            screen      (Surface)           : target surface to render onto
+            elements    (list[Renderer] | RenderQueue): elements to render (see renderAll)
+            background  (Optional[Color])   : color to clear the redrawn regions with
+                                              (None if the caller restores the background itself)
+
+        Returns:
+            list[Rect]: the regions of the surface that were redrawn
+
+        Raises:
+            ValueError: If renderer was not initialized with a drawer
+        """
+        if Renderer._drawer is None:
+            raise ValueError("Renderer::drawer not instantiated!")
+
+        ordered: list[Renderer] = Renderer.__inRenderOrder(elements)
+
+        # collect the drawn elements of the frame
+        Renderer.__drawn = {}
+        Renderer.__collecting = True
+        try:
+            for element in ordered:
+                element.render(screen)
+            if len(Renderer._postRenderQueue) > 0:
+                Renderer._renderPost(screen)
+        finally:
+            Renderer.__collecting = False
+
+        screenRect: Rect = Rect(size=screen.getSize())
+        dirty: list[Rect]
+        if Renderer.__fullRedraw or Renderer.__lastScreenSize != screenRect.getSize():
+            dirty = [screenRect]
+        else:
+            dirty = Renderer.__mergeRects(Renderer.__collectDirtyRects(), screenRect)
+        Renderer.__lastDrawn = Renderer.__drawn
+        Renderer.__drawn = {}
+        Renderer.__lastScreenSize = screenRect.getSize()
+        Renderer.__fullRedraw = False
+
+        if len(dirty) == 0:
+            return []
+
+        # redraw the dirty regions
+        for rect in dirty:
+            if not screen.setClip(rect):
+                # clipping not supported by the backend -> redraw everything
+                Renderer.__renderPass(screen, ordered, None, background)
+                return [screenRect]
+            try:
+                Renderer.__renderPass(screen, ordered, rect, background)
+            finally:
+                screen.setClip(None)
+        return dirty
+
+
+class RenderQueue:
+    """
+    RenderQueue keeps a set of elements (e.g. the inner elements of a UI) in render order.
+
+    The queue is bucketed by z-index: active elements are kept in the bucket of their
+    z-index, sorted by their registration number. Registered elements move between the buckets
+    when setActive or setZIndex is called on them (keeping their place in registration order),
+    so rendering the queue is a linear walk without comparing or sorting.
+    Every element is registered with at most one queue.
+    """
+
+    __queued: dict[Renderer, tuple[int, Optional[int]]]  # registered elements -> (registration number, z-index of their bucket or None if inactive)
+    __zBuckets: dict[int, list[tuple[int, Renderer]]]   # z-index -> (registration number, active element) sorted by registration
+    __zOrder: list[int]                                 # sorted z-indices of the non-empty buckets
+    __order: Optional[list[Renderer]]                   # flattened queue (None if outdated)
+    __registered: int                                   # amount of registrations (the next registration number)
+
+    def __init__(self, elements: Iterable[Renderer]=()) -> None:
+        self.__queued = {}
+        self.__zBuckets = {}
+        self.__zOrder = []
+        self.__order = None
+        self.__registered = 0
+        for element in elements:
+            self.add(element)
+
+    def add(self, element: Renderer) -> None:
+        """
+        add registers an element with the queue (removing it from its previous queue).
+
+        Args:
+            element (Renderer): the element to register
+        """
+        if element._renderQueue is self:
+            return
+        if element._renderQueue is not None:
+            element._renderQueue.remove(element)
+        element._renderQueue = self
+        self.__queued[element] = (self.__registered, None)
+        self.__registered += 1
+        self.update(element)
+
+    def remove(self, element: Renderer) -> None:
+        """
+        remove removes an element from the queue.
+
+        Args:
+            element (Renderer): the element to remove
+        """
+        if element._renderQueue is not self:
+            return
+        self.__unbucket(element)
+        del self.__queued[element]
+        element._renderQueue = None
+
+    def contains(self, element: Renderer) -> bool:
+        return element._renderQueue is self
+
+    def getOrder(self) -> list[Renderer]:
+        """
+        getOrder returns the active registered elements in render order
+        (ascending z-index, registration order inside the same z-index).
+
+        Returns (list[Renderer]): the elements in render order
+        """
+        if self.__order is None:
+            self.__order = [element for z in self.__zOrder for _, element in self.__zBuckets[z]]
+        return self.__order
+
+    def update(self, element: Renderer) -> None:
+        """
+        update moves a registered element into the bucket of its current z-index
+        (or out of the buckets if it is inactive). Called by the element on setActive and setZIndex.
+
+        Args:
+            element (Renderer): the registered element
+        """
+        zindex: Optional[int] = element.getZIndex() if element.isActive() else None
+        sequence, bucketed = self.__queued[element]
+        if bucketed == zindex:
+            return
+        self.__unbucket(element)
+        self.__queued[element] = (sequence, zindex)
+        if zindex is None:
+            return
+        bucket: Optional[list[tuple[int, Renderer]]] = self.__zBuckets.get(zindex)
+        if bucket is None:
+            bucket = self.__zBuckets[zindex] = []
+            insort(self.__zOrder, zindex)
+        insort(bucket, (sequence, element), key=lambda entry: entry[0])
+        self.__order = None
+
+    def __unbucket(self, element: Renderer) -> None:
+        """
+        __unbucket removes a registered element from its bucket (keeping it registered).
+
+        Args:
+            element (Renderer): the registered element
+        """
+        sequence, zindex = self.__queued[element]
+        if zindex is None:
+            return
+        bucket: list[tuple[int, Renderer]] = self.__zBuckets[zindex]
+        del bucket[bisect_left(bucket, sequence, key=lambda entry: entry[0])]
+        if len(bucket) == 0:
+            del self.__zBuckets[zindex]
+            self.__zOrder.remove(zindex)
+        self.__queued[element] = (sequence, None)
+        self.__order = None
@@ -1 +1,2 @@
+from .layoutnode   import LayoutNode
 from .stylemanager import StyleManager
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+@dataclass
+class LayoutNode:
+    """
+    LayoutNode is the compiled form of a parsed xml node. The arguments of its element are already
+    converted (see Element.convertArgs), so building an element from the node interprets no strings.
+    Nodes are not changed after compiling and are stored pickled in the compiled layout cache.
+    """
+    tag     : str                                                           # lowercase tag
+    args    : dict[str, Any]                                                # converted arguments of the element
+    children: 'list[LayoutNode]'      = field(default_factory=list)
+    id      : Optional[str]           = None                                # label (the name of style nodes)
+    style   : Optional[str]           = None                                # fixed style, None uses the default style
+    texts   : list[tuple[int, str]]   = field(default_factory=list)         # contents set by the 'text' attribute
+    styled  : 'dict[str, LayoutNode]' = field(default_factory=dict)         # labeled nodes of style nodes
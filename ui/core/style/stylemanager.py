@@ -1,14 +1,14 @@
-import xml.etree.ElementTree as ET
 from typing import Optional
 
 from ...utility import StyledDefault
+from .layoutnode import LayoutNode
 
 class StyleManager:
     """Central registry for UI render styles.
 
-    The StyleManager stores parsed XML style fragments (as ElementTree
+    The StyleManager stores compiled XML style fragments (as LayoutNode
     nodes) keyed by a style name. Each style is a mapping from element
-    tags (e.g. 'button', 'text') to the XML element that defines the
+    tags (e.g. 'button', 'text') to the compiled node that defines the
     default rendering properties for that element.
 
     Responsibilities:
@@ -21,25 +21,24 @@ class StyleManager:
     Notes:
     - Style names are stored as provided (case-sensitive). Callers
         should normalize names if they require case-insensitive lookups.
-    - The stored values are ElementTree `ET.Element` nodes and are not
-        copied by the manager; consumers should copy them if they will
-        mutate the nodes.
+    - The stored values are `LayoutNode` nodes and are not copied by
+        the manager; the nodes must not be mutated.
     """
 
-    styles: dict[str, dict[str, ET.Element]] = {}
+    styles: dict[str, dict[str, LayoutNode]] = {}
 
     # Name of the globally active default style (empty = none)
     defaultStyle: str = ''
 
     @staticmethod
-    def addStyle(name: str, styledElements: dict[str, ET.Element]) -> None:
+    def addStyle(name: str, styledElements: dict[str, LayoutNode]) -> None:
         """Register a named style collection.
 
         Args:
             name: Style name to register. Existing entries with the same
                 name will be overwritten.
             styledElements: Mapping from element tag to an
-                ElementTree `ET.Element` describing the style.
+                `LayoutNode` describing the style.
 
         Returns:
             None
@@ -75,7 +74,7 @@ class StyleManager:
         return False
 
     @staticmethod
-    def getStyledElementNode(element: str, stylename: str) -> Optional[ET.Element]:
+    def getStyledElementNode(element: str, stylename: str) -> Optional[LayoutNode]:
         """Retrieve the style node for a specific element type.
 
         Args:
@@ -83,7 +82,7 @@ class StyleManager:
             stylename: Registered style name to query.
 
         Returns:
-            The ElementTree node for the requested element in the
+            The compiled node for the requested element in the
             specified style, or None if the style or element is not
             found.
 
@@ -97,7 +96,7 @@ class StyleManager:
         return None
 
     @staticmethod
-    def getDefault(tag: StyledDefault) -> Optional[ET.Element]:
+    def getDefault(tag: StyledDefault) -> Optional[LayoutNode]:
         """Get the style node for `tag` from the current default style.
 
         Args:
@@ -105,7 +104,7 @@ class StyleManager:
                 the element type.
 
         Returns:
-            The ElementTree node for the tag from the active default
+            The compiled node for the tag from the active default
             style, or None if no default style is set or the node is
             not present.
         """
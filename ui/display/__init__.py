@@ -1,5 +1,7 @@
 from .font        import Font
 from .fontmanager import FontManager
+from .textcache   import TextCache
+from .glyphatlas  import GlyphAtlas
 
 from .surface       import Surface
-from .surfacedrawer import SurfaceDrawer
+from .surfacedrawer import SurfaceDrawer, LineSegment
@@ -69,6 +69,21 @@ class Font(ABC):
         """
         pass
 
+    def measure(self, text: str) -> tuple[int, int]:
+        """Get the size of the surface the text would be rendered onto.
+
+        Used for font size fitting, which measures a text at many sizes.
+        Backends able to measure text without rendering it should override
+        this method; the default implementation renders the text.
+
+        Args:
+            text: String to measure
+
+        Returns:
+            tuple[int, int]: (width, height) of the rendered text in pixels
+        """
+        return self.render(text, (255, 255, 255)).getSize()
+
     @staticmethod
     @abstractmethod
     def SysFont(name: str, fontsize: int) -> 'Font':
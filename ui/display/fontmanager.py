@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from .font import Font
 
 class FontManager:
@@ -20,14 +22,25 @@ class FontManager:
     - Font implementation changes are atomic
     - Cache access is synchronized
 
+    Font instances are shared through a bounded LRU cache keyed by (name, size),
+    so system fonts are only loaded once per size.
+
     Usage:
         FontManager.setFont(MyFontImpl)  # Set implementation
         font_class = FontManager.getFont()  # Get implementation
-        font = font_class.SysFont('Arial', 12)  # Create instance
+        font = FontManager.getSysFont('Arial', 12)  # Get (cached) instance
     """
 
     __font: type[Font] | None = None # the current implementation of Font
 
+    __fontCache: OrderedDict[tuple[str, int], Font] = OrderedDict() # (name, size) -> font instance (LRU order)
+    __fontCacheSize: int = 64
+    __fontCacheHits: int = 0
+    __fontCacheMisses: int = 0
+
+    __fittingSizes: OrderedDict[tuple[str, tuple[int, int], str], int] = OrderedDict() # (name, box size, text) -> font size
+    __fittingSizesSize: int = 1024
+
     @staticmethod
     def setFont(font: type[Font]) -> None:
         """Set the active font implementation.
@@ -64,7 +77,7 @@ class FontManager:
                 f'{missing}')
 
         FontManager.__font = font
-
+        FontManager.clearFontCache()
 
     @staticmethod
     def getFont() -> type[Font]:
@@ -89,6 +102,108 @@ class FontManager:
                 'Call FontManager.setFont() first.')
         return FontManager.__font
 
+    # -------------------- font-cache --------------------
+
+    @staticmethod
+    def getSysFont(name: str, fontsize: int) -> Font:
+        """Get a (cached) system font instance of the active font implementation.
+
+        Args:
+            name: Font family name
+            fontsize: Font size in points
+
+        Returns:
+            Font: Shared font instance for the name and size
+
+        Raises:
+            RuntimeError: If no font implementation is set
+        """
+        key: tuple[str, int] = (name, fontsize)
+        font: Font | None = FontManager.__fontCache.get(key)
+        if font is not None:
+            FontManager.__fontCacheHits += 1
+            FontManager.__fontCache.move_to_end(key)
+            return font
+
+        FontManager.__fontCacheMisses += 1
+        font = FontManager.getFont().SysFont(name, fontsize)
+        if FontManager.__fontCacheSize > 0:
+            FontManager.__fontCache[key] = font
+            while len(FontManager.__fontCache) > FontManager.__fontCacheSize:
+                FontManager.__fontCache.popitem(last=False)
+        return font
+
+    @staticmethod
+    def setFontCacheSize(size: int) -> None:
+        """Set the maximum amount of cached font instances.
+
+        Args:
+            size: Maximum amount of cached fonts (0 disables the cache)
+
+        Raises:
+            TypeError: If size is not an integer
+            ValueError: If size is negative
+        """
+        if not isinstance(size, int):
+            raise TypeError(f'size must be int, got {type(size)}')
+        if size < 0:
+            raise ValueError(f'size must not be negative, got {size}')
+        FontManager.__fontCacheSize = size
+        while len(FontManager.__fontCache) > size:
+            FontManager.__fontCache.popitem(last=False)
+
+    @staticmethod
+    def getFontCacheStats() -> tuple[int, int]:
+        """Get the hit and miss counters of the font cache.
+
+        Returns:
+            tuple[int, int]: (hits, misses) since the last clear
+        """
+        return FontManager.__fontCacheHits, FontManager.__fontCacheMisses
+
+    @staticmethod
+    def clearFontCache() -> None:
+        """Remove all cached font instances and reset the counters."""
+        FontManager.__fontCache.clear()
+        FontManager.__fontCacheHits = 0
+        FontManager.__fontCacheMisses = 0
+        FontManager.__fittingSizes.clear()
+
+    @staticmethod
+    def getFittingFontSize(name: str, boxSize: tuple[int, int], text: str) -> int:
+        """Get the maximal font size for which the text still fits into a box.
+
+        The size is searched with Font.measure and memoized per (name, box size, text).
+
+        Args:
+            name: Font family name
+            boxSize: (width, height) of the box the text should fit in
+            text: String to fit into the box
+
+        Returns:
+            int: the maximal font size to still fit into the box
+        """
+        key: tuple[str, tuple[int, int], str] = (name, boxSize, text)
+        fontsize: int | None = FontManager.__fittingSizes.get(key)
+        if fontsize is not None:
+            FontManager.__fittingSizes.move_to_end(key)
+            return fontsize
+
+        start: int = 0
+        end: int = min(boxSize)
+        while start < end:
+            mid: int = int((start + end) / 2)
+            width, height = FontManager.getSysFont(name, mid).measure(text)
+            if boxSize[0] > width and boxSize[1] > height:
+                start = mid + 1
+            else:
+                end = mid - 1
+
+        FontManager.__fittingSizes[key] = start
+        while len(FontManager.__fittingSizes) > FontManager.__fittingSizesSize:
+            FontManager.__fittingSizes.popitem(last=False)
+        return start
+
     @staticmethod
     def validate_font_state() -> None:
         """Validate the current font implementation state.
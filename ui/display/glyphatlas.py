@@ -0,0 +1,124 @@
+from collections import OrderedDict
+from typing import Any
+
+from ..utility     import Color, tColor
+from .font        import Font
+from .fontmanager import FontManager
+from .surface     import Surface
+
+AtlasKey = tuple[str, int, Any]
+Glyph = tuple[Surface, int] # (rendered glyph, advance)
+
+class GlyphAtlas:
+    """Static cache of rendered glyphs used to compose rapidly changing short texts.
+
+    Every atlas stores the glyphs of one (font name, size, resolved RGBA color). A text
+    is laid out by placing the cached glyphs next to each other, advancing by the
+    measured width of every glyph (kerning is approximated by the glyph advances).
+    Changing a numeric label therefore costs a few blits instead of rasterizing the
+    whole string.
+
+    The amount of atlases is bounded with LRU eviction.
+
+    Usage:
+        glyphs, size = GlyphAtlas.layout('Arial', 12, '60.0', 'white')
+        for glyph, x in glyphs:
+            surface.blit(glyph, (left + x, top))
+    """
+
+    __atlases: OrderedDict[AtlasKey, dict[str, Glyph]] = OrderedDict() # (name, size, rgba) -> glyphs (LRU order)
+    __maxAtlases: int = 32
+    __font: type[Font] | None = None # font implementation the cached glyphs were rendered with
+
+    # -------------------- configuration --------------------
+
+    @staticmethod
+    def setMaxAtlases(count: int) -> None:
+        """Set the maximum amount of cached atlases.
+
+        Args:
+            count: Maximum amount of (font name, size, color) atlases (>= 1)
+
+        Raises:
+            TypeError: If count is not an integer
+            ValueError: If count is smaller than 1
+        """
+        if not isinstance(count, int):
+            raise TypeError(f'count must be int, got {type(count)}')
+        if count < 1:
+            raise ValueError(f'count must be at least 1, got {count}')
+        GlyphAtlas.__maxAtlases = count
+        while len(GlyphAtlas.__atlases) > count:
+            GlyphAtlas.__atlases.popitem(last=False)
+
+    @staticmethod
+    def clear() -> None:
+        """Remove all cached atlases."""
+        GlyphAtlas.__atlases.clear()
+
+    # -------------------- layout --------------------
+
+    @staticmethod
+    def __getAtlas(name: str, fontsize: int, color: Color) -> dict[str, Glyph]:
+        """
+        __getAtlas returns the (cached) atlas of the font, size and color.
+
+        Args:
+            name        (str)   : font family name
+            fontsize    (int)   : font size in points
+            color       (Color) : glyph color
+
+        Returns (dict[str, Glyph]): the glyphs of the atlas
+        """
+        font: type[Font] = FontManager.getFont()
+        if font is not GlyphAtlas.__font:
+            GlyphAtlas.clear()
+            GlyphAtlas.__font = font
+
+        try:
+            rgba: Any = tColor.to_rgba(color)
+        except (TypeError, ValueError):
+            rgba = color
+        key: AtlasKey = (name, fontsize, rgba)
+        atlas: dict[str, Glyph] | None = GlyphAtlas.__atlases.get(key)
+        if atlas is None:
+            atlas = {}
+            GlyphAtlas.__atlases[key] = atlas
+            while len(GlyphAtlas.__atlases) > GlyphAtlas.__maxAtlases:
+                GlyphAtlas.__atlases.popitem(last=False)
+        else:
+            GlyphAtlas.__atlases.move_to_end(key)
+        return atlas
+
+    @staticmethod
+    def layout(name: str, fontsize: int, text: str, color: Color) -> tuple[list[tuple[Surface, int]], tuple[int, int]]:
+        """Lay out a text from cached glyphs.
+
+        Args:
+            name: Font family name
+            fontsize: Font size in points
+            text: String to lay out
+            color: Text color
+
+        Returns:
+            tuple[list[tuple[Surface, int]], tuple[int, int]]: the glyph surfaces with their
+                horizontal offset from the start of the text and the size of the whole text
+
+        Raises:
+            RuntimeError: If no font implementation is set
+        """
+        atlas: dict[str, Glyph] = GlyphAtlas.__getAtlas(name, fontsize, color)
+        glyphs: list[tuple[Surface, int]] = []
+        x: int = 0
+        height: int = 0
+        for char in text:
+            glyph: Glyph | None = atlas.get(char)
+            if glyph is None:
+                font: Font = FontManager.getSysFont(name, fontsize)
+                glyph = (font.render(char, color), font.measure(char)[0])
+                atlas[char] = glyph
+            surface, advance = glyph
+            glyphs.append((surface, x))
+            x += advance
+            height = max(height, surface.getSize()[1])
+        return glyphs, (x, height)
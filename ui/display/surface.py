@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..utility import Rect
 
 
 class Surface(ABC):
@@ -132,3 +135,18 @@ class Surface(ABC):
         """
         pass
 
+    def setClip(self, rect: Optional[Rect]) -> bool:
+        """Restrict all following drawing operations to a region of the surface.
+
+        Used by dirty-rect rendering to redraw only the changed regions.
+        Backends supporting clipping override this method; the default
+        implementation does not clip and returns False, in which case the
+        renderer falls back to redrawing the whole surface.
+
+        Args:
+            rect: Region to restrict drawing to (None removes the clip)
+
+        Returns:
+            bool: True if the clip was applied
+        """
+        return False
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Any, Optional, Sequence
 
 from ..utility import Color, Rect
 from .surface import Surface
 
+LineSegment = tuple[tuple[int, int], tuple[int, int], int] # (startpoint, endpoint, thickness)
+
 class SurfaceDrawer(ABC):
     """
     Abstract base class defining the drawing interface for UI surfaces.
@@ -99,3 +102,77 @@ class SurfaceDrawer(ABC):
         8. Handle drawing errors gracefully
         """
         pass
+
+    @classmethod
+    def drawrects(cls, surface: Surface, rects: Sequence[Rect], colors: Sequence[Color]) -> None:
+        """
+        Draw many filled rectangles on a surface (in order).
+
+        Used by atoms to submit their whole render cache in one call. Backends able to
+        draw batches natively (e.g. resolving every color only once) override this method;
+        the default implementation calls drawrect for every rectangle.
+
+        Args:
+            surface: Target surface for drawing
+            rects: Rectangles to fill
+            colors: Fill color of every rectangle (same length as rects)
+        """
+        for rect, color in zip(rects, colors):
+            cls.drawrect(surface, rect, color)
+
+    @classmethod
+    def drawlines(cls, surface: Surface, lines: Sequence[LineSegment], colors: Sequence[Color]) -> None:
+        """
+        Draw many lines on a surface (in order).
+
+        Used by atoms to submit their whole render cache in one call. Backends able to
+        draw batches natively override this method; the default implementation calls
+        drawline for every line.
+
+        Args:
+            surface: Target surface for drawing
+            lines: (startpoint, endpoint, thickness) of every line
+            colors: Color of every line (same length as lines)
+        """
+        for (startpoint, endpoint, thickness), color in zip(lines, colors):
+            cls.drawline(surface, startpoint, endpoint, color, thickness=thickness)
+
+    @staticmethod
+    def createSurface(region: Rect) -> Optional[Surface]:
+        """
+        Create a transparent offscreen surface covering a region of the screen.
+
+        Used to cache the rendering of static subtrees. All drawing operations on the
+        offscreen surface (drawline, drawrect, blit, setClip) use screen coordinates,
+        i.e. the top-left corner of the region is drawn at (0,0) of the offscreen surface.
+        Blitting the offscreen surface at the position of the region onto the screen
+        reproduces the drawn content.
+
+        Backends supporting offscreen surfaces override this method; the default
+        implementation returns None, in which case nothing is cached.
+
+        Args:
+            region: Region of the screen the surface covers
+
+        Returns:
+            Optional[Surface]: the offscreen surface or None if not supported
+        """
+        return None
+
+    @staticmethod
+    def createPixelSurface(region: Rect, pixels: Any) -> Optional[Surface]:
+        """
+        Create a surface from a buffer of RGBA pixels covering a region of the screen.
+
+        Used to blit pre-rasterized content (e.g. the fill patterns of a Box) in one call.
+        Backends supporting pixel buffers override this method; the default
+        implementation returns None, in which case the content is drawn with drawrect.
+
+        Args:
+            region: Region of the screen the pixels cover
+            pixels: (height, width, 4) uint8 numpy array of RGBA values
+
+        Returns:
+            Optional[Surface]: the surface or None if not supported
+        """
+        return None
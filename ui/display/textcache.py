@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from typing import Any
+
+from ..utility     import Color, tColor
+from .font        import Font
+from .fontmanager import FontManager
+from .surface     import Surface
+
+TextKey = tuple[str, int, str, Any]
+
+class TextCache:
+    """Static LRU cache of rendered text surfaces.
+
+    Rendered texts are keyed by (font name, size, content, resolved RGBA color), so
+    all Text elements showing the same string in the same style share one Surface
+    and repeated labels (e.g. 'Prev'/'Next' of every Section) are only rendered once.
+
+    The cache is bounded by the memory of the stored surfaces (estimated as 4 bytes
+    per pixel); the least recently used surfaces are evicted first.
+
+    Usage:
+        TextCache.setMaxBytes(8 * 1024 * 1024)                      # set memory budget
+        surface = TextCache.render('Arial', 12, 'Next', 'white')    # get (cached) text surface
+        TextCache.getStats()                                        # hits, misses, evictions, ...
+    """
+
+    __surfaces: OrderedDict[TextKey, tuple[Surface, int]] = OrderedDict() # key -> (surface, bytes) (LRU order)
+    __maxBytes: int = 16 * 1024 * 1024
+    __usedBytes: int = 0
+    __font: type[Font] | None = None # font implementation the cached surfaces were rendered with
+
+    __hits: int = 0
+    __misses: int = 0
+    __evictions: int = 0
+
+    # -------------------- configuration --------------------
+
+    @staticmethod
+    def setMaxBytes(maxBytes: int) -> None:
+        """Set the memory budget of the cache.
+
+        Args:
+            maxBytes: Maximum estimated memory of all cached surfaces (0 disables the cache)
+
+        Raises:
+            TypeError: If maxBytes is not an integer
+            ValueError: If maxBytes is negative
+        """
+        if not isinstance(maxBytes, int):
+            raise TypeError(f'maxBytes must be int, got {type(maxBytes)}')
+        if maxBytes < 0:
+            raise ValueError(f'maxBytes must not be negative, got {maxBytes}')
+        TextCache.__maxBytes = maxBytes
+        TextCache.__evict()
+
+    @staticmethod
+    def getStats() -> dict[str, int]:
+        """Get the statistics of the cache.
+
+        Returns:
+            dict[str, int]: hits, misses and evictions since the last clear,
+                            the amount of cached surfaces (entries) and their estimated memory (bytes)
+        """
+        return {'hits': TextCache.__hits, 'misses': TextCache.__misses, 'evictions': TextCache.__evictions,
+                'entries': len(TextCache.__surfaces), 'bytes': TextCache.__usedBytes}
+
+    @staticmethod
+    def clear() -> None:
+        """Remove all cached surfaces and reset the statistics."""
+        TextCache.__surfaces.clear()
+        TextCache.__usedBytes = 0
+        TextCache.__hits = 0
+        TextCache.__misses = 0
+        TextCache.__evictions = 0
+
+    # -------------------- rendering --------------------
+
+    @staticmethod
+    def __resolveColor(color: Color) -> Any:
+        """
+        __resolveColor resolves a color to its RGBA value for use as cache key.
+
+        Args:
+            color (Color): the color to resolve
+
+        Returns (Any): the RGBA tuple (or the color itself if it can not be resolved)
+        """
+        try:
+            return tColor.to_rgba(color)
+        except (TypeError, ValueError):
+            return color
+
+    @staticmethod
+    def __evict() -> None:
+        """
+        __evict removes the least recently used surfaces until the memory budget is met.
+        """
+        while TextCache.__usedBytes > TextCache.__maxBytes and len(TextCache.__surfaces) > 0:
+            _, (_, size) = TextCache.__surfaces.popitem(last=False)
+            TextCache.__usedBytes -= size
+            TextCache.__evictions += 1
+
+    @staticmethod
+    def render(name: str, fontsize: int, text: str, color: Color) -> Surface:
+        """Get the surface of a rendered text.
+
+        Args:
+            name: Font family name
+            fontsize: Font size in points
+            text: String to render
+            color: Text color
+
+        Returns:
+            Surface: The (shared) surface containing the rendered text
+
+        Raises:
+            RuntimeError: If no font implementation is set
+        """
+        font: type[Font] = FontManager.getFont()
+        if font is not TextCache.__font:
+            TextCache.clear()
+            TextCache.__font = font
+
+        key: TextKey = (name, fontsize, text, TextCache.__resolveColor(color))
+        cached: tuple[Surface, int] | None = TextCache.__surfaces.get(key)
+        if cached is not None:
+            TextCache.__hits += 1
+            TextCache.__surfaces.move_to_end(key)
+            return cached[0]
+
+        TextCache.__misses += 1
+        surface: Surface = FontManager.getSysFont(name, fontsize).render(text, color)
+        width, height = surface.getSize()
+        size: int = 4 * width * height
+        if size <= TextCache.__maxBytes:
+            TextCache.__surfaces[key] = (surface, size)
+            TextCache.__usedBytes += size
+            TextCache.__evict()
+        return surface
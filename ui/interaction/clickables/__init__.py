@@ -1,3 +1,4 @@
 from .clickable import Clickable
 from .holdable import Holdable
 from .togglable import Togglable
+from .hitgrid import HitGrid
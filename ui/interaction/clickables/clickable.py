@@ -1,9 +1,10 @@
 from abc import ABC
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
-from ...utility     import iRect, Rect
+from ...utility     import iRect, Rect, Parsable
 from ..event        import EventManager
-from ..inputmanager import InputManager
+from ..inputmanager import InputManager, InputEvent
+from .hitgrid       import HitGrid
 
 class Clickable(iRect, ABC):
     """Abstract base class for clickable UI elements with event handling.
@@ -27,12 +28,16 @@ class Clickable(iRect, ABC):
         _passiveTriggerCallback (str): ID for unchecked trigger
         _onclick (str): Event ID for click handling
         _buttonActive (bool): Current active state
+        _triggerEvents (list[str]): Events subscribed with mouse-position-checking
+        _globalTriggerEvents (list[str]): Events subscribed without checks
     """
 
     _activeTriggerCallback: str
     _passiveTriggerCallback: str
     _onclick: str
     _buttonActive: bool
+    _triggerEvents: list[str]
+    _globalTriggerEvents: list[str]
 
     def __init__(self, buttonActive: bool=True) -> None:
         """Initialize a new clickable element.
@@ -48,6 +53,8 @@ class Clickable(iRect, ABC):
 
         self._buttonActive = buttonActive
         self._onclick = EventManager.createEvent()
+        self._triggerEvents = []
+        self._globalTriggerEvents = []
         
         # Create bound callbacks with proper type checking
         if not hasattr(self, 'activeTrigger') or not callable(getattr(self, 'activeTrigger')):
@@ -76,6 +83,7 @@ class Clickable(iRect, ABC):
             buttonActive (bool): new active-state of the Button
         """
         self._buttonActive = buttonActive
+        self._syncHitGrid()
 
     def toggleButtonActive(self) -> bool:
         """
@@ -84,8 +92,38 @@ class Clickable(iRect, ABC):
         Returns (bool): the new active-state of the Button
         """
         self._buttonActive = not self._buttonActive
+        self._syncHitGrid()
         return self._buttonActive
 
+    # -------------------- hit-testing --------------------
+
+    def getActiveTriggerCallback(self) -> str:
+        """
+        getActiveTriggerCallback returns the id of the mouse-position-checked trigger callback.
+
+        Returns (str): the id of the active trigger callback
+        """
+        return self._activeTriggerCallback
+
+    def _updateHitBounds(self) -> None:
+        """
+        _updateHitBounds refreshes the bounds of the clickable in the HitGrid.
+        Has to be called whenever the position or size of the clickable change.
+        """
+        if HitGrid.contains(self):
+            HitGrid.update(self)
+
+    def _syncHitGrid(self) -> None:
+        """
+        _syncHitGrid indexes the clickable in the HitGrid while it is active and subscribed
+        to a mouse-position-checked trigger event and removes it otherwise.
+        Has to be called whenever the active-state or the trigger events change.
+        """
+        if self._buttonActive and self._triggerEvents:
+            HitGrid.update(self)
+        else:
+            HitGrid.remove(self)
+
     # -------------------- change-priority --------------------
 
     def setPriority(self, priority: int) -> None:
@@ -172,7 +210,12 @@ class Clickable(iRect, ABC):
             raise TypeError(f'event must be a string, got {type(event)}')
         if not event:
             raise ValueError('event identifier cannot be empty')
-        return EventManager.subscribeToEvent(event, self._activeTriggerCallback)
+        if EventManager.subscribeToEvent(event, self._activeTriggerCallback, hitTested=True):
+            if event not in self._triggerEvents:
+                self._triggerEvents.append(event)
+            self._syncHitGrid()
+            return True
+        return False
 
     def removeTriggerEvent(self, event: str) -> bool:
         """Remove a mouse-position-checked trigger event subscription.
@@ -191,7 +234,11 @@ class Clickable(iRect, ABC):
             raise TypeError(f'event must be a string, got {type(event)}')
         if not event:
             raise ValueError('event identifier cannot be empty')
-        return EventManager.unsubscribeToEvent(event, self._activeTriggerCallback)
+        if event in self._triggerEvents:
+            self._triggerEvents.remove(event)
+        unsubscribed: bool = EventManager.unsubscribeToEvent(event, self._activeTriggerCallback)
+        self._syncHitGrid()
+        return unsubscribed
     
     def addGlobalTriggerEvent(self, event: str) -> bool:
         """Subscribe to an event that triggers immediately without checks.
@@ -210,7 +257,11 @@ class Clickable(iRect, ABC):
             raise TypeError(f'event must be a string, got {type(event)}')
         if not event:
             raise ValueError('event identifier cannot be empty')
-        return EventManager.subscribeToEvent(event, self._passiveTriggerCallback)
+        if EventManager.subscribeToEvent(event, self._passiveTriggerCallback):
+            if event not in self._globalTriggerEvents:
+                self._globalTriggerEvents.append(event)
+            return True
+        return False
 
     def removeGlobalTriggerEvent(self, event: str) -> bool:
         """Remove an immediate trigger event subscription.
@@ -229,8 +280,68 @@ class Clickable(iRect, ABC):
             raise TypeError(f'event must be a string, got {type(event)}')
         if not event:
             raise ValueError('event identifier cannot be empty')
+        if event in self._globalTriggerEvents:
+            self._globalTriggerEvents.remove(event)
         return EventManager.unsubscribeToEvent(event, self._passiveTriggerCallback)
+
+    def copyTriggerEvents(self, other: 'Clickable') -> None:
+        """Subscribe to all trigger events of another clickable (used when cloning elements).
+
+        Events this clickable is already subscribed to are skipped.
+        Subscriptions to the click (and other) events of the other clickable are not copied.
+
+        Args:
+            other (Clickable): Clickable to copy the trigger events from
+
+        Raises:
+            TypeError: If other is not a Clickable
+        """
+        if not isinstance(other, Clickable):
+            raise TypeError(f'other must be a Clickable, got {type(other)}')
+        for event in other._triggerEvents:
+            if event not in self._triggerEvents:
+                self.addTriggerEvent(event)
+        for event in other._globalTriggerEvents:
+            if event not in self._globalTriggerEvents:
+                self.addGlobalTriggerEvent(event)
     
+    # -------------------- parsing-trigger-events --------------------
+
+    @staticmethod
+    def parseTriggerEvents(args: dict[str, Any]) -> Optional[list[tuple[bool, InputEvent]]]:
+        """Convert the trigger arguments of a parsed element ('trigger' and 'globaltrigger').
+
+        Args:
+            args (dict[str, Any]): the (xml) arguments of the element
+
+        Returns:
+            Optional[list[tuple[bool, InputEvent]]] ~ [(global, event)]: the trigger events
+            in argument order, None if no trigger argument is given
+        """
+        triggers: Optional[list[tuple[bool, InputEvent]]] = None
+        for tag, value in args.items():
+            match tag:
+                case 'trigger' | 'globaltrigger' | 'gtrigger' | 'global':
+                    if triggers is None:
+                        triggers = []
+                    for v in Parsable.parseList(value):
+                        triggers.append((tag != 'trigger', InputEvent.LEFTDOWN if v.lower() == 'click' else InputEvent.fromStr(v)))
+        return triggers
+
+    def addTriggerEvents(self, triggers: Optional[list[tuple[bool, InputEvent]]]) -> None:
+        """Subscribe to parsed trigger events (see parseTriggerEvents).
+
+        Args:
+            triggers (Optional[list[tuple[bool, InputEvent]]]): the trigger events, None triggers on left clicks
+        """
+        if triggers is None:
+            triggers = [(False, InputEvent.LEFTDOWN)]
+        for isGlobal, event in triggers:
+            if isGlobal:
+                self.addGlobalTriggerEvent(InputManager.getEvent(event))
+            else:
+                self.addTriggerEvent(InputManager.getEvent(event))
+
     # -------------------- subscriptions --------------------
 
     def subscribeToClick(self, callback: str) -> bool:
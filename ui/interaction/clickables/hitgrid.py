@@ -0,0 +1,138 @@
+from typing import TYPE_CHECKING
+
+from ...utility     import Rect
+from ..event        import EventManager
+from ..inputmanager import InputManager
+
+if TYPE_CHECKING:
+    from .clickable import Clickable
+
+Cell = tuple[int, int]
+
+class HitGrid:
+    """
+    Static uniform-grid index of clickable bounds used for hit-testing.
+
+    Clickables subscribing their mouse-checked trigger to an event are stored in
+    every grid cell their bounds overlap. When such an event is triggered, only the
+    clickables stored in the cell under the cursor are tested against the mouse
+    position, so the cost of a click does not grow with the amount of clickables.
+
+    The bounds are refreshed whenever the layout of a clickable changes
+    (see Clickable._updateHitBounds).
+
+    Usage:
+        HitGrid.setCellSize(128)    # change the grid resolution
+        HitGrid.hitTest((x, y))     # ids of the trigger callbacks hit at (x, y)
+    """
+
+    __cellSize: int = 64
+    __bounds: dict['Clickable', tuple[Rect, list[Cell]]] = {}
+    __cells: dict[Cell, set['Clickable']] = {}
+
+    # -------------------- configuration --------------------
+
+    @staticmethod
+    def setCellSize(cellSize: int) -> None:
+        """
+        setCellSize sets the edge length of the grid cells and rebuilds the grid.
+
+        Args:
+            cellSize (int): edge length of a grid cell in pixels (> 0)
+        """
+        if not isinstance(cellSize, int):
+            raise TypeError(f'cellSize must be int, got {type(cellSize)}')
+        if cellSize <= 0:
+            raise ValueError(f'cellSize must be positive, got {cellSize}')
+        HitGrid.__cellSize = cellSize
+
+        clickables: list['Clickable'] = list(HitGrid.__bounds)
+        HitGrid.__bounds = {}
+        HitGrid.__cells = {}
+        for clickable in clickables:
+            HitGrid.update(clickable)
+
+    # -------------------- managing --------------------
+
+    @staticmethod
+    def contains(clickable: 'Clickable') -> bool:
+        """
+        contains returns if the clickable is stored in the grid.
+
+        Args:
+            clickable (Clickable): the clickable to look for
+
+        Returns (bool): if the clickable is stored in the grid
+        """
+        return clickable in HitGrid.__bounds
+
+    @staticmethod
+    def update(clickable: 'Clickable') -> None:
+        """
+        update stores the clickable with its current bounds in the grid.
+
+        Args:
+            clickable (Clickable): the clickable to store or refresh
+        """
+        bounds: Rect = Rect(clickable.getPosition(), clickable.getSize())
+        if clickable in HitGrid.__bounds:
+            stored: Rect = HitGrid.__bounds[clickable][0]
+            if stored.getPosition() == bounds.getPosition() and stored.getSize() == bounds.getSize():
+                return
+            HitGrid.remove(clickable)
+
+        size: int = HitGrid.__cellSize
+        cells: list[Cell] = [(x, y) for x in range(bounds.left // size, bounds.right // size + 1)
+                                    for y in range(bounds.top // size, bounds.bottom // size + 1)]
+        for cell in cells:
+            HitGrid.__cells.setdefault(cell, set()).add(clickable)
+        HitGrid.__bounds[clickable] = (bounds, cells)
+
+    @staticmethod
+    def remove(clickable: 'Clickable') -> bool:
+        """
+        remove removes the clickable from the grid.
+
+        Args:
+            clickable (Clickable): the clickable to remove
+
+        Returns (bool): if the clickable was stored in the grid
+        """
+        if clickable not in HitGrid.__bounds:
+            return False
+        _, cells = HitGrid.__bounds.pop(clickable)
+        for cell in cells:
+            stored: set['Clickable'] = HitGrid.__cells[cell]
+            stored.discard(clickable)
+            if not stored:
+                del HitGrid.__cells[cell]
+        return True
+
+    # -------------------- hit-testing --------------------
+
+    @staticmethod
+    def hitTest(position: tuple[int, int]) -> list[str]:
+        """
+        hitTest returns the trigger callbacks of all clickables whose bounds contain the position.
+
+        Args:
+            position (tuple[int, int]): the position to test
+
+        Returns (list[str]): the ids of the mouse-checked trigger callbacks hit
+        """
+        size: int = HitGrid.__cellSize
+        cell: Cell = (int(position[0]) // size, int(position[1]) // size)
+        return [clickable.getActiveTriggerCallback() for clickable in HitGrid.__cells.get(cell, ())
+                if HitGrid.__bounds[clickable][0].collidepoint(position)]
+
+    @staticmethod
+    def hitTestMouse() -> list[str]:
+        """
+        hitTestMouse returns the trigger callbacks of all clickables under the cursor.
+
+        Returns (list[str]): the ids of the mouse-checked trigger callbacks hit
+        """
+        return HitGrid.hitTest(InputManager.getMousePosition())
+
+
+EventManager.setHitTester(HitGrid.hitTestMouse)
@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any, Callable, override
+from typing import Any, Callable, Optional, override
 
 from ..event        import EventManager
 from ..inputmanager import InputManager, InputEvent
@@ -31,13 +31,17 @@ class Holdable(Clickable, ABC):
         _activeReleaseCallback (str): ID for release event handler
         _onHoldTriggerCallback (str): ID for hold state handler
         _onhold (str): Event ID for hold callbacks
+        _onreleased (str): Event ID for release callbacks
         _isPressed (bool): Current press state
+        _releaseEvents (list[str]): Events subscribed to release the button
     """
 
     _activeReleaseCallback: str
     _onHoldTriggerCallback: str
     _onhold: str
+    _onreleased: str
     _isPressed: bool
+    _releaseEvents: list[str]
     
     def __init__(self, buttonActive: bool=True) -> None:
         """Initialize a new holdable element.
@@ -64,7 +68,9 @@ class Holdable(Clickable, ABC):
         self._activeReleaseCallback = EventManager.createCallback(self._onRelease)
         self._onHoldTriggerCallback = EventManager.createCallback(self._onHoldTrigger)
         self._onhold = EventManager.createEvent()
+        self._onreleased = EventManager.createEvent()
         self._isPressed = False
+        self._releaseEvents = []
 
     # -------------------- getter --------------------
 
@@ -85,7 +91,9 @@ class Holdable(Clickable, ABC):
         Side Effects:
             - Unsubscribes from update events
             - Sets pressed state to False
+            - Triggers release callbacks if the button was pressed
         """
+        wasPressed: bool = self._isPressed
         try:
             # Clean up hold trigger subscription
             updateEvent = InputManager.getEvent(InputEvent.UPDATE)
@@ -95,6 +103,8 @@ class Holdable(Clickable, ABC):
         finally:
             # Ensure press state is cleared even if unsubscribe fails
             self._isPressed = False
+        if wasPressed:
+            EventManager.triggerEvent(self._onreleased)
 
     def _onHoldTrigger(self) -> None:
         """Handle continuous hold state updates.
@@ -171,7 +181,11 @@ class Holdable(Clickable, ABC):
             raise TypeError(f'event must be a string, got {type(event)}')
         if not event:
             raise ValueError('event identifier cannot be empty')
-        return EventManager.subscribeToEvent(event, self._activeReleaseCallback)
+        if EventManager.subscribeToEvent(event, self._activeReleaseCallback):
+            if event not in self._releaseEvents:
+                self._releaseEvents.append(event)
+            return True
+        return False
     
     def removeReleaseEvent(self, event: str) -> bool:
         """Remove a release event subscription.
@@ -190,8 +204,34 @@ class Holdable(Clickable, ABC):
             raise TypeError(f'event must be a string, got {type(event)}')
         if not event:
             raise ValueError('event identifier cannot be empty')
+        if event in self._releaseEvents:
+            self._releaseEvents.remove(event)
         return EventManager.unsubscribeToEvent(event, self._activeReleaseCallback)
 
+    @override
+    def copyTriggerEvents(self, other: Clickable) -> None:
+        """Subscribe to all trigger and release events of another clickable (used when cloning elements).
+
+        Args:
+            other (Clickable): Clickable to copy the trigger (and release) events from
+        """
+        super().copyTriggerEvents(other)
+        if isinstance(other, Holdable):
+            for event in other._releaseEvents:
+                if event not in self._releaseEvents:
+                    self.addReleaseEvent(event)
+
+    @override
+    def addTriggerEvents(self, triggers: Optional[list[tuple[bool, InputEvent]]]) -> None:
+        """Subscribe to parsed trigger events and their release events (the following input events).
+
+        Args:
+            triggers (Optional[list[tuple[bool, InputEvent]]]): the trigger events, None triggers on left clicks
+        """
+        super().addTriggerEvents(triggers)
+        for _, event in [(False, InputEvent.LEFTDOWN)] if triggers is None else triggers:
+            self.addReleaseEvent(InputManager.getEvent(InputEvent(event.value+1)))
+
     def subscribeToHold(self, callback: str) -> bool:
         """Subscribe a callback to handle hold events.
 
@@ -270,3 +310,27 @@ class Holdable(Clickable, ABC):
 
         except Exception as e:
             raise RuntimeError(f'Failed to create hold callback: {str(e)}') from e
+
+    def quickSubscribeToRelease(self, f: Callable, *args: Any) -> tuple[str, bool]:
+        """Create and subscribe a new callback for release events.
+
+        The callback will be triggered once whenever the pressed button is released.
+
+        Args:
+            f (Callable): Function to call on release
+            *args (Any): Arguments to pass to the function
+
+        Returns:
+            tuple[str, bool]: (callback_id, subscription_success)
+
+        Raises:
+            TypeError: If f is not callable
+        """
+        if not callable(f):
+            raise TypeError(f'f must be callable, got {type(f)}')
+
+        newCallback: str = EventManager.createCallback(f, *args)
+        if not EventManager.subscribeToEvent(self._onreleased, newCallback):
+            EventManager.removeCallback(newCallback)
+            return ('', False)
+        return (newCallback, True)
@@ -1,3 +1,8 @@
+from bisect  import insort
+from heapq   import merge
+from typing  import Collection, Optional
+
+from .callback import Callback
 
 class Event:
     """
@@ -8,50 +13,90 @@ class Event:
     executed according to their priority levels.
 
     Features:
-    - Maintains ordered list of callback IDs
+    - Keeps the subscriptions sorted by priority (higher first, then subscription order)
+    - Stores direct references to the subscribed callbacks
     - Supports subscription/unsubscription during runtime
     - Returns immutable copy of subscriptions when triggered
+      (callbacks unsubscribed while triggering are skipped by the EventManager, see isSubscribed)
     - Thread-safe callback list management
 
+    Subscriptions are inserted at their sorted position, so triggering does not sort.
+    Priority changes of subscribed callbacks only mark the order as outdated; it is
+    restored once on the next trigger.
+
+    Hit-tested subscriptions are only triggered if they are part of the hits passed
+    to trigger (e.g. the clickables under the cursor). They are merged into the
+    priority order of the regular subscriptions.
+
     Example:
         event = Event()
-        event.subscribe(callback_id)
+        event.subscribe(callback_id, callback)
         triggered_callbacks = event.trigger()
     """
 
-    __l_subscriptions: list[str]
+    __l_subscriptions: list[tuple[str, Callback, int]]  # (id, callback, subscription number) in trigger order
+    __l_callbacks: tuple[Callback, ...] | None          # cached trigger order
+    __s_ids: set[str]                                   # ids of all subscribed callbacks
+    __s_callbacks: set[Callback]                        # all subscribed callbacks
+    __unsubscriptions: int                              # incremented on every unsubscription
+    __d_hitTested: dict[str, tuple[str, Callback, int]] # hit-tested subscriptions by id
+    __sorted: bool                                      # False if a priority changed since the last sort
+    __subscriptionCount: int
 
     def __init__(self) -> None:
         """
         __init__ intializes the instance of Event
-
-        Args:
-            name (str): the name of the event
         """
         self.__l_subscriptions = []
-
-    def subscribe(self, id: str) -> None:
+        self.__l_callbacks = ()
+        self.__s_ids = set()
+        self.__s_callbacks = set()
+        self.__unsubscriptions = 0
+        self.__d_hitTested = {}
+        self.__sorted = True
+        self.__subscriptionCount = 0
+
+    @staticmethod
+    def __sortKey(subscription: tuple[str, Callback, int]) -> tuple[int, int]:
+        return (-subscription[1].getPriority(), subscription[2])
+
+    def subscribe(self, id: str, callback: Callback, hitTested: bool=False) -> None:
         """
         Subscribe a callback to this event.
 
-        Adds a callback ID to the subscription list for this event. The callback
+        Inserts the callback at its position in the priority order. The callback
         will be executed when the event is triggered, in order of priority.
 
         Args:
-            id (str): The unique identifier of the callback to subscribe
+            id        (str)      : The unique identifier of the callback to subscribe
+            callback  (Callback) : The callback stored under the identifier
+            hitTested (bool)     : If the callback should only be triggered when it is hit
 
         Raises:
-            TypeError: If id is not a string
+            TypeError: If id is not a string or callback is not a Callback
             ValueError: If id is empty or already subscribed
         """
         if not isinstance(id, str):
             raise TypeError(f'Callback id must be a string, got {type(id)}')
         if not id:
             raise ValueError('Callback id cannot be empty')
-        if id in self.__l_subscriptions:
+        if not isinstance(callback, Callback):
+            raise TypeError(f'callback must be a Callback, got {type(callback)}')
+        if id in self.__s_ids:
             raise ValueError(f'Callback {id} is already subscribed')
 
-        self.__l_subscriptions.append(id)
+        self.__subscriptionCount += 1
+        subscription: tuple[str, Callback, int] = (id, callback, self.__subscriptionCount)
+        self.__s_ids.add(id)
+        self.__s_callbacks.add(callback)
+        if hitTested:
+            self.__d_hitTested[id] = subscription
+            return
+        if self.__sorted:
+            insort(self.__l_subscriptions, subscription, key=Event.__sortKey)
+        else:
+            self.__l_subscriptions.append(subscription)
+        self.__l_callbacks = None
 
     def unsubscribe(self, id: str) -> bool:
         """
@@ -74,23 +119,91 @@ class Event:
             raise TypeError(f'Callback id must be a string, got {type(id)}')
         if not id:
             raise ValueError('Callback id cannot be empty')
+        if id not in self.__s_ids:
+            return False
 
-        try:
-            self.__l_subscriptions.remove(id)
+        self.__s_ids.remove(id)
+        self.__unsubscriptions += 1
+        hitTested: Optional[tuple[str, Callback, int]] = self.__d_hitTested.pop(id, None)
+        if hitTested is not None:
+            self.__s_callbacks.discard(hitTested[1])
             return True
-        except ValueError:
-            return False
+        for idx, (subscribed, callback, _) in enumerate(self.__l_subscriptions):
+            if subscribed == id:
+                self.__s_callbacks.discard(callback)
+                del self.__l_subscriptions[idx]
+                self.__l_callbacks = None
+                return True
+        return False
+
+    def isSubscribed(self, callback: Callback) -> bool:
+        """
+        isSubscribed returns if the callback is currently subscribed to this event.
 
+        Args:
+            callback (Callback): the callback to check
 
-    def trigger(self) -> list[str]:
+        Returns (bool): if the callback is subscribed
         """
-        Get a copy of all callback IDs subscribed to this event.
+        return callback in self.__s_callbacks
 
-        Returns a defensive copy of the subscription list to prevent modification
-        during iteration. The returned list can be safely used to execute
-        callbacks in the correct order.
+    def getUnsubscriptionCount(self) -> int:
+        """
+        getUnsubscriptionCount returns a counter incremented on every unsubscription.
+        (used to detect unsubscriptions while the event is triggered)
+
+        Returns (int): the amount of unsubscriptions
+        """
+        return self.__unsubscriptions
+
+    def invalidateOrder(self) -> None:
+        """
+        Mark the priority order as outdated.
+
+        Has to be called when the priority of a subscribed callback changes.
+        The order is restored on the next trigger.
+        """
+        self.__sorted = False
+        self.__l_callbacks = None
+
+    def hasHitTested(self) -> bool:
+        """
+        hasHitTested returns if any hit-tested callback is subscribed to this event.
+
+        Returns (bool): if the event has hit-tested subscriptions
+        """
+        return bool(self.__d_hitTested)
+
+    def trigger(self, hits: Optional[Collection[str]]=None) -> tuple[Callback, ...]:
+        """
+        Get all callbacks subscribed to this event in trigger order.
+
+        Returns an immutable snapshot of the subscriptions, so subscribing or
+        unsubscribing during iteration does not affect it. The snapshot is cached
+        until the subscriptions change.
+
+        Args:
+            hits (Optional[Collection[str]]): ids of the hit-tested callbacks that were hit
+                                              (None triggers all hit-tested callbacks)
 
         Returns:
-            list[str]: Immutable copy of subscribed callback IDs in registration order
+            tuple[Callback, ...]: Immutable snapshot of subscribed callbacks ordered by priority
+                                  (higher first, equal priorities in subscription order)
         """
-        return self.__l_subscriptions.copy()
+        if self.__l_callbacks is None:
+            if not self.__sorted:
+                self.__l_subscriptions.sort(key=Event.__sortKey)
+                self.__sorted = True
+            self.__l_callbacks = tuple(callback for _, callback, _ in self.__l_subscriptions)
+        if not self.__d_hitTested:
+            return self.__l_callbacks
+
+        hit: list[tuple[str, Callback, int]]
+        if hits is None:
+            hit = list(self.__d_hitTested.values())
+        else:
+            hit = [self.__d_hitTested[id] for id in hits if id in self.__d_hitTested]
+        if not hit:
+            return self.__l_callbacks
+        hit.sort(key=Event.__sortKey)
+        return tuple(callback for _, callback, _ in merge(self.__l_subscriptions, hit, key=Event.__sortKey))
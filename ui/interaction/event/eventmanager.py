@@ -1,15 +1,11 @@
-from hashlib import sha256
-from secrets import token_bytes
-from typing  import Any, Callable
+from itertools import count
+from sys       import intern
+from typing    import Any, Callable, Collection, Iterator, Optional
 
 from .event     import Event
 from .callback  import Callback
 
 
-def getHashstring() -> str:
-    return sha256(token_bytes(16)).hexdigest()
-
-
 class EventManager:
     """
     Static manager class for the UI event system.
@@ -45,6 +41,28 @@ class EventManager:
     
     __d_callbacks: dict[str, Callback] = {}   
     __d_events: dict[str, Event] = {}
+    __d_subscriptions: dict[str, set[str]] = {} # callback id -> ids of the events it is subscribed to
+    __hitTester: Optional[Callable[[], Collection[str]]] = None # returns the ids of the currently hit callbacks
+
+    __callbackIds: Iterator[int] = count(1)
+    __eventIds: Iterator[int] = count(1)
+
+    # -------------------- id-allocation --------------------
+
+    @staticmethod
+    def __allocateId(prefix: str, ids: Iterator[int]) -> str:
+        """
+        __allocateId allocates a new unique id. Ids are short interned strings
+        built from a monotonically increasing counter, so they never collide
+        and compare/hash cheaply.
+
+        Args:
+            prefix  (str)           : prefix separating the id namespaces
+            ids     (Iterator[int]) : the counter of the namespace
+
+        Returns (str): the new unique id
+        """
+        return intern(f'{prefix}{next(ids):x}')
 
     # -------------------- creation --------------------
 
@@ -61,13 +79,11 @@ class EventManager:
 
         Returns (str): the unique id of the callback
         """
-        random_hashstring: str = getHashstring()
-        while EventManager.__d_callbacks.get(random_hashstring):
-            random_hashstring = getHashstring()
+        id: str = EventManager.__allocateId('c', EventManager.__callbackIds)
 
         event: Callback = Callback(f, *args, priority=priority) # create Callback
-        EventManager.__d_callbacks[random_hashstring] = event # store Callback
-        return random_hashstring
+        EventManager.__d_callbacks[id] = event # store Callback
+        return id
 
     @staticmethod
     def createEvent() -> str:
@@ -78,13 +94,11 @@ class EventManager:
 
         Returns (str): the name of the new Event
         """
-        random_hashstring: str = getHashstring()
-        while EventManager.__d_events.get(random_hashstring):
-            random_hashstring = getHashstring()
+        id: str = EventManager.__allocateId('e', EventManager.__eventIds)
 
         event: Event = Event() # create Event
-        EventManager.__d_events[random_hashstring] = event # store Event
-        return random_hashstring
+        EventManager.__d_events[id] = event # store Event
+        return id
 
     # -------------------- getter --------------------
 
@@ -129,56 +143,69 @@ class EventManager:
         """
         if EventManager.__d_callbacks.get(id):
             EventManager.__d_callbacks[id].setPriority(priority)
+            for event in EventManager.__d_subscriptions.get(id, ()):
+                EventManager.__d_events[event].invalidateOrder()
             return True
         return False
 
-    # -------------------- managing --------------------
-
     @staticmethod
-    def __triggerCallback(name: str) -> bool:
-        if EventManager.__d_callbacks.get(name):
-            b = EventManager.__d_callbacks[name].call()
-            if b: # if callback returns bool -> use as terminator
-                return True
-        return False
+    def setHitTester(hitTester: Optional[Callable[[], Collection[str]]]) -> None:
+        """
+        setHitTester sets the function used to determine which hit-tested callbacks
+        are hit when an event is triggered (e.g. the clickables under the cursor).
+
+        Args:
+            hitTester (Optional[Callable[[], Collection[str]]]): function returning the ids of the hit callbacks
+                                                                 (None triggers all hit-tested callbacks)
+        """
+        EventManager.__hitTester = hitTester
+
+    # -------------------- managing --------------------
 
     @staticmethod
     def triggerEvent(name: str) -> bool:
         """
         triggerEvent triggers a Event with a given name if its currently stored
         in EventManager.
+        Callbacks unsubscribed by a previous callback of the same trigger are skipped.
 
         Args:
             name (str): the event-name to trigger
 
         Returns (bool): if the event got triggered successfully
         """
-        if EventManager.contains(name):
-            callbacks: list[str] = EventManager.__d_events[name].trigger()
-            if len(callbacks) > 1:
-                callbacks.sort(key=lambda x: EventManager.getPriority(x), reverse=True)
-            for clb in callbacks:
-                if EventManager.__triggerCallback(clb):
-                    break
-            return True
-        return False
+        event: Event | None = EventManager.__d_events.get(name)
+        if event is None:
+            return False
+        hits: Optional[Collection[str]] = None
+        if EventManager.__hitTester is not None and event.hasHitTested():
+            hits = EventManager.__hitTester()
+        unsubscriptions: int = event.getUnsubscriptionCount()
+        for clb in event.trigger(hits): # already ordered by priority
+            if event.getUnsubscriptionCount() != unsubscriptions and not event.isSubscribed(clb):
+                continue # unsubscribed by a previous callback of this trigger
+            if clb.call(): # if callback returns bool -> use as terminator
+                break
+        return True
 
     # -------------------- subscriptions --------------------
 
     @staticmethod
-    def subscribeToEvent(event: str, callback: str) -> bool:
+    def subscribeToEvent(event: str, callback: str, hitTested: bool=False) -> bool:
         """
-        subscribeToEvent subscribes a given callback to a given Event is the
-        Event is currently stored in EventManager.
+        subscribeToEvent subscribes a given callback to a given Event if both the
+        Event and the callback are currently stored in EventManager.
 
         Args:
-            event    (str): the event-name to subscribe the callback to
-            callback (str): the callback to subscribe to the event
+            event     (str) : the event-name to subscribe the callback to
+            callback  (str) : the callback to subscribe to the event
+            hitTested (bool): if the callback should only be triggered when the hit tester reports it
 
         Returns (bool): if the subscription got executed successfully
         """
-        if EventManager.contains(event):
-            EventManager.__d_events[event].subscribe(callback)
+        if EventManager.contains(event) and callback in EventManager.__d_callbacks:
+            EventManager.__d_events[event].subscribe(callback, EventManager.__d_callbacks[callback], hitTested)
+            EventManager.__d_subscriptions.setdefault(callback, set()).add(event)
             return True
         return False
     
@@ -193,8 +220,9 @@ class EventManager:
 
         Returns (bool): if the unsubscription was successful
         """
-        if EventManager.contains(event):
-            return EventManager.__d_events[event].unsubscribe(callback)
+        if EventManager.contains(event) and EventManager.__d_events[event].unsubscribe(callback):
+            EventManager.__d_subscriptions[callback].discard(event)
+            return True
         return False
 
     @staticmethod
@@ -264,8 +292,10 @@ class EventManager:
         if not callback_id:
             raise ValueError('callback_id cannot be empty')
 
-        # Remove callback if it exists
+        # Remove callback if it exists (and all of its subscriptions)
         if callback_id in EventManager.__d_callbacks:
+            for event in EventManager.__d_subscriptions.pop(callback_id, ()):
+                EventManager.__d_events[event].unsubscribe(callback_id)
             del EventManager.__d_callbacks[callback_id]
             return True
             
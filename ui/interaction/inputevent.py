@@ -7,6 +7,7 @@ class InputEvent(Enum):
     1. Digital Events (discrete on/off)
         - System events (QUIT, WINDOW_RESIZE)
         - Mouse buttons (LEFT/RIGHT UP/DOWN)
+        - Mouse wheel (WHEEL UP/DOWN)
         - Keyboard keys (A-Z UP/DOWN)
         - Arrow keys
     2. Analog Events (continuous state)
@@ -32,6 +33,9 @@ class InputEvent(Enum):
     RIGHTDOWN       = 106
     RIGHTUP         = 107
 
+    WHEELUP         = 108
+    WHEELDOWN       = 109
+
     A_DOWN      = 200
     A_UP        = 201
     B_DOWN      = 202
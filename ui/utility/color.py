@@ -28,6 +28,10 @@ class tColor:
     """
     colornames: dict[str, str]={}
 
+    # color strings are parsed once (the same few names/hex values are used by thousands of elements)
+    __parsed: dict[str, tuple[int, int, int, int]] = {}
+    __maxParsed: int = 4096
+
     @staticmethod
     def convert_strhex_to_rgb(x: str) -> tuple[int, int, int, int]:
         """Convert a hex color string to an RGBA tuple.
@@ -154,6 +158,10 @@ class tColor:
             ValueError: If RGB values are out of range or color name is invalid
         """
         if isinstance(value, str):
+            parsed: tuple[int, int, int, int] | None = tColor.__parsed.get(value)
+            if parsed is not None:
+                self.value = parsed
+                return
             # Named color lookup
             if tColor.is_valid_colorname(value):
                 self.value = tColor.convert_strhex_to_rgb(tColor.colornames[value])
@@ -183,6 +191,8 @@ class tColor:
                     raise ValueError(
                         f'Invalid color string: {value}\n'
                         f'Available colors: {sorted(tColor.colornames.keys())}')
+            if len(tColor.__parsed) < tColor.__maxParsed:
+                tColor.__parsed[value] = self.value
         elif isinstance(value, tuple):
             if len(value) == 3:
                 if not all(isinstance(v, int) for v in value):
@@ -270,6 +280,24 @@ class tColor:
         r, g, b, a = self.value
         return (r / 255.0, g / 255.0, b / 255.0, a / 255.0)
 
+    @staticmethod
+    def to_rgba(color: Any) -> tuple[int, int, int, int]:
+        """Resolve any supported color specification to its RGBA tuple.
+
+        Args:
+            color: tColor instance, RGB/RGBA tuple, named or hex color string
+
+        Returns:
+            tuple[int, int, int, int]: (r,g,b,a) values
+
+        Raises:
+            TypeError: If color has invalid type
+            ValueError: If color is invalid
+        """
+        if isinstance(color, tColor):
+            return color.value
+        return tColor(color).value
+
     def with_alpha(self, alpha: int) -> tuple[int, int, int, int]:
         """Create RGBA tuple with this color and given alpha.
 
@@ -359,32 +359,72 @@ class Parsable(ABC):
         if not isinstance(adjustments, list):
             raise ValueError('Adjustments must be a list')
 
-        result = l.copy()  # Work on a copy to preserve original
-        currentIdx = 0
+        return Parsable.applyAdjustments(l, Parsable.splitAdjustments([adj for adj in adjustments if isinstance(adj, str)]))
 
-        for adj in adjustments:
-            if not isinstance(adj, str):
-                continue
+    @staticmethod
+    def splitAdjustments(adjustments: list[str]) -> list[tuple[Optional[int], str]]:
+        """Split adjustment strings (see adjustList) into index jumps and values.
+
+        Args:
+            adjustments: List of adjustment strings
+
+        Returns:
+            List of (index to jump to or None, value) pairs
 
-            # Handle indexed assignments (n=value)
+        Examples:
+            >>> Parsable.splitAdjustments(['2=x', 'y'])
+            [(1, 'x'), (None, 'y')]
+        """
+        split: list[tuple[Optional[int], str]] = []
+        for adj in adjustments:
             if '=' in adj:
-                try:
-                    pos, value = adj.split('=', 1)
-                    jumpTo = int(Parsable.extractNum(pos)) - 1
-                    if 0 <= jumpTo < len(result):
-                        currentIdx = jumpTo
-                    adj = value
-                except (ValueError, IndexError):
-                    continue
+                pos, value = adj.split('=', 1)
+                split.append((int(Parsable.extractNum(pos)) - 1, value))
+            else:
+                split.append((None, adj))
+        return split
+
+    @staticmethod
+    def parseAdjustments(s: str) -> list[tuple[Optional[int], int | float]]:
+        """Parse a list of numeric adjustments (e.g. sizings like "2=0.5, 1").
+
+        Args:
+            s: String to parse into adjustments
+
+        Returns:
+            List of (index to jump to or None, number) pairs, applied with applyAdjustments
+
+        Examples:
+            >>> Parsable.parseAdjustments('2=0.5, 1')
+            [(1, 0.5), (None, 1)]
+        """
+        return [(jumpTo, Parsable.parseNum(value)) for jumpTo, value in Parsable.splitAdjustments(Parsable.parseList(s))]
+
+    @staticmethod
+    def applyAdjustments(l: list[Any], adjustments: list[tuple[Optional[int], Any]]) -> list[Any]:
+        """Apply split adjustments (see splitAdjustments) to a list.
+
+        Args:
+            l: Base list to modify
+            adjustments: List of (index to jump to or None, value) pairs
+
+        Returns:
+            Modified copy of the list
+        """
+        result = l.copy()  # Work on a copy to preserve original
+        currentIdx = 0
+
+        for jumpTo, value in adjustments:
+            if jumpTo is not None and 0 <= jumpTo < len(result):
+                currentIdx = jumpTo
 
             # Apply adjustment if index is valid
             if 0 <= currentIdx < len(result):
-                result[currentIdx] = adj
+                result[currentIdx] = value
             currentIdx += 1
 
         return result
 
-
     @staticmethod
     def parsePartition(s: str) -> tuple[int, int, list[str]]:
         """Parse a partition specification string.
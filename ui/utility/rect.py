@@ -127,6 +127,45 @@ class Rect(iRect):
                 self.top < other.bottom and
                 self.bottom > other.top)
 
+    def union(self, other: 'Rect') -> 'Rect':
+        """Create the smallest rectangle containing this rectangle and another.
+
+        Args:
+            other: Rectangle to include
+
+        Returns:
+            New rectangle containing both rectangles
+        """
+        left, top = min(self.left, other.left), min(self.top, other.top)
+        return Rect((left, top), (max(self.right, other.right) - left, max(self.bottom, other.bottom) - top))
+
+    def clip(self, bounds: 'Rect') -> 'Rect':
+        """Create the intersection of this rectangle with bounds.
+
+        Args:
+            bounds: Rectangle to clip to
+
+        Returns:
+            New rectangle covering the overlapping area (size (0,0) if there is none)
+        """
+        left, top = max(self.left, bounds.left), max(self.top, bounds.top)
+        right, bottom = min(self.right, bounds.right), min(self.bottom, bounds.bottom)
+        if right <= left or bottom <= top:
+            return Rect((left, top))
+        return Rect((left, top), (right - left, bottom - top))
+
+    def inflate(self, x: int, y: int) -> 'Rect':
+        """Create new rectangle grown by the given amount on every side.
+
+        Args:
+            x: Amount to grow on the left and right side
+            y: Amount to grow on the top and bottom side
+
+        Returns:
+            New rectangle with the same center
+        """
+        return Rect((self.left - x, self.top - y), (self.width + 2 * x, self.height + 2 * y))
+
     def clamp(self, bounds: 'Rect') -> 'Rect':
         """Create new rectangle clamped within bounds.
 